@@ -6,9 +6,13 @@ This package contains the core classes for automata representation:
 - Alphabet: Represents the alphabet of an automaton
 - Transition: Represents a transition between states
 - Automaton: Represents a complete automaton (DFA or NFA)
+- CompiledAutomaton: Table-driven snapshot of an automaton for fast word tests
+- hopcroft_karp_equivalent: Language equivalence check of two automata
 """
 
 from .state import State
 from .alphabet import Alphabet
 from .transition import Transition
-from .automaton import Automaton 
\ No newline at end of file
+from .automaton import Automaton
+from .simulation import CompiledAutomaton
+from .equivalence import hopcroft_karp_equivalent 
\ No newline at end of file
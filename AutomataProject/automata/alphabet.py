@@ -15,6 +15,10 @@ class Alphabet:
             symbols: Set of symbols. Defaults to empty set.
         """
         self.symbols = set(symbols) if symbols else set()
+        # Incremented on every change made through add_symbol/remove_symbol
+        self.version = 0
+        self._sorted_symbols: List[str] = []
+        self._sorted_version = -1
         
     def add_symbol(self, symbol: str) -> None:
         """
@@ -23,7 +27,9 @@ class Alphabet:
         Args:
             symbol: Symbol to add
         """
-        self.symbols.add(symbol)
+        if symbol not in self.symbols:
+            self.symbols.add(symbol)
+            self.version += 1
         
     def remove_symbol(self, symbol: str) -> None:
         """
@@ -34,6 +40,7 @@ class Alphabet:
         """
         if symbol in self.symbols:
             self.symbols.remove(symbol)
+            self.version += 1
             
     def contains(self, symbol: str) -> bool:
         """
@@ -47,6 +54,21 @@ class Alphabet:
         """
         return symbol in self.symbols
     
+    def sorted_symbols(self) -> List[str]:
+        """
+        Get the symbols in sorted order.
+        
+        The sorted list is cached until the alphabet changes, so callers must
+        not modify it.
+        
+        Returns:
+            Sorted list of symbols
+        """
+        if self._sorted_version != self.version:
+            self._sorted_symbols = sorted(self.symbols)
+            self._sorted_version = self.version
+        return self._sorted_symbols
+    
     def __str__(self) -> str:
         return f"Alphabet({', '.join(sorted(str(s) for s in self.symbols))})"
     
@@ -8,7 +8,8 @@ from .state import State
 from .alphabet import Alphabet
 from .transition import Transition
 
-
+# Cached results of list_saved_automata: absolute directory -> (directory mtime, names)
+_saved_automata_cache: Dict[str, Tuple[int, List[str]]] = {}
 
 class Automaton:
     """
@@ -31,6 +32,14 @@ class Automaton:
         self.alphabet = alphabet if alphabet else Alphabet()
         self.states = set(states) if states else set()
         self.transitions = set(transitions) if transitions else set()
+        # Incremented on every change made through the add/remove methods
+        self.version = 0
+        # (state, symbol) -> reachable states, built for version _delta_version
+        self._delta: Dict[Tuple[State, str], FrozenSet[State]] = {}
+        self._delta_version = -1
+        # Result of is_deterministic, for the (version, alphabet version) it was computed at
+        self._deterministic = False
+        self._deterministic_key = None
     
     def add_state(self, state: State) -> None:
         """
@@ -39,7 +48,9 @@ class Automaton:
         Args:
             state: State to add
         """
-        self.states.add(state)
+        if state not in self.states:
+            self.states.add(state)
+            self.version += 1
     
     def remove_state(self, state: State) -> None:
         """
@@ -52,6 +63,7 @@ class Automaton:
         # Remove all transitions involving this state
         self.transitions = {t for t in self.transitions 
                            if t.from_state != state and t.to_state != state}
+        self.version += 1
     
     def add_transition(self, from_state: State, to_state: State, symbol: str) -> bool:
         """
@@ -73,7 +85,10 @@ class Automaton:
         
         # For epsilon transitions or if symbol is in alphabet
         if symbol == Transition.EPSILON or symbol in self.alphabet.symbols:
-            self.transitions.add(Transition(from_state, to_state, symbol))
+            transition = Transition(from_state, to_state, symbol)
+            if transition not in self.transitions:
+                self.transitions.add(transition)
+                self.version += 1
             return True
         return False
     
@@ -84,7 +99,9 @@ class Automaton:
         Args:
             transition: Transition to remove
         """
-        self.transitions.discard(transition)
+        if transition in self.transitions:
+            self.transitions.discard(transition)
+            self.version += 1
     
     def get_initial_states(self) -> Set[State]:
         """
@@ -131,8 +148,25 @@ class Automaton:
         Returns:
             Set of states that can be reached
         """
-        transitions = self.get_transitions_from(state, symbol)
-        return {t.to_state for t in transitions}
+        return set(self._transition_index().get((state, symbol), ()))
+    
+    def _transition_index(self) -> Dict[Tuple[State, str], FrozenSet[State]]:
+        """
+        Get the states reachable by each (state, symbol) pair.
+        
+        The index is rebuilt only when the automaton has changed since the last
+        call, so callers must not modify it.
+        
+        Returns:
+            Dictionary mapping (source state, symbol) to the set of destination states
+        """
+        if self._delta_version != self.version:
+            delta: Dict[Tuple[State, str], Set[State]] = {}
+            for transition in self.transitions:
+                delta.setdefault((transition.from_state, transition.symbol), set()).add(transition.to_state)
+            self._delta = {key: frozenset(states) for key, states in delta.items()}
+            self._delta_version = self.version
+        return self._delta
     
     def get_state_by_name(self, name: str) -> Optional[State]:
         """
@@ -153,6 +187,21 @@ class Automaton:
         """
         Check if the automaton is deterministic.
         
+        The answer is cached until the automaton or its alphabet changes.
+        
+        Returns:
+            True if deterministic, False otherwise
+        """
+        key = (self.version, self.alphabet.version)
+        if self._deterministic_key != key:
+            self._deterministic = self._compute_deterministic()
+            self._deterministic_key = key
+        return self._deterministic
+    
+    def _compute_deterministic(self) -> bool:
+        """
+        Check if the automaton is deterministic, without the cache.
+        
         Returns:
             True if deterministic, False otherwise
         """
@@ -165,10 +214,10 @@ class Automaton:
             return False
         
         # For each state and symbol, there must be at most one transition
-        for state in self.states:
-            for symbol in self.alphabet.symbols:
-                if len(self.get_next_states(state, symbol)) > 1:
-                    return False
+        symbols = self.alphabet.symbols
+        for (state, symbol), next_states in self._transition_index().items():
+            if len(next_states) > 1 and symbol in symbols and state in self.states:
+                return False
         
         return True
     
@@ -714,88 +763,19 @@ class Automaton:
         """
         Check if this automaton is equivalent to another (they accept the same language).
         
+        Uses the Hopcroft-Karp algorithm, which needs neither determinization
+        nor minimization.
+        
         Args:
             other: The other automaton
             
         Returns:
             True if the automata are equivalent, False otherwise
         """
-        # Convert both to minimal DFAs
-        self_min = self.to_deterministic().minimize()
-        other_min = other.to_deterministic().minimize()
-        
-        # If both DFAs have different number of states after minimization, they are not equivalent
-        if len(self_min.states) != len(other_min.states):
-            return False
-            
-        # If both minimal DFAs have different number of transitions, they are not equivalent
-        if len(self_min.transitions) != len(other_min.transitions):
-            return False
-            
-        # If they have different alphabets, they are not equivalent
-        if self_min.alphabet.symbols != other_min.alphabet.symbols:
-            return False
-            
-        # Check more precisely by computing symmetric difference
-        # Two automata are equivalent if their symmetric difference is empty
-        # L(A) = L(B) iff (L(A) ∩ L(B)^c) ∪ (L(A)^c ∩ L(B)) = ∅
-        
-        # Get complements
-        self_complement = self_min.get_complement()
-        other_complement = other_min.get_complement()
-        
-        # Check L(A) ∩ L(B)^c = ∅
-        intersection1 = self_min.intersection(other_complement)
-        
-        # Check if the intersection has an accepting path
-        if self._has_accepting_path(intersection1):
-            return False
-            
-        # Check L(A)^c ∩ L(B) = ∅
-        intersection2 = self_complement.intersection(other_min)
-        
-        # Check if the intersection has an accepting path
-        return not self._has_accepting_path(intersection2)
-    
-    def _has_accepting_path(self, automaton: 'Automaton') -> bool:
-        """
-        Check if the automaton has any accepting path.
+        # Imported here because the equivalence module depends on this one
+        from .equivalence import hopcroft_karp_equivalent
         
-        Args:
-            automaton: The automaton to check
-            
-        Returns:
-            True if there is an accepting path, False otherwise
-        """
-        # Get initial states
-        initial_states = automaton.get_initial_states()
-        if not initial_states:
-            return False
-        
-        # If any initial state is final, there is an accepting path
-        if any(state.is_final for state in initial_states):
-            return True
-        
-        # Use BFS to find an accepting path
-        visited = set()
-        queue = deque(initial_states)
-        
-        while queue:
-            state = queue.popleft()
-            if state in visited:
-                continue
-            
-            visited.add(state)
-            
-            # Check all transitions from this state
-            for transition in automaton.get_transitions_from(state):
-                if transition.to_state.is_final:
-                    return True
-                
-                if transition.to_state not in visited:
-                    queue.append(transition.to_state)
-        
-        return False
+        return hopcroft_karp_equivalent(self, other)
     
     def generate_words(self, max_length: int) -> List[str]:
         """
@@ -807,34 +787,10 @@ class Automaton:
         Returns:
             List of accepted words
         """
-        accepted_words = []
-        
-        # Use BFS to generate words
-        queue = deque([("", next(iter(self.get_initial_states())))] if self.is_deterministic() 
-                     else [("", state) for state in self.get_initial_states()])
+        # Imported here because the simulation module depends on this one
+        from .simulation import CompiledAutomaton
         
-        while queue:
-            word, state = queue.popleft()
-            
-            # If we're in a final state, add the word to the list
-            if state.is_final:
-                accepted_words.append(word)
-            
-            # If we've reached max length, don't add more symbols
-            if len(word) >= max_length:
-                continue
-            
-            # For each symbol in alphabet, explore the next states
-            for symbol in self.alphabet.symbols:
-                for next_state in self.get_next_states(state, symbol):
-                    queue.append((word + symbol, next_state))
-            
-            # For NFAs, also follow epsilon transitions
-            if not self.is_deterministic():
-                for next_state in self.get_next_states(state, Transition.EPSILON):
-                    queue.append((word, next_state))
-        
-        return accepted_words
+        return CompiledAutomaton(self).generate_words(max_length)
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -901,6 +857,7 @@ class Automaton:
         with open(file_path, 'w', encoding='utf-8') as f:
             json.dump(self.to_dict(), f, indent=4, ensure_ascii=False)
         
+        self.clear_saved_automata_cache()
         return file_path
     
     @classmethod
@@ -930,8 +887,29 @@ class Automaton:
         Returns:
             List of automaton names (without .json extension)
         """
-        if not os.path.exists(directory):
+        key = os.path.abspath(directory)
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            _saved_automata_cache.pop(key, None)
             return []
         
+        # The directory's mtime changes whenever a file is added, removed or renamed in it
+        cached = _saved_automata_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return list(cached[1])
+        
         automata_files = [f for f in os.listdir(directory) if f.endswith('.json')]
-        return [os.path.splitext(f)[0] for f in automata_files] 
\ No newline at end of file
+        names = [os.path.splitext(f)[0] for f in automata_files]
+        _saved_automata_cache[key] = (mtime, names)
+        return list(names)
+    
+    @classmethod
+    def clear_saved_automata_cache(cls) -> None:
+        """
+        Forget cached results of list_saved_automata.
+        
+        Call this after adding, removing or renaming files in a save directory,
+        in case the filesystem's mtime resolution hides the change.
+        """
+        _saved_automata_cache.clear() 
\ No newline at end of file
@@ -0,0 +1,105 @@
+from collections import deque
+from typing import Dict, Hashable
+
+from .automaton import Automaton
+from .simulation import CompiledAutomaton
+
+class _DisjointSets:
+    """Union-find over hashable items, with path compression and union by rank."""
+    
+    def __init__(self):
+        self._parent: Dict[Hashable, Hashable] = {}
+        self._rank: Dict[Hashable, int] = {}
+    
+    def find(self, item: Hashable) -> Hashable:
+        """
+        Get the representative of the set containing an item, adding it if new.
+        
+        Args:
+            item: The item to look up
+        
+        Returns:
+            The representative item
+        """
+        parent = self._parent
+        if item not in parent:
+            parent[item] = item
+            self._rank[item] = 0
+            return item
+        
+        root = item
+        while parent[root] != root:
+            root = parent[root]
+        while parent[item] != root:
+            parent[item], item = root, parent[item]
+        return root
+    
+    def union(self, first: Hashable, second: Hashable) -> bool:
+        """
+        Merge the sets containing two items.
+        
+        Args:
+            first: An item of the first set
+            second: An item of the second set
+        
+        Returns:
+            True if the sets were merged, False if they already were the same set
+        """
+        first, second = self.find(first), self.find(second)
+        if first == second:
+            return False
+        
+        if self._rank[first] < self._rank[second]:
+            first, second = second, first
+        self._parent[second] = first
+        if self._rank[first] == self._rank[second]:
+            self._rank[first] += 1
+        return True
+
+def hopcroft_karp_equivalent(first: Automaton, second: Automaton) -> bool:
+    """
+    Check if two automata accept the same language, with the Hopcroft-Karp algorithm.
+    
+    Pairs of states that must accept the same words are merged with union-find,
+    starting from the initial states, and only pairs not already merged are
+    explored further. Neither automaton is determinized or minimized up front:
+    the subset construction is walked on the fly, so NFAs and incomplete DFAs
+    are compared directly.
+    
+    Both automata are read over the symbols of both alphabets; a symbol one of
+    them does not know leads it to the empty set of states.
+    
+    Args:
+        first: The first automaton
+        second: The second automaton
+    
+    Returns:
+        True if the automata are equivalent, False otherwise
+    """
+    first_compiled = CompiledAutomaton(first)
+    second_compiled = CompiledAutomaton(second)
+    symbols = sorted(first.alphabet.symbols | second.alphabet.symbols)
+    
+    # Sets of states of the two automata are told apart by a leading 0 or 1
+    start = ((0, first_compiled.initial_mask), (1, second_compiled.initial_mask))
+    if first_compiled.is_accepting(start[0][1]) != second_compiled.is_accepting(start[1][1]):
+        return False
+    
+    sets = _DisjointSets()
+    sets.union(*start)
+    pending = deque([start])
+    
+    while pending:
+        (_, first_mask), (_, second_mask) = pending.popleft()
+        for symbol in symbols:
+            first_next = (0, first_compiled.next_mask(first_mask, symbol))
+            second_next = (1, second_compiled.next_mask(second_mask, symbol))
+            if sets.find(first_next) == sets.find(second_next):
+                continue
+            
+            if first_compiled.is_accepting(first_next[1]) != second_compiled.is_accepting(second_next[1]):
+                return False
+            sets.union(first_next, second_next)
+            pending.append((first_next, second_next))
+    
+    return True
@@ -0,0 +1,259 @@
+from typing import Dict, Iterable, List, Optional
+
+from .automaton import Automaton
+from .transition import Transition
+
+def _bits(mask: int) -> Iterable[int]:
+    """
+    Iterate over the indices of the set bits of a mask.
+    
+    Args:
+        mask: Non-negative bitmask
+    
+    Returns:
+        Iterator of bit indices, lowest first
+    """
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+class CompiledAutomaton:
+    """
+    Snapshot of an automaton packed into transition tables for fast word simulation.
+    
+    States are numbered and a set of states is an int bitmask, so one simulation
+    step ORs together precomputed masks instead of scanning the transitions.
+    Epsilon closures are folded into the tables, which makes the same code run
+    DFAs and NFAs.
+    
+    The snapshot does not follow later changes to the automaton; compile it again
+    after editing.
+    """
+    
+    def __init__(self, automaton: Automaton):
+        """
+        Build the transition tables of an automaton.
+        
+        Args:
+            automaton: The automaton to compile
+        """
+        # Normally every transition endpoint is in automaton.states; include any that are not
+        known = set(automaton.states)
+        for transition in automaton.transitions:
+            known.add(transition.from_state)
+            known.add(transition.to_state)
+        states = sorted(known, key=lambda s: s.name)
+        index = {state: i for i, state in enumerate(states)}
+        
+        # Direct successors of each state, per symbol
+        successors: Dict[str, List[int]] = {}
+        for transition in automaton.transitions:
+            masks = successors.setdefault(transition.symbol, [0] * len(states))
+            masks[index[transition.from_state]] |= 1 << index[transition.to_state]
+        
+        # Epsilon closure of each state
+        epsilon = successors.get(Transition.EPSILON, [0] * len(states))
+        closures = []
+        for i in range(len(states)):
+            closure = 1 << i
+            frontier = closure
+            while frontier:
+                reached = 0
+                for j in _bits(frontier):
+                    reached |= epsilon[j]
+                frontier = reached & ~closure
+                closure |= frontier
+            closures.append(closure)
+        
+        # For each alphabet symbol: the closed set of states reached from each state
+        self._tables: Dict[str, List[int]] = {}
+        for symbol in automaton.alphabet.symbols:
+            masks = successors.get(symbol, [0] * len(states))
+            table = []
+            for mask in masks:
+                closed = 0
+                for j in _bits(mask):
+                    closed |= closures[j]
+                table.append(closed)
+            self._tables[symbol] = table
+        
+        self._initial_mask = 0
+        self._final_mask = 0
+        for i, state in enumerate(states):
+            if state.is_initial:
+                self._initial_mask |= closures[i]
+            if state.is_final:
+                self._final_mask |= 1 << i
+    
+    def accepts(self, word: str) -> bool:
+        """
+        Check if the automaton accepts a word.
+        
+        Gives the same result as Automaton.accepts_word.
+        
+        Args:
+            word: The word to check
+        
+        Returns:
+            True if the word is accepted, False otherwise
+        """
+        tables = self._tables
+        current = self._initial_mask
+        if not current:
+            return False
+        
+        for symbol in word:
+            table = tables.get(symbol)
+            if table is None:
+                return False
+            
+            if current & (current - 1) == 0:
+                # A single active state, as always with a DFA
+                current = table[current.bit_length() - 1]
+            else:
+                reached = 0
+                for i in _bits(current):
+                    reached |= table[i]
+                current = reached
+            if not current:
+                return False
+        
+        return bool(current & self._final_mask)
+    
+    @property
+    def initial_mask(self) -> int:
+        """Bitmask of the states active before reading any symbol."""
+        return self._initial_mask
+    
+    def next_mask(self, current: int, symbol: str) -> int:
+        """
+        Advance a set of states by one symbol.
+        
+        Together with initial_mask and is_accepting, this walks the subset
+        construction of the automaton one state at a time.
+        
+        Args:
+            current: Bitmask of the active states
+            symbol: The symbol read
+        
+        Returns:
+            Bitmask of the states reached, 0 if there are none
+        """
+        table = self._tables.get(symbol)
+        return self._step(current, table) if table is not None else 0
+    
+    def is_accepting(self, current: int) -> bool:
+        """
+        Check if a set of states contains a final state.
+        
+        Args:
+            current: Bitmask of the active states
+        
+        Returns:
+            True if one of the states is final
+        """
+        return bool(current & self._final_mask)
+    
+    def _step(self, current: int, table: List[int]) -> int:
+        """
+        Advance a set of states by one symbol.
+        
+        Args:
+            current: Bitmask of the active states
+            table: Transition table of the symbol
+        
+        Returns:
+            Bitmask of the states reached
+        """
+        reached = 0
+        for i in _bits(current):
+            reached |= table[i]
+        return reached
+    
+    def is_infinite(self) -> bool:
+        """
+        Check if the automaton accepts infinitely many words.
+        
+        That is the case exactly when some state that is reachable from an
+        initial state and can still reach a final state lies on a cycle.
+        
+        Returns:
+            True if the language is infinite, False otherwise
+        """
+        # All states reachable from each state in one step, whatever the symbol
+        successors = [0] * len(next(iter(self._tables.values()), []))
+        for table in self._tables.values():
+            for i, mask in enumerate(table):
+                successors[i] |= mask
+        
+        reachable = frontier = self._initial_mask
+        while frontier:
+            frontier = self._step(frontier, successors) & ~reachable
+            reachable |= frontier
+        
+        # States from which a final state can be reached
+        productive = self._final_mask
+        changed = True
+        while changed:
+            changed = False
+            for i in _bits(reachable & ~productive):
+                if successors[i] & productive:
+                    productive |= 1 << i
+                    changed = True
+        
+        # Peel off useful states without a useful successor; whatever survives lies on a cycle
+        useful = reachable & productive
+        changed = True
+        while changed:
+            changed = False
+            for i in _bits(useful):
+                if not successors[i] & useful:
+                    useful &= ~(1 << i)
+                    changed = True
+        return bool(useful)
+    
+    def generate_words(self, max_length: int, limit: Optional[int] = None) -> List[str]:
+        """
+        Generate all accepted words up to a given length.
+        
+        Words are grouped by the set of states they lead to, and each group is
+        extended as a whole, so every distinct prefix is built exactly once.
+        
+        Args:
+            max_length: Maximum length of words to generate
+            limit: Optional maximum number of words; generation stops once it is reached
+        
+        Returns:
+            List of accepted words, shortest first
+        """
+        accepted_words = []
+        if not self._initial_mask:
+            return accepted_words
+        
+        symbols = sorted(self._tables)
+        # Set of active states -> words of the current length leading there
+        reach: Dict[int, List[str]] = {self._initial_mask: [""]}
+        
+        for length in range(max_length + 1):
+            for current, words in reach.items():
+                if current & self._final_mask:
+                    accepted_words.extend(words)
+            
+            if limit is not None and len(accepted_words) >= limit:
+                del accepted_words[limit:]
+                break
+            if length == max_length:
+                break
+            
+            extended: Dict[int, List[str]] = {}
+            for current, words in reach.items():
+                for symbol in symbols:
+                    reached = self._step(current, self._tables[symbol])
+                    if reached:
+                        extended.setdefault(reached, []).extend(word + symbol for word in words)
+            reach = extended
+            if not reach:
+                break
+        
+        return accepted_words
@@ -1,13 +1,81 @@
 import os
+import json
+import shutil
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QListWidget,
                           QPushButton, QLabel, QMessageBox, QFileDialog,
                           QInputDialog)
-from PyQt5.QtCore import pyqtSignal, Qt
+from PyQt5.QtCore import pyqtSignal, Qt, QTimer
 
 from AutomataProject.automata.automaton import Automaton
 from AutomataProject.utils.visualization import visualize_automaton, node_positions
+from AutomataProject.utils.visualization_qgs import create_scene_view, SCENE_STATE_THRESHOLD
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, the standard json module is used otherwise
+    orjson = None
+
+# Deleted automata are moved here and only removed for good when the application closes
+TRASH_DIR = os.path.join("Automates", ".trash")
+
+# Cache of parsed automaton files.
+# Key: file path, Value: (modification time, parsed JSON data)
+_load_cache = {}
+_load_cache_lock = threading.Lock()
+
+
+def _read_json(path):
+    """Parse a JSON file, using orjson when it is available."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _fast_load(path):
+    """Load an automaton from a JSON file without going through the cache."""
+    return Automaton.from_dict(_read_json(path))
+
+
+def _load_one(path):
+    """Read and parse a single automaton file, returning (mtime, data) or None on failure."""
+    try:
+        mtime = os.path.getmtime(path)
+        return mtime, _read_json(path)
+    except (OSError, ValueError):
+        return None
+
+
+def _cached_load(path):
+    """Load an automaton, reusing the parsed file data if the file is unchanged."""
+    mtime = os.path.getmtime(path)
+    with _load_cache_lock:
+        cached = _load_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        data = cached[1]
+    else:
+        data = _read_json(path)
+        with _load_cache_lock:
+            _load_cache[path] = (mtime, data)
+    
+    # Always build a fresh Automaton so edits never leak back into the cache
+    return Automaton.from_dict(data)
+
+
+def _warm_cache(paths):
+    """Parse several automaton files in parallel to prime the load cache."""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for path, entry in zip(paths, executor.map(_load_one, paths)):
+            if entry is not None:
+                with _load_cache_lock:
+                    _load_cache[path] = entry
+
+
 class AutomatonTab(QWidget):
     """Tab for listing and managing saved automata."""
     
@@ -20,6 +88,23 @@ class AutomatonTab(QWidget):
         self.current_automaton = None
         self.setup_ui()
         self.refresh_automaton_list()
+        self.prewarm_cache()
+        
+        # Coalesce bursts of load/delete/rename operations into a single list rebuild
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self.refresh_automaton_list)
+        
+        # Only load once the list selection has been stable for a short moment
+        self._select_timer = QTimer(self)
+        self._select_timer.setSingleShot(True)
+        self._select_timer.setInterval(50)
+        self._select_timer.timeout.connect(self._do_selected_load)
+        
+        # id() of the last automaton announced through automaton_selected; that
+        # automaton stays alive as current_automaton while the id is kept
+        self._last_emitted_id = None
     
     def setup_ui(self):
         """Initialize the UI components."""
@@ -50,16 +135,67 @@ class AutomatonTab(QWidget):
         self.buttons_layout.addWidget(self.rename_button)
         
         self.layout.addLayout(self.buttons_layout)
+        
+        # Undo bar shown for a few seconds after a deletion
+        self.undo_bar = QWidget()
+        self.undo_layout = QHBoxLayout(self.undo_bar)
+        self.undo_layout.setContentsMargins(0, 0, 0, 0)
+        
+        self.undo_label = QLabel()
+        self.undo_layout.addWidget(self.undo_label, 1)
+        
+        self.undo_button = QPushButton("Undo")
+        self.undo_button.clicked.connect(self.undo_delete)
+        self.undo_layout.addWidget(self.undo_button)
+        
+        self.undo_bar.setVisible(False)
+        self.layout.addWidget(self.undo_bar)
+        
+        self._last_deleted = None
+        self._undo_timer = QTimer(self)
+        self._undo_timer.setSingleShot(True)
+        self._undo_timer.setInterval(5000)
+        self._undo_timer.timeout.connect(self.hide_undo_bar)
     
     def refresh_automaton_list(self):
         """Refresh the list of saved automata."""
-        self.automata_list.clear()
-        automata_names = Automaton.list_saved_automata()
-        for name in sorted(automata_names):
-            self.automata_list.addItem(name)
+        selected_items = self.automata_list.selectedItems()
+        selected_name = selected_items[0].text() if selected_items else None
+        
+        # Rebuilding the list must not look like a user selection change
+        self.automata_list.blockSignals(True)
+        try:
+            self.automata_list.clear()
+            automata_names = Automaton.list_saved_automata()
+            for name in sorted(automata_names):
+                self.automata_list.addItem(name)
+            
+            # Keep the previously selected automaton selected
+            if selected_name is not None:
+                matches = self.automata_list.findItems(selected_name, Qt.MatchExactly)
+                if matches:
+                    self.automata_list.setCurrentItem(matches[0])
+        finally:
+            self.automata_list.blockSignals(False)
+    
+    def prewarm_cache(self):
+        """Parse all saved automata in the background so the first selection is instant."""
+        paths = [os.path.join("Automates", f"{name}.json")
+                 for name in Automaton.list_saved_automata()]
+        if paths:
+            threading.Thread(target=_warm_cache, args=(paths,), daemon=True).start()
+    
+    def schedule_refresh(self):
+        """Schedule a list refresh; repeated calls within 50 ms trigger only one rebuild."""
+        self._refresh_timer.start()
     
     def on_automaton_selected(self):
         """Handle selection of an automaton from the list."""
+        if self.automata_list.selectedItems():
+            self._select_timer.start()
+    
+    def _do_selected_load(self):
+        """Load the selected automaton once the selection has settled."""
         selected_items = self.automata_list.selectedItems()
         if not selected_items:
             return
@@ -67,6 +203,23 @@ class AutomatonTab(QWidget):
         automaton_name = selected_items[0].text()
         self.load_automaton_by_name(automaton_name)
     
+    def _select_loaded_automaton(self, automaton):
+        """
+        Make a freshly loaded automaton current and notify the other tabs.
+        
+        The signal is only emitted for an automaton object not announced already.
+        Every load builds a new object, so an explicit load always reaches the
+        other tabs, even when the file is unchanged and the editor has moved on to
+        another automaton since.
+        """
+        if id(automaton) == self._last_emitted_id:
+            return
+        
+        self._last_emitted_id = id(automaton)
+        self.current_automaton = automaton
+        self.automaton_selected.emit(automaton)
+        self.display_automaton()
+    
     def load_automaton_by_name(self, name):
         """Load an automaton by its name."""
         try:
@@ -75,11 +228,9 @@ class AutomatonTab(QWidget):
                 QMessageBox.warning(self, "File Not Found", f"Automaton file {file_path} not found.")
                 return
             
-            automaton = Automaton.load_from_file(file_path)
-            self.current_automaton = automaton
-            self.automaton_selected.emit(automaton)
-            self.display_automaton()
-            self.parent.statusBar().showMessage(f"Loaded automaton: {name}")
+            automaton = _cached_load(file_path)
+            self._select_loaded_automaton(automaton)
+            self.parent.status_bar.showMessage(f"Loaded automaton: {name}")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load automaton: {str(e)}")
     
@@ -91,46 +242,81 @@ class AutomatonTab(QWidget):
         
         if file_path:
             try:
-                automaton = Automaton.load_from_file(file_path)
-                self.current_automaton = automaton
-                self.automaton_selected.emit(automaton)
-                self.display_automaton()
-                self.parent.statusBar().showMessage(f"Loaded automaton: {automaton.name}")
-                self.refresh_automaton_list()
+                automaton = _cached_load(file_path)
+                self._select_loaded_automaton(automaton)
+                self.parent.status_bar.showMessage(f"Loaded automaton: {automaton.name}")
+                self.schedule_refresh()
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to load automaton: {str(e)}")
     
     def delete_automaton(self):
-        """Delete the selected automaton."""
+        """Move the selected automaton to the trash, offering a short-lived undo."""
         selected_items = self.automata_list.selectedItems()
         if not selected_items:
             QMessageBox.warning(self, "No Selection", "Please select an automaton to delete.")
             return
         
         automaton_name = selected_items[0].text()
-        reply = QMessageBox.question(
-            self, 'Confirm Deletion',
-            f"Are you sure you want to delete the automaton '{automaton_name}'?",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
-        )
+        try:
+            file_path = os.path.join("Automates", f"{automaton_name}.json")
+            if os.path.exists(file_path):
+                os.makedirs(TRASH_DIR, exist_ok=True)
+                trash_path = os.path.join(TRASH_DIR, f"{automaton_name}.{uuid.uuid4().hex}.json")
+                os.replace(file_path, trash_path)
+                Automaton.clear_saved_automata_cache()
+                self._last_deleted = (automaton_name, file_path, trash_path)
+                
+                self.schedule_refresh()
+                self.parent.status_bar.showMessage(f"Deleted automaton: {automaton_name}")
+                self.show_undo_bar(f"Deleted '{automaton_name}'.")
+                
+                # Clear visualization if the deleted automaton was being displayed
+                if self.current_automaton and self.current_automaton.name == automaton_name:
+                    self.current_automaton = None
+                    self._last_emitted_id = None
+                    self.clear_display()
+            else:
+                QMessageBox.warning(self, "File Not Found", f"Automaton file {file_path} not found.")
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to delete automaton: {str(e)}")
+    
+    def undo_delete(self):
+        """Restore the most recently deleted automaton from the trash."""
+        self.hide_undo_bar()
+        if not self._last_deleted:
+            return
         
-        if reply == QMessageBox.Yes:
-            try:
-                file_path = os.path.join("Automates", f"{automaton_name}.json")
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-                    self.refresh_automaton_list()
-                    self.parent.statusBar().showMessage(f"Deleted automaton: {automaton_name}")
-                    
-                    # Clear visualization if the deleted automaton was being displayed
-                    if self.current_automaton and self.current_automaton.name == automaton_name:
-                        self.current_automaton = None
-                        self.clear_display()
-                else:
-                    QMessageBox.warning(self, "File Not Found", f"Automaton file {file_path} not found.")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to delete automaton: {str(e)}")
+        automaton_name, file_path, trash_path = self._last_deleted
+        self._last_deleted = None
+        try:
+            if os.path.exists(file_path):
+                QMessageBox.warning(
+                    self, "Name Exists",
+                    f"An automaton named '{automaton_name}' already exists. It cannot be restored."
+                )
+                return
+            
+            os.replace(trash_path, file_path)
+            Automaton.clear_saved_automata_cache()
+            self.schedule_refresh()
+            self.parent.status_bar.showMessage(f"Restored automaton: {automaton_name}")
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to restore automaton: {str(e)}")
+    
+    def show_undo_bar(self, message):
+        """Show the undo bar with the given message for a few seconds."""
+        self.undo_label.setText(message)
+        self.undo_bar.setVisible(True)
+        self._undo_timer.start()
+    
+    def hide_undo_bar(self):
+        """Hide the undo bar."""
+        self._undo_timer.stop()
+        self.undo_bar.setVisible(False)
+    
+    def empty_trash(self):
+        """Permanently remove all deleted automata."""
+        shutil.rmtree(TRASH_DIR, ignore_errors=True)
     
     def rename_automaton(self):
         """Rename the selected automaton."""
@@ -161,13 +347,14 @@ class AutomatonTab(QWidget):
                 
                 if os.path.exists(old_path):
                     # Load, rename, and save with new name
-                    automaton = Automaton.load_from_file(old_path)
+                    automaton = _fast_load(old_path)
                     automaton.name = new_name
                     automaton.save_to_file()
                     os.remove(old_path)
+                    Automaton.clear_saved_automata_cache()
                     
-                    self.refresh_automaton_list()
-                    self.parent.statusBar().showMessage(f"Renamed automaton: {old_name} to {new_name}")
+                    self.schedule_refresh()
+                    self.parent.status_bar.showMessage(f"Renamed automaton: {old_name} to {new_name}")
                     
                     # Update current automaton if it was renamed
                     if self.current_automaton and self.current_automaton.name == old_name:
@@ -188,12 +375,16 @@ class AutomatonTab(QWidget):
             # Clear previous visualization
             self.clear_display()
             
-            # Create visualization with consistent positioning
-            fig = visualize_automaton(self.current_automaton, reuse_positions=True)
-            canvas = FigureCanvas(fig)
+            # Small automata are drawn directly with Qt graphics items, larger ones with Matplotlib
+            if len(self.current_automaton.states) < SCENE_STATE_THRESHOLD:
+                view = create_scene_view(self.current_automaton)
+            else:
+                # Create visualization with consistent positioning
+                fig = visualize_automaton(self.current_automaton, reuse_positions=True)
+                view = FigureCanvas(fig)
             
             # Add to the visualization panel
-            self.parent.visualization_layout.addWidget(canvas)
+            self.parent.visualization_layout.addWidget(view)
             self.parent.visualization_label.setText(f"Automaton: {self.current_automaton.name}")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to display automaton: {str(e)}")
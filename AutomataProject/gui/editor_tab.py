@@ -1,28 +1,75 @@
 import os
+import bisect
+from collections import Counter
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
-                          QLabel, QLineEdit, QComboBox, QGroupBox, QTableWidget,
-                          QTableWidgetItem, QCheckBox, QMessageBox, QHeaderView,
-                          QInputDialog, QFileDialog)
-from PyQt5.QtCore import Qt, pyqtSignal
+                          QLabel, QLineEdit, QComboBox, QGroupBox, QTableView,
+                          QCheckBox, QMessageBox, QHeaderView, QInputDialog,
+                          QFileDialog)
+from PyQt5.QtCore import pyqtSignal, pyqtSlot, QTimer, QObject, QRunnable, QThreadPool
 
 from AutomataProject.automata.automaton import Automaton
 from AutomataProject.automata.state import State
 from AutomataProject.automata.alphabet import Alphabet
 from AutomataProject.automata.transition import Transition
 from AutomataProject.utils.visualization import visualize_automaton, node_positions
+from AutomataProject.utils.visualization_qgs import create_scene_view, SCENE_STATE_THRESHOLD
+from .table_models import StatesModel, TransitionsModel
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
+
+class _ListSignals(QObject):
+    """Signals emitted by _ListRunnable."""
+    
+    finished = pyqtSignal(list)
+
+class _ListRunnable(QRunnable):
+    """Lists the saved automata on a worker thread."""
+    
+    def __init__(self):
+        super().__init__()
+        self.signals = _ListSignals()
+    
+    def run(self):
+        try:
+            existing_automata = Automaton.list_saved_automata()
+        except OSError:
+            existing_automata = []
+        self.signals.finished.emit(existing_automata)
 
 class EditorTab(QWidget):
     """Tab for creating and editing automata."""
     
     # Signal emitted when an automaton is created or modified
     automaton_changed = pyqtSignal(Automaton)
+    # Signal emitted when the automaton becomes modified or is saved or replaced
+    dirty_changed = pyqtSignal(bool)
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent = parent
         self.current_automaton = None
-        self.has_changes = False
+        self._has_changes = False
+        # Sorted copy of the alphabet, mirrors the order of the symbol combo boxes
+        self._sorted_symbols = []
+        # Number of transitions using each symbol, so removing a symbol needs no scan
+        self._symbols_in_use = Counter()
+        
+        # Views reused across visualizations, and the structure each last drew:
+        # a graphics scene for small automata, a Matplotlib canvas for large ones
+        self._scene_view = None
+        self._scene_key = None
+        self._canvas = None
+        self._canvas_key = None
+        
+        # Whether a save is waiting for the list of saved automata
+        self._save_pending = False
+        
+        # Typing in the name field only counts as a modification once it pauses
+        self._name_timer = QTimer(self)
+        self._name_timer.setSingleShot(True)
+        self._name_timer.setInterval(150)
+        self._name_timer.timeout.connect(self.on_automaton_modified)
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -30,13 +77,16 @@ class EditorTab(QWidget):
         # Main layout
         self.layout = QVBoxLayout(self)
         
+        # Single warning dialog reused for every validation message
+        self._warning_box = QMessageBox(QMessageBox.Warning, "", "", QMessageBox.Ok, self)
+        
         # Automaton name section
         self.name_group = QGroupBox("Automaton Name")
         self.name_layout = QHBoxLayout(self.name_group)
         
         self.name_input = QLineEdit()
         self.name_input.setPlaceholderText("Enter automaton name")
-        self.name_input.textChanged.connect(self.on_automaton_modified)
+        self.name_input.textChanged.connect(self.on_name_edited)
         
         self.new_button = QPushButton("New")
         self.new_button.clicked.connect(self.create_new_automaton)
@@ -95,10 +145,11 @@ class EditorTab(QWidget):
         self.states_input_layout.addWidget(self.is_final_check)
         self.states_input_layout.addWidget(self.add_state_button)
         
-        self.states_table = QTableWidget(0, 3)
-        self.states_table.setHorizontalHeaderLabels(["Name", "Initial", "Final"])
+        self.states_model = StatesModel(self)
+        self.states_table = QTableView()
+        self.states_table.setModel(self.states_model)
         self.states_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.states_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.states_table.setSelectionBehavior(QTableView.SelectRows)
         
         self.remove_state_button = QPushButton("Remove State")
         self.remove_state_button.clicked.connect(self.remove_state)
@@ -130,10 +181,11 @@ class EditorTab(QWidget):
         self.transitions_input_layout.addWidget(self.to_state_combo)
         self.transitions_input_layout.addWidget(self.add_transition_button)
         
-        self.transitions_table = QTableWidget(0, 3)
-        self.transitions_table.setHorizontalHeaderLabels(["From", "Symbol", "To"])
+        self.transitions_model = TransitionsModel(self)
+        self.transitions_table = QTableView()
+        self.transitions_table.setModel(self.transitions_model)
         self.transitions_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.transitions_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.transitions_table.setSelectionBehavior(QTableView.SelectRows)
         
         self.remove_transition_button = QPushButton("Remove Transition")
         self.remove_transition_button.clicked.connect(self.remove_transition)
@@ -152,6 +204,7 @@ class EditorTab(QWidget):
         # Initialize with empty automaton
         self.create_new_automaton()
     
+    @pyqtSlot()
     def create_new_automaton(self):
         """Create a new empty automaton."""
         # Ask for confirmation if there are unsaved changes
@@ -172,136 +225,137 @@ class EditorTab(QWidget):
             self.current_automaton = Automaton(default_name)
             self.update_ui_from_automaton()
             self.has_changes = False
-            self.parent.statusBar().showMessage(f"Created new automaton: {default_name}")
+            self.automaton_changed.emit(self.current_automaton)
+            self.parent.status_bar.showMessage(f"Created new automaton: {default_name}")
         except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to create new automaton: {str(e)}")
+            self.show_warning("Error", f"Failed to create new automaton: {str(e)}")
             # If error occurred, create a default automaton
             self.current_automaton = Automaton("DefaultAutomaton")
             self.update_ui_from_automaton()
             self.has_changes = False
-            self.parent.statusBar().showMessage("Created default automaton after error")
+            self.parent.status_bar.showMessage("Created default automaton after error")
     
     def update_ui_from_automaton(self):
-        """Update the UI to reflect the current automaton."""
+        """
+        Rebuild the whole UI from the current automaton.
+        
+        Only used when a different automaton is loaded; edits update the
+        affected widgets directly.
+        """
         if not self.current_automaton:
             return
         
-        # Update name
-        self.name_input.setText(self.current_automaton.name)
-        
-        # Update alphabet
-        self.alphabet_list.clear()
-        for symbol in sorted(self.current_automaton.alphabet.symbols):
-            self.alphabet_list.addItem(symbol)
-        
-        # Update symbol combo in transitions
-        self.symbol_combo.clear()
-        for symbol in sorted(self.current_automaton.alphabet.symbols):
-            self.symbol_combo.addItem(symbol)
-        # Add epsilon for NFAs
-        self.symbol_combo.addItem(Transition.EPSILON)
-        
-        # Update states table
-        self.states_table.setRowCount(0)
-        for state in self.current_automaton.states:
-            row = self.states_table.rowCount()
-            self.states_table.insertRow(row)
-            
-            # Name
-            name_item = QTableWidgetItem(state.name)
-            name_item.setFlags(name_item.flags() & ~Qt.ItemIsEditable)
-            self.states_table.setItem(row, 0, name_item)
-            
-            # Initial
-            initial_item = QTableWidgetItem("Yes" if state.is_initial else "No")
-            initial_item.setFlags(initial_item.flags() & ~Qt.ItemIsEditable)
-            self.states_table.setItem(row, 1, initial_item)
+        # Combo boxes would emit index changes for every item cleared and added
+        combos = (self.alphabet_list, self.symbol_combo, self.from_state_combo, self.to_state_combo)
+        # Stretching columns and sorting would relayout the tables while they are refilled
+        tables = (self.states_table, self.transitions_table)
+        self.setUpdatesEnabled(False)
+        for combo in combos:
+            combo.blockSignals(True)
+        for table in tables:
+            table.setSortingEnabled(False)
+            table.horizontalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        try:
+            # Update name without echoing it back as a modification
+            self.name_input.blockSignals(True)
+            self.name_input.setText(self.current_automaton.name)
+            self.name_input.blockSignals(False)
             
-            # Final
-            final_item = QTableWidgetItem("Yes" if state.is_final else "No")
-            final_item.setFlags(final_item.flags() & ~Qt.ItemIsEditable)
-            self.states_table.setItem(row, 2, final_item)
-        
-        # Update state combos in transitions
-        self.from_state_combo.clear()
-        self.to_state_combo.clear()
-        for state in self.current_automaton.states:
-            self.from_state_combo.addItem(state.name)
-            self.to_state_combo.addItem(state.name)
-        
-        # Update transitions table
-        self.transitions_table.setRowCount(0)
-        for transition in self.current_automaton.transitions:
-            row = self.transitions_table.rowCount()
-            self.transitions_table.insertRow(row)
+            # Update alphabet and symbol combo in transitions
+            self._sorted_symbols = list(self.current_automaton.alphabet.sorted_symbols())
+            self.alphabet_list.clear()
+            self.alphabet_list.addItems(self._sorted_symbols)
+            self.symbol_combo.clear()
+            self.symbol_combo.addItems(self._sorted_symbols)
+            # Add epsilon for NFAs
+            self.symbol_combo.addItem(Transition.EPSILON)
             
-            # From state
-            from_item = QTableWidgetItem(transition.from_state.name)
-            from_item.setFlags(from_item.flags() & ~Qt.ItemIsEditable)
-            self.transitions_table.setItem(row, 0, from_item)
+            # Update states table
+            self.states_model.set_states(self.current_automaton.states)
             
-            # Symbol
-            symbol_item = QTableWidgetItem(transition.symbol)
-            symbol_item.setFlags(symbol_item.flags() & ~Qt.ItemIsEditable)
-            self.transitions_table.setItem(row, 1, symbol_item)
+            # Update state combos in transitions, keeping each State as item data
+            self.from_state_combo.clear()
+            self.to_state_combo.clear()
+            for state in self.current_automaton.states:
+                self.from_state_combo.addItem(state.name, state)
+                self.to_state_combo.addItem(state.name, state)
             
-            # To state
-            to_item = QTableWidgetItem(transition.to_state.name)
-            to_item.setFlags(to_item.flags() & ~Qt.ItemIsEditable)
-            self.transitions_table.setItem(row, 2, to_item)
+            # Update transitions table
+            self.transitions_model.set_transitions(self.current_automaton.transitions)
+            self._symbols_in_use = Counter(t.symbol for t in self.current_automaton.transitions)
+        finally:
+            for table in tables:
+                table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+            for combo in combos:
+                combo.blockSignals(False)
+            self.setUpdatesEnabled(True)
     
+    @pyqtSlot()
     def add_symbol(self):
         """Add a symbol to the alphabet."""
         symbol = self.alphabet_input.text().strip()
         
         if not symbol:
-            QMessageBox.warning(self, "Empty Input", "Please enter a symbol.")
+            self.show_warning("Empty Input", "Please enter a symbol.")
             return
         
         if symbol in self.current_automaton.alphabet.symbols:
-            QMessageBox.warning(self, "Duplicate Symbol", f"Symbol '{symbol}' is already in the alphabet.")
+            self.show_warning("Duplicate Symbol", f"Symbol '{symbol}' is already in the alphabet.")
             return
         
         if symbol == Transition.EPSILON:
-            QMessageBox.warning(self, "Reserved Symbol", f"Symbol '{Transition.EPSILON}' is reserved for epsilon transitions.")
+            self.show_warning("Reserved Symbol", f"Symbol '{Transition.EPSILON}' is reserved for epsilon transitions.")
             return
         
         self.current_automaton.alphabet.add_symbol(symbol)
         self.alphabet_input.clear()
+        
+        # Insert at the sorted position; epsilon stays last in the symbol combo
+        index = bisect.bisect_left(self._sorted_symbols, symbol)
+        self._sorted_symbols.insert(index, symbol)
+        self.alphabet_list.insertItem(index, symbol)
+        self.symbol_combo.insertItem(index, symbol)
+        
         self.on_automaton_modified()
-        self.update_ui_from_automaton()
     
+    @pyqtSlot()
     def remove_symbol(self):
         """Remove a symbol from the alphabet."""
         if self.alphabet_list.count() == 0:
-            QMessageBox.warning(self, "No Symbols", "There are no symbols to remove.")
+            self.show_warning("No Symbols", "There are no symbols to remove.")
             return
         
         symbol = self.alphabet_list.currentText()
         
         # Check if any transitions use this symbol
-        for transition in self.current_automaton.transitions:
-            if transition.symbol == symbol:
-                QMessageBox.warning(
-                    self, "Symbol in Use", 
-                    f"Cannot remove symbol '{symbol}' because it is used in transitions."
-                )
-                return
+        if self._symbols_in_use[symbol] > 0:
+            self.show_warning(
+                "Symbol in Use", 
+                f"Cannot remove symbol '{symbol}' because it is used in transitions."
+            )
+            return
         
         self.current_automaton.alphabet.remove_symbol(symbol)
+        
+        index = bisect.bisect_left(self._sorted_symbols, symbol)
+        del self._sorted_symbols[index]
+        self.alphabet_list.removeItem(self.alphabet_list.findText(symbol))
+        self.symbol_combo.removeItem(self.symbol_combo.findText(symbol))
+        
         self.on_automaton_modified()
-        self.update_ui_from_automaton()
     
+    @pyqtSlot()
     def add_state(self):
         """Add a state to the automaton."""
         name = self.state_name_input.text().strip()
         
         if not name:
-            QMessageBox.warning(self, "Empty Input", "Please enter a state name.")
+            self.show_warning("Empty Input", "Please enter a state name.")
             return
         
-        if self.current_automaton.get_state_by_name(name):
-            QMessageBox.warning(self, "Duplicate State", f"State '{name}' already exists.")
+        # States hash by name, so this is a set lookup rather than a scan
+        if State(name) in self.current_automaton.states:
+            self.show_warning("Duplicate State", f"State '{name}' already exists.")
             return
         
         is_initial = self.is_initial_check.isChecked()
@@ -314,109 +368,161 @@ class EditorTab(QWidget):
         self.is_initial_check.setChecked(False)
         self.is_final_check.setChecked(False)
         
+        self.states_model.append_state(state)
+        self.from_state_combo.addItem(name, state)
+        self.to_state_combo.addItem(name, state)
+        
         self.on_automaton_modified()
-        self.update_ui_from_automaton()
     
+    @pyqtSlot()
     def remove_state(self):
         """Remove a state from the automaton."""
-        selected_items = self.states_table.selectedItems()
-        if not selected_items:
-            QMessageBox.warning(self, "No Selection", "Please select a state to remove.")
+        selected_rows = self.states_table.selectionModel().selectedRows()
+        if not selected_rows:
+            self.show_warning("No Selection", "Please select a state to remove.")
             return
         
-        state_name = self.states_table.item(selected_items[0].row(), 0).text()
-        state = self.current_automaton.get_state_by_name(state_name)
+        row = selected_rows[0].row()
+        state = self.states_model.state_at(row)
+        state_name = state.name
         
-        if state:
+        if state in self.current_automaton.states:
             self.current_automaton.remove_state(state)
+            
+            self.setUpdatesEnabled(False)
+            try:
+                self.states_model.remove_row(row)
+                for transition in self.transitions_model.remove_transitions_of(state):
+                    self._symbols_in_use[transition.symbol] -= 1
+                self.from_state_combo.removeItem(self.from_state_combo.findText(state_name))
+                self.to_state_combo.removeItem(self.to_state_combo.findText(state_name))
+            finally:
+                self.setUpdatesEnabled(True)
+            
             self.on_automaton_modified()
-            self.update_ui_from_automaton()
     
+    @pyqtSlot()
     def add_transition(self):
         """Add a transition to the automaton."""
         if self.from_state_combo.count() == 0 or self.to_state_combo.count() == 0:
-            QMessageBox.warning(self, "No States", "Please add states first.")
+            self.show_warning("No States", "Please add states first.")
             return
         
         if self.symbol_combo.count() == 0:
-            QMessageBox.warning(self, "No Symbols", "Please add symbols to the alphabet first.")
+            self.show_warning("No Symbols", "Please add symbols to the alphabet first.")
             return
         
-        from_state_name = self.from_state_combo.currentText()
+        from_state = self.from_state_combo.currentData()
         symbol = self.symbol_combo.currentText()
-        to_state_name = self.to_state_combo.currentText()
-        
-        from_state = self.current_automaton.get_state_by_name(from_state_name)
-        to_state = self.current_automaton.get_state_by_name(to_state_name)
-        
-        # Check for duplicate transition
-        for transition in self.current_automaton.transitions:
-            if (transition.from_state == from_state and 
-                transition.symbol == symbol and 
-                transition.to_state == to_state):
-                QMessageBox.warning(
-                    self, "Duplicate Transition", 
-                    f"Transition {from_state_name} --({symbol})--> {to_state_name} already exists."
-                )
-                return
+        to_state = self.to_state_combo.currentData()
+        from_state_name = from_state.name
+        to_state_name = to_state.name
+        
+        # Check for duplicate transition; transitions hash by (from, to, symbol)
+        transition = Transition(from_state, to_state, symbol)
+        if transition in self.current_automaton.transitions:
+            self.show_warning(
+                "Duplicate Transition", 
+                f"Transition {from_state_name} --({symbol})--> {to_state_name} already exists."
+            )
+            return
         
         # Add the transition
         success = self.current_automaton.add_transition(from_state, to_state, symbol)
         
         if success:
+            self.transitions_model.append_transition(transition)
+            self._symbols_in_use[symbol] += 1
             self.on_automaton_modified()
-            self.update_ui_from_automaton()
         else:
-            QMessageBox.warning(
-                self, "Invalid Transition", 
+            self.show_warning(
+                "Invalid Transition", 
                 f"Could not add transition with symbol '{symbol}'."
             )
     
+    @pyqtSlot()
     def remove_transition(self):
         """Remove a transition from the automaton."""
-        selected_items = self.transitions_table.selectedItems()
-        if not selected_items:
-            QMessageBox.warning(self, "No Selection", "Please select a transition to remove.")
+        selected_rows = self.transitions_table.selectionModel().selectedRows()
+        if not selected_rows:
+            self.show_warning("No Selection", "Please select a transition to remove.")
             return
         
-        row = selected_items[0].row()
-        from_state_name = self.transitions_table.item(row, 0).text()
-        symbol = self.transitions_table.item(row, 1).text()
-        to_state_name = self.transitions_table.item(row, 2).text()
-        
-        from_state = self.current_automaton.get_state_by_name(from_state_name)
-        to_state = self.current_automaton.get_state_by_name(to_state_name)
-        
-        # Find and remove the transition
-        for transition in self.current_automaton.transitions:
-            if (transition.from_state == from_state and 
-                transition.symbol == symbol and 
-                transition.to_state == to_state):
-                self.current_automaton.remove_transition(transition)
-                self.on_automaton_modified()
-                self.update_ui_from_automaton()
-                break
+        row = selected_rows[0].row()
+        transition = self.transitions_model.transition_at(row)
+        
+        if transition in self.current_automaton.transitions:
+            self.current_automaton.remove_transition(transition)
+            self.transitions_model.remove_row(row)
+            self._symbols_in_use[transition.symbol] -= 1
+            self.on_automaton_modified()
     
+    @pyqtSlot(str)
+    def on_name_edited(self, text):
+        """Restart the name debounce timer on each keystroke."""
+        self._name_timer.start()
+    
+    def flush_name_edit(self):
+        """Apply a pending name edit immediately."""
+        if self._name_timer.isActive():
+            self.on_automaton_modified()
+    
+    @pyqtSlot()
     def on_automaton_modified(self):
         """Handle modifications to the automaton."""
+        self._name_timer.stop()
         if self.current_automaton:
             self.current_automaton.name = self.name_input.text().strip()
             self.has_changes = True
             self.automaton_changed.emit(self.current_automaton)
     
+    @pyqtSlot()
     def save_current_automaton(self):
         """Save the current automaton."""
+        self._start_save()
+    
+    def _start_save(self, restore_name=None):
+        """
+        Start saving the current automaton; the save finishes once the saved automata are listed.
+        
+        Args:
+            restore_name: Name to give back to the automaton if it ends up not saved,
+                          for a Save As that renamed it beforehand
+        """
+        self.flush_name_edit()
         if not self.current_automaton:
-            QMessageBox.warning(self, "No Automaton", "No automaton to save.")
+            self.show_warning("No Automaton", "No automaton to save.")
             return
         
         if not self.current_automaton.name:
-            QMessageBox.warning(self, "No Name", "Please enter a name for the automaton.")
+            self.show_warning("No Name", "Please enter a name for the automaton.")
+            return
+        
+        # A save is already waiting for the list of saved automata
+        if self._save_pending:
+            if restore_name is not None:
+                self.current_automaton.name = restore_name
             return
         
+        # Check for an existing automaton with this name without blocking the UI
+        self._save_pending = True
+        runnable = _ListRunnable()
+        runnable.signals.finished.connect(
+            lambda existing_automata: self._continue_save(existing_automata, restore_name))
+        QThreadPool.globalInstance().start(runnable)
+    
+    def _continue_save(self, existing_automata, restore_name=None):
+        """
+        Finish saving once the saved automata have been listed.
+        
+        Args:
+            existing_automata: Names of the saved automata
+            restore_name: Name to give back to the automaton if it ends up not saved
+        """
+        self._save_pending = False
+        
         try:
             # Check if an automaton with this name already exists
-            existing_automata = Automaton.list_saved_automata()
             if self.current_automaton.name in existing_automata:
                 reply = QMessageBox.question(
                     self, 'Overwrite Automaton',
@@ -426,23 +532,29 @@ class EditorTab(QWidget):
                 )
                 
                 if reply == QMessageBox.No:
+                    if restore_name is not None:
+                        self.current_automaton.name = restore_name
                     return
             
             # Save the automaton
             file_path = self.current_automaton.save_to_file()
             self.has_changes = False
-            self.parent.statusBar().showMessage(f"Saved automaton to {file_path}")
+            self.parent.status_bar.showMessage(f"Saved automaton to {file_path}")
             
             # Refresh automata list in the Automaton tab
             if hasattr(self.parent, 'automaton_tab'):
                 self.parent.automaton_tab.refresh_automaton_list()
         except Exception as e:
+            if restore_name is not None:
+                self.current_automaton.name = restore_name
             QMessageBox.critical(self, "Error", f"Failed to save automaton: {str(e)}")
     
+    @pyqtSlot()
     def save_current_automaton_as(self):
         """Save the current automaton with a new name."""
+        self.flush_name_edit()
         if not self.current_automaton:
-            QMessageBox.warning(self, "No Automaton", "No automaton to save.")
+            self.show_warning("No Automaton", "No automaton to save.")
             return
         
         new_name, ok = QInputDialog.getText(
@@ -453,38 +565,82 @@ class EditorTab(QWidget):
         if ok and new_name:
             original_name = self.current_automaton.name
             self.current_automaton.name = new_name
-            try:
-                self.save_current_automaton()
-            except Exception as e:
-                self.current_automaton.name = original_name
-                QMessageBox.critical(self, "Error", f"Failed to save automaton: {str(e)}")
+            # The name is given back if the save is refused, fails or cannot start
+            self._start_save(restore_name=original_name)
+    
+    def _visualization_key(self):
+        """Describe everything the drawing depends on, to detect when a redraw is needed."""
+        automaton = self.current_automaton
+        return (
+            automaton.name,
+            frozenset((s.name, s.is_initial, s.is_final) for s in automaton.states),
+            frozenset((t.from_state.name, t.symbol, t.to_state.name) for t in automaton.transitions),
+        )
     
+    @pyqtSlot()
     def visualize_automaton(self):
         """Visualize the current automaton."""
         if not self.current_automaton:
-            QMessageBox.warning(self, "No Automaton", "No automaton to visualize.")
+            self.show_warning("No Automaton", "No automaton to visualize.")
             return
         
         try:
-            # Clear previous visualization
-            for i in reversed(range(self.parent.visualization_layout.count())):
-                widget = self.parent.visualization_layout.itemAt(i).widget()
-                if widget != self.parent.visualization_label:
-                    widget.setParent(None)
+            layout = self.parent.visualization_layout
             
-            # Create visualization with consistent positioning
-            # It will automatically reuse positions if available
-            fig = visualize_automaton(self.current_automaton, reuse_positions=True)
-            canvas = FigureCanvas(fig)
+            # Only redraw when the automaton's structure changed
+            key = self._visualization_key()
+            if len(self.current_automaton.states) < SCENE_STATE_THRESHOLD:
+                if self._scene_view is None or key != self._scene_key:
+                    self._scene_view = create_scene_view(self.current_automaton)
+                    self._scene_key = key
+                view = self._scene_view
+            else:
+                if self._canvas is None:
+                    self._canvas = FigureCanvas(Figure(figsize=(10, 8)))
+                if key != self._canvas_key:
+                    figure = self._canvas.figure
+                    figure.clear()
+                    # It will automatically reuse positions if available
+                    visualize_automaton(self.current_automaton, ax=figure.add_subplot(111),
+                                        reuse_positions=True)
+                    self._canvas_key = key
+                view = self._canvas
+            
+            # Clear previous visualization, keeping the view being shown
+            for i in reversed(range(layout.count())):
+                widget = layout.itemAt(i).widget()
+                if widget not in (self.parent.visualization_label, view):
+                    widget.setParent(None)
             
             # Add to the visualization panel
-            self.parent.visualization_layout.addWidget(canvas)
+            if layout.indexOf(view) < 0:
+                layout.addWidget(view)
+            if view is self._canvas:
+                self._canvas.draw_idle()
             self.parent.visualization_label.setText(f"Automaton: {self.current_automaton.name}")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to visualize automaton: {str(e)}")
     
+    def show_warning(self, title, message):
+        """Show a warning dialog, reusing the same message box each time."""
+        self._warning_box.setWindowTitle(title)
+        self._warning_box.setText(message)
+        self._warning_box.exec_()
+    
+    @property
+    def has_changes(self):
+        """Whether the automaton was modified since it was loaded or saved."""
+        return self._has_changes
+    
+    @has_changes.setter
+    def has_changes(self, value):
+        if value != self._has_changes:
+            self._has_changes = value
+            self.dirty_changed.emit(value)
+    
     def has_unsaved_changes(self):
         """Check if there are unsaved changes."""
+        self.flush_name_edit()
         return self.has_changes 
         
     def set_current_automaton(self, automaton):
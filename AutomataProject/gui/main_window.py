@@ -1,9 +1,11 @@
 import os
 import sys
+from functools import lru_cache
+from string import Template
 from PyQt5.QtWidgets import (QMainWindow, QApplication, QWidget, QTabWidget, 
                           QVBoxLayout, QHBoxLayout, QSplitter, QLabel, 
-                          QStatusBar, QAction, QMessageBox, QFileDialog)
-from PyQt5.QtCore import Qt, QSettings
+                          QStatusBar, QAction, QMessageBox, QFileDialog, QStyle)
+from PyQt5.QtCore import Qt, QSize, QSettings, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
 from PyQt5.QtGui import QIcon, QFont, QPalette, QColor
 
 from .automaton_tab import AutomatonTab
@@ -26,6 +28,173 @@ COLORS = {
     'highlight': '#3498db',     # Bright blue for highlights
 }
 
+# Dark theme color scheme
+DARK_COLORS = {
+    'primary': '#1a1a2e',     # Very dark blue
+    'secondary': '#16213e',   # Dark blue
+    'accent': '#0f3460',      # Darker accent
+    'text': '#e1e1e1',        # Light gray for text
+    'background': '#121212',  # Very dark gray almost black
+    'border': '#333333',      # Dark gray for borders
+    'highlight': '#8BC34A',   # Bright green for highlight
+}
+
+# Color roles used by the stylesheet templates, for each theme
+LIGHT_THEME = {
+    'window_bg': COLORS['light'],
+    'text': COLORS['dark'],
+    'panel_bg': 'white',
+    'border': COLORS['border'],
+    'header_text': COLORS['primary'],
+    'label_text': COLORS['secondary'],
+    'pane_bg': 'transparent',
+    'tab_bg': COLORS['light'],
+    'tab_hover_bg': '#d6dbdf',
+    'accent': COLORS['accent'],
+    'focus_border': COLORS['accent'],
+    'button_hover_bg': '#2980b9',
+    'button_pressed_bg': '#1f6aa5',
+    'disabled_bg': '#bdc3c7',
+    'disabled_text': '#7f8c8d',
+    'input_bg': 'white',
+    'input_text': 'palette(text)',
+    'bar_bg': COLORS['primary'],
+    'bar_text': 'white',
+    'menu_selected_bg': COLORS['secondary'],
+    'scrollbar_bg': '#f0f0f0',
+}
+
+DARK_THEME = {
+    'window_bg': DARK_COLORS['background'],
+    'text': DARK_COLORS['text'],
+    'panel_bg': DARK_COLORS['secondary'],
+    'border': DARK_COLORS['border'],
+    'header_text': DARK_COLORS['text'],
+    'label_text': DARK_COLORS['text'],
+    'pane_bg': DARK_COLORS['secondary'],
+    'tab_bg': DARK_COLORS['primary'],
+    'tab_hover_bg': '#2a2a4a',
+    'accent': DARK_COLORS['accent'],
+    'focus_border': DARK_COLORS['highlight'],
+    'button_hover_bg': '#1a4870',
+    'button_pressed_bg': '#0c2635',
+    'disabled_bg': '#404040',
+    'disabled_text': '#707070',
+    'input_bg': DARK_COLORS['primary'],
+    'input_text': DARK_COLORS['text'],
+    'bar_bg': DARK_COLORS['primary'],
+    'bar_text': DARK_COLORS['text'],
+    'menu_selected_bg': DARK_COLORS['accent'],
+    'scrollbar_bg': DARK_COLORS['primary'],
+}
+
+# Stylesheets live in assets/themes; $placeholders in them are the color roles above
+THEMES_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "assets", "themes"))
+
+@lru_cache(maxsize=None)
+def _read_qss(filename):
+    """Read a stylesheet template from the themes directory once per process."""
+    with open(os.path.join(THEMES_DIR, filename), 'r', encoding='utf-8') as f:
+        return Template(f.read())
+
+@lru_cache(maxsize=4)
+def _build_stylesheet(theme_items, extra_qss):
+    """Fill the stylesheet templates for a theme given as sorted (role, color) pairs."""
+    roles = dict(theme_items)
+    roles['extra_rules'] = _read_qss(extra_qss).substitute(roles) if extra_qss else ""
+    return _read_qss("base.qss").substitute(roles)
+
+def build_stylesheet(theme, extra_qss=None):
+    """
+    Get the stylesheet for a theme, building it only the first time.
+    
+    Args:
+        theme: Mapping of color roles, such as LIGHT_THEME or DARK_THEME
+        extra_qss: Optional file in the themes directory with rules only this theme uses
+    
+    Returns:
+        Stylesheet string
+    """
+    return _build_stylesheet(tuple(sorted(theme.items())), extra_qss)
+
+# Application icon, looked up once per process
+ICON_PATH = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "assets", "icon.png"))
+
+@lru_cache(maxsize=1)
+def _app_icon():
+    """Load the application icon, or return None if the asset is missing."""
+    if os.path.exists(ICON_PATH):
+        return QIcon(ICON_PATH)
+    return None
+
+@lru_cache(maxsize=None)
+def _action_icon(standard_pixmap):
+    """
+    Get a standard icon of the application style, loading each one once per process.
+    
+    Args:
+        standard_pixmap: QStyle.StandardPixmap value
+    
+    Returns:
+        The icon
+    """
+    return QApplication.style().standardIcon(standard_pixmap)
+
+# Indices of the tabs in the right panel
+EDITOR_TAB_INDEX = 1
+ANALYSIS_TAB_INDEX = 2
+WORD_PROCESSING_TAB_INDEX = 3
+
+# Menu bar layout: (menu title, [(action text, shortcut, slot name, standard icon), ...]);
+# None is a separator
+MENU_SPEC = [
+    ("&File", [
+        ("&New Automaton", "Ctrl+N", "new_automaton", QStyle.SP_FileIcon),
+        ("&Open Automaton", "Ctrl+O", "open_automaton", QStyle.SP_DialogOpenButton),
+        ("&Save Automaton", "Ctrl+S", "save_automaton", QStyle.SP_DialogSaveButton),
+        ("Save Automaton &As...", "Ctrl+Shift+S", "save_automaton_as", None),
+        None,
+        ("E&xport Image", "Ctrl+E", "export_image", None),
+        None,
+        ("E&xit", "Ctrl+Q", "close", QStyle.SP_DialogCloseButton),
+    ]),
+    ("&View", [
+        ("Toggle &Dark Mode", "Ctrl+D", "toggle_theme", None),
+    ]),
+    ("&Help", [
+        ("&About", None, "show_about", QStyle.SP_MessageBoxInformation),
+    ]),
+]
+
+# Contents of the Help > About dialog
+ABOUT_HTML = """
+<div style="text-align: center;">
+    <h2 style="color: #3498db;">Automata Visualizer & Simulator</h2>
+    <p>A powerful tool for visualizing and analyzing finite automata.</p>
+    <p>Create, edit, and simulate automata with a modern interface.</p>
+    <p><small>Version 1.0</small></p>
+    <p><small>© 2025 Academic Project</small></p>
+</div>
+"""
+
+class _SettingsSignals(QObject):
+    """Signals emitted by _SettingsLoader."""
+    
+    # Saved window geometry and splitter state; None when not saved yet
+    loaded = pyqtSignal(object, object)
+
+class _SettingsLoader(QRunnable):
+    """Reads the saved window state on a worker thread."""
+    
+    def __init__(self):
+        super().__init__()
+        self.signals = _SettingsSignals()
+    
+    def run(self):
+        # QSettings is reentrant, so a separate instance is safe to use on this thread
+        settings = QSettings("AutomataProject", "Automata Visualizer")
+        self.signals.loaded.emit(settings.value("geometry"), settings.value("splitter"))
+
 class MainWindow(QMainWindow):
     """Main window for the automata application."""
     
@@ -33,8 +202,21 @@ class MainWindow(QMainWindow):
         super().__init__()
         
         self.settings = QSettings("AutomataProject", "Automata Visualizer")
-        self.setup_ui()
-        self.apply_styles()
+        # Saved theme name, kept in memory so toggling does not read the settings
+        self._theme = self.settings.value("theme", "light")
+        self._app_font = None
+        self._about_box = None
+        # Window state as last read from or written to the settings
+        self._saved_geometry = None
+        self._saved_splitter = None
+        
+        # Build and style the whole window before allowing any repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self.setup_ui()
+            self.apply_styles()
+        finally:
+            self.setUpdatesEnabled(True)
         
     def setup_ui(self):
         """Initialize the UI components."""
@@ -42,20 +224,20 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(1200, 800)
         
         # Set app icon if available
-        icon_path = os.path.join(os.path.dirname(__file__), "../assets/icon.png")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        app_icon = _app_icon()
+        if app_icon is not None:
+            self.setWindowIcon(app_icon)
         
-        # Restore window geometry
-        if self.settings.contains("geometry"):
-            self.restoreGeometry(self.settings.value("geometry"))
-        else:
-            self.center_window()
+        # Start centered; the saved geometry is applied once it has been read
+        self.center_window()
         
         # Setup central widget and main layout
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
         
+        # statusBar() creates the bar on first call; keep it so the tabs can reuse it
+        self.status_bar = self.statusBar()
+        
         # Create the main splitter
         self.main_splitter = QSplitter(Qt.Horizontal)
         self.main_splitter.setHandleWidth(2)  # Thin splitter handle
@@ -71,7 +253,7 @@ class MainWindow(QMainWindow):
         # Create the visualization panel with a border
         self.visualization_panel = QWidget()
         self.visualization_panel.setObjectName("visualizationPanel")
-        self.visualization_layout = QVBoxLayout(self.visualization_panel)
+        self.visualization_layout = QVBoxLayout()
         self.visualization_layout.setContentsMargins(10, 10, 10, 10)
         
         # Add a header for the visualization panel
@@ -84,24 +266,42 @@ class MainWindow(QMainWindow):
         self.visualization_label.setAlignment(Qt.AlignCenter)
         self.visualization_label.setObjectName("visualizationLabel")
         self.visualization_layout.addWidget(self.visualization_label)
+        self.visualization_panel.setLayout(self.visualization_layout)
         
         # Create the right panel with tabs
         self.right_panel = QTabWidget()
         self.right_panel.setObjectName("rightPanel")
-        self.right_panel.setDocumentMode(True)  # Cleaner tab appearance
         self.right_panel.setTabPosition(QTabWidget.North)
+        # Document mode and expanding tabs restyle and relayout the bar on every resize
+        tab_bar = self.right_panel.tabBar()
+        tab_bar.setExpanding(False)
+        tab_bar.setUsesScrollButtons(False)
         
-        # Create tabs
+        # Create tabs; only the Automata tab is shown at startup, the others
+        # are built the first time they are opened or accessed
         self.automaton_tab = AutomatonTab(self)
-        self.editor_tab = EditorTab(self)
-        self.analysis_tab = AnalysisTab(self)
-        self.word_processing_tab = WordProcessingTab(self)
+        self._tab_factories = {
+            EDITOR_TAB_INDEX: ("Editor", EditorTab),
+            ANALYSIS_TAB_INDEX: ("Analysis", AnalysisTab),
+            WORD_PROCESSING_TAB_INDEX: ("Word Processing", WordProcessingTab),
+        }
+        self._built_tabs = {}
+        
+        # Automaton last selected in the Automata tab, and the one the analysis
+        # and word processing tabs should show (which follows editor changes)
+        self._selected_automaton = None
+        self._current_automaton = None
+        # Mirror of the editor's unsaved-changes flag, read when closing
+        self._editor_dirty = False
         
         # Add tabs to the right panel
         self.right_panel.addTab(self.automaton_tab, "Automata")
-        self.right_panel.addTab(self.editor_tab, "Editor")
-        self.right_panel.addTab(self.analysis_tab, "Analysis")
-        self.right_panel.addTab(self.word_processing_tab, "Word Processing")
+        for index in sorted(self._tab_factories):
+            self.right_panel.addTab(QWidget(), self._tab_factories[index][0])
+        self.right_panel.currentChanged.connect(self._materialize_tab)
+        
+        # Connect signals between tabs
+        self.automaton_tab.automaton_selected.connect(self._on_automaton_selected)
         
         # Add panels to the splitter
         self.main_splitter.addWidget(self.visualization_panel)
@@ -109,320 +309,187 @@ class MainWindow(QMainWindow):
         self.main_splitter.setSizes([600, 600])  # Initial sizes
         
         # Main layout
-        self.main_layout = QVBoxLayout(self.central_widget)
+        # Layouts are filled before being installed, so the widget updates its geometry once
+        self.main_layout = QVBoxLayout()
         self.main_layout.setContentsMargins(6, 6, 6, 6)
         self.main_layout.setSpacing(0)
         self.main_layout.addWidget(self.main_splitter)
+        self.central_widget.setLayout(self.main_layout)
         
         # Create status bar with styling
-        self.statusBar().setObjectName("statusBar")
-        self.statusBar().showMessage("Ready")
+        self.status_bar.setObjectName("statusBar")
+        self.status_bar.showMessage("Ready")
         
         # Create menu bar
         self.create_menu_bar()
         
-        # Restore splitter state
-        if self.settings.contains("splitter"):
-            self.main_splitter.restoreState(self.settings.value("splitter"))
+        # Read the saved window state off the GUI thread
+        loader = _SettingsLoader()
+        loader.signals.loaded.connect(self._restore_saved_state)
+        QThreadPool.globalInstance().start(loader)
+    
+    @pyqtSlot(object, object)
+    def _restore_saved_state(self, geometry, splitter_state):
+        """Restore the window geometry and splitter sizes saved by the previous session."""
+        self._saved_geometry = geometry
+        self._saved_splitter = splitter_state
+        if geometry is not None:
+            self.restoreGeometry(geometry)
+        if splitter_state is not None:
+            self.main_splitter.restoreState(splitter_state)
+    
+    @property
+    def editor_tab(self):
+        """The editor tab, built on first access."""
+        return self._materialize_tab(EDITOR_TAB_INDEX)
+    
+    @property
+    def analysis_tab(self):
+        """The analysis tab, built on first access."""
+        return self._materialize_tab(ANALYSIS_TAB_INDEX)
+    
+    @property
+    def word_processing_tab(self):
+        """The word processing tab, built on first access."""
+        return self._materialize_tab(WORD_PROCESSING_TAB_INDEX)
+    
+    def _materialize_tab(self, index):
+        """
+        Create the tab at the given index if it is still a placeholder.
+        
+        Args:
+            index: Index of the tab in the right panel
+        
+        Returns:
+            The tab widget
+        """
+        if index in self._built_tabs:
+            return self._built_tabs[index]
+        if index not in self._tab_factories:
+            return self.right_panel.widget(index)
+        
+        title, tab_class = self._tab_factories[index]
+        tab = tab_class(self)
+        self._built_tabs[index] = tab
+        
+        if index == EDITOR_TAB_INDEX:
+            tab.automaton_changed.connect(self._on_automaton_edited)
+            tab.dirty_changed.connect(self._on_editor_dirty_changed)
+            if self._selected_automaton:
+                tab.set_current_automaton(self._selected_automaton)
+        else:
+            if index == ANALYSIS_TAB_INDEX:
+                tab.automaton_created.connect(self.automaton_tab.refresh_automaton_list)
+            if self._current_automaton:
+                tab.set_current_automaton(self._current_automaton)
+        
+        self._replace_placeholder(index, tab, title)
+        return tab
+    
+    def _replace_placeholder(self, index, tab, title):
+        """Swap the placeholder widget at an index for the real tab."""
+        placeholder = self.right_panel.widget(index)
+        current = self.right_panel.currentIndex()
+        
+        self.right_panel.blockSignals(True)
+        self.right_panel.insertTab(index, tab, title)
+        self.right_panel.removeTab(index + 1)
+        self.right_panel.setCurrentIndex(current)
+        self.right_panel.blockSignals(False)
+        
+        placeholder.deleteLater()
+    
+    def _on_automaton_selected(self, automaton):
+        """Forward an automaton selected in the Automata tab to the built tabs."""
+        # Nothing to do if the tabs already show this very object
+        if automaton is self._selected_automaton and automaton is self._current_automaton:
+            return
+        self._selected_automaton = automaton
+        self._current_automaton = automaton
+        for tab in self._built_tabs.values():
+            tab.set_current_automaton(automaton)
+    
+    def _on_automaton_edited(self, automaton):
+        """Forward an automaton modified in the editor to the built tabs."""
+        self._current_automaton = automaton
+        for index, tab in self._built_tabs.items():
+            if index != EDITOR_TAB_INDEX:
+                tab.set_current_automaton(automaton)
+    
+    @pyqtSlot(bool)
+    def _on_editor_dirty_changed(self, dirty):
+        """Track whether the editor holds unsaved changes."""
+        self._editor_dirty = dirty
     
     def apply_styles(self):
         """Apply modern styling to the application."""
-        # Set application font
-        app_font = QFont("Segoe UI", 9)
-        QApplication.setFont(app_font)
+        # Set application font, created once on first use
+        if self._app_font is None:
+            self._app_font = QFont("Segoe UI", 9)
+        QApplication.setFont(self._app_font)
         
         # Apply stylesheet
-        self.setStyleSheet(f"""
-            /* Main Window */
-            QMainWindow {{
-                background-color: {COLORS['light']};
-                color: {COLORS['dark']};
-            }}
-            
-            /* Panels */
-            #visualizationPanel {{
-                background-color: white;
-                border: 1px solid {COLORS['border']};
-                border-radius: 4px;
-            }}
-            
-            #rightPanel {{
-                background-color: white;
-                border: 1px solid {COLORS['border']};
-                border-radius: 4px;
-            }}
-            
-            /* Labels */
-            #panelHeader {{
-                font-size: 14px;
-                font-weight: bold;
-                color: {COLORS['primary']};
-                padding: 5px;
-                border-bottom: 1px solid {COLORS['border']};
-                margin-bottom: 10px;
-            }}
-            
-            #visualizationLabel {{
-                color: {COLORS['secondary']};
-                font-size: 13px;
-            }}
-            
-            /* Tabs */
-            QTabWidget::pane {{
-                border: 1px solid {COLORS['border']};
-                border-radius: 4px;
-                top: -1px;
-            }}
-            
-            QTabBar::tab {{
-                background-color: {COLORS['light']};
-                color: {COLORS['dark']};
-                border: 1px solid {COLORS['border']};
-                border-bottom: none;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-                padding: 8px 12px;
-                margin-right: 2px;
-            }}
-            
-            QTabBar::tab:selected {{
-                background-color: white;
-                border-bottom: 2px solid {COLORS['accent']};
-                font-weight: bold;
-            }}
-            
-            QTabBar::tab:hover {{
-                background-color: #d6dbdf;
-            }}
-            
-            /* Buttons */
-            QPushButton {{
-                background-color: {COLORS['accent']};
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 6px 12px;
-                font-weight: bold;
-            }}
-            
-            QPushButton:hover {{
-                background-color: #2980b9;
-            }}
-            
-            QPushButton:pressed {{
-                background-color: #1f6aa5;
-            }}
-            
-            QPushButton:disabled {{
-                background-color: #bdc3c7;
-                color: #7f8c8d;
-            }}
-            
-            /* ComboBox */
-            QComboBox {{
-                border: 1px solid {COLORS['border']};
-                border-radius: 4px;
-                padding: 5px;
-                background-color: white;
-            }}
-            
-            QComboBox::drop-down {{
-                border: none;
-                width: 20px;
-            }}
-            
-            /* Line Edit */
-            QLineEdit {{
-                border: 1px solid {COLORS['border']};
-                border-radius: 4px;
-                padding: 5px;
-                background-color: white;
-            }}
-            
-            QLineEdit:focus {{
-                border: 1px solid {COLORS['accent']};
-            }}
-            
-            /* List Widget */
-            QListWidget {{
-                border: 1px solid {COLORS['border']};
-                border-radius: 4px;
-                padding: 5px;
-                background-color: white;
-            }}
-            
-            QListWidget::item {{
-                padding: 5px;
-                border-radius: 3px;
-            }}
-            
-            QListWidget::item:selected {{
-                background-color: {COLORS['accent']};
-                color: white;
-            }}
-            
-            /* Status Bar */
-            #statusBar {{
-                background-color: {COLORS['primary']};
-                color: white;
-                padding: 5px;
-            }}
-            
-            /* Menu Bar */
-            QMenuBar {{
-                background-color: {COLORS['primary']};
-                color: white;
-            }}
-            
-            QMenuBar::item {{
-                background-color: transparent;
-                padding: 6px 10px;
-            }}
-            
-            QMenuBar::item:selected {{
-                background-color: {COLORS['secondary']};
-            }}
-            
-            QMenu {{
-                background-color: white;
-                border: 1px solid {COLORS['border']};
-            }}
-            
-            QMenu::item {{
-                padding: 6px 20px 6px 20px;
-            }}
-            
-            QMenu::item:selected {{
-                background-color: {COLORS['accent']};
-                color: white;
-            }}
-            
-            /* Text Edit */
-            QTextEdit {{
-                border: 1px solid {COLORS['border']};
-                border-radius: 4px;
-                background-color: white;
-            }}
-            
-            /* Scroll Bar */
-            QScrollBar:vertical {{
-                border: none;
-                background-color: #f0f0f0;
-                width: 12px;
-                margin: 0px;
-            }}
-            
-            QScrollBar::handle:vertical {{
-                background-color: {COLORS['border']};
-                border-radius: 6px;
-                min-height: 20px;
-            }}
-            
-            QScrollBar::handle:vertical:hover {{
-                background-color: {COLORS['accent']};
-            }}
-            
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical,
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
-                height: 0px;
-                background: none;
-            }}
-            
-            QScrollBar:horizontal {{
-                border: none;
-                background-color: #f0f0f0;
-                height: 12px;
-                margin: 0px;
-            }}
-            
-            QScrollBar::handle:horizontal {{
-                background-color: {COLORS['border']};
-                border-radius: 6px;
-                min-width: 20px;
-            }}
-            
-            QScrollBar::handle:horizontal:hover {{
-                background-color: {COLORS['accent']};
-            }}
-            
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal,
-            QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {{
-                width: 0px;
-                background: none;
-            }}
-        """)
+        self.setStyleSheet(build_stylesheet(LIGHT_THEME))
     
     def create_menu_bar(self):
         """Create the menu bar."""
-        # File menu
-        file_menu = self.menuBar().addMenu("&File")
-        
-        new_action = QAction("&New Automaton", self)
-        new_action.setShortcut("Ctrl+N")
-        new_action.triggered.connect(self.new_automaton)
-        file_menu.addAction(new_action)
-        
-        open_action = QAction("&Open Automaton", self)
-        open_action.setShortcut("Ctrl+O")
-        open_action.triggered.connect(self.open_automaton)
-        file_menu.addAction(open_action)
-        
-        save_action = QAction("&Save Automaton", self)
-        save_action.setShortcut("Ctrl+S")
-        save_action.triggered.connect(self.save_automaton)
-        file_menu.addAction(save_action)
-        
-        save_as_action = QAction("Save Automaton &As...", self)
-        save_as_action.setShortcut("Ctrl+Shift+S")
-        save_as_action.triggered.connect(self.save_automaton_as)
-        file_menu.addAction(save_as_action)
-        
-        file_menu.addSeparator()
-        
-        export_action = QAction("E&xport Image", self)
-        export_action.setShortcut("Ctrl+E")
-        export_action.triggered.connect(self.export_image)
-        file_menu.addAction(export_action)
-        
-        file_menu.addSeparator()
-        
-        exit_action = QAction("E&xit", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-        
-        # View menu
-        view_menu = self.menuBar().addMenu("&View")
-        
-        toggle_theme_action = QAction("Toggle &Dark Mode", self)
-        toggle_theme_action.setShortcut("Ctrl+D")
-        toggle_theme_action.triggered.connect(self.toggle_theme)
-        view_menu.addAction(toggle_theme_action)
-        
-        # Help menu
-        help_menu = self.menuBar().addMenu("&Help")
+        # Only the File menu is needed for the first paint; the rest is
+        # built once the event loop is running
+        self._add_menus(MENU_SPEC[:1])
+        QTimer.singleShot(0, self._build_remaining_menus)
+    
+    @pyqtSlot()
+    def _build_remaining_menus(self):
+        """Create the menus after the File menu."""
+        self._add_menus(MENU_SPEC[1:])
+    
+    def _add_menus(self, spec):
+        """
+        Append menus to the menu bar.
         
-        about_action = QAction("&About", self)
-        about_action.triggered.connect(self.show_about)
-        help_menu.addAction(about_action)
+        Args:
+            spec: List of (menu title, entries) pairs in the MENU_SPEC format
+        """
+        # Slots are looked up by name on this window; they reach the tabs
+        # through the lazy accessors, so no tab is built until an action fires
+        for menu_title, entries in spec:
+            menu = self.menuBar().addMenu(menu_title)
+            for entry in entries:
+                if entry is None:
+                    menu.addSeparator()
+                    continue
+                
+                text, shortcut, slot_name, icon = entry
+                action = QAction(text, self)
+                if icon is not None:
+                    action.setIcon(_action_icon(icon))
+                if shortcut:
+                    action.setShortcut(shortcut)
+                action.triggered.connect(getattr(self, slot_name))
+                menu.addAction(action)
     
+    @pyqtSlot()
     def new_automaton(self):
         """Create a new automaton."""
         self.editor_tab.create_new_automaton()
-        self.right_panel.setCurrentIndex(1)  # Switch to editor tab
+        self.right_panel.setCurrentIndex(EDITOR_TAB_INDEX)  # Switch to editor tab
     
+    @pyqtSlot()
     def open_automaton(self):
         """Open an existing automaton."""
         self.automaton_tab.load_automaton()
     
+    @pyqtSlot()
     def save_automaton(self):
         """Save the current automaton."""
         self.editor_tab.save_current_automaton()
     
+    @pyqtSlot()
     def save_automaton_as(self):
         """Save the current automaton with a new name."""
         self.editor_tab.save_current_automaton_as()
     
+    @pyqtSlot()
     def export_image(self):
         """Export the current automaton visualization as an image."""
         current_automaton = self.automaton_tab.get_current_automaton()
@@ -438,305 +505,79 @@ class MainWindow(QMainWindow):
         if file_path:
             format_type = "png" if selected_filter == "PNG (*.png)" else "svg"
             save_automaton_image(current_automaton, file_path, format=format_type)
-            self.statusBar().showMessage(f"Image exported to {file_path}")
+            self.status_bar.showMessage(f"Image exported to {file_path}")
     
+    @pyqtSlot()
     def toggle_theme(self):
         """Toggle between light and dark mode."""
-        # Check current theme
-        current_theme = self.settings.value("theme", "light")
-        
-        # Toggle theme
-        if current_theme == "light":
-            # Switch to dark theme
-            self.settings.setValue("theme", "dark")
-            self.apply_dark_theme()
-            self.statusBar().showMessage("Dark theme applied")
-        else:
-            # Switch to light theme
-            self.settings.setValue("theme", "light")
-            self.apply_styles()  # Default is light
-            self.statusBar().showMessage("Light theme applied")
+        # Toggle theme; the restyle cascades to every widget, so repaint once at the end
+        self.setUpdatesEnabled(False)
+        try:
+            if self._theme == "light":
+                # Switch to dark theme
+                self._theme = "dark"
+                self.settings.setValue("theme", "dark")
+                self.apply_dark_theme()
+                self.status_bar.showMessage("Dark theme applied")
+            else:
+                # Switch to light theme
+                self._theme = "light"
+                self.settings.setValue("theme", "light")
+                self.apply_styles()  # Default is light
+                self.status_bar.showMessage("Light theme applied")
+        finally:
+            self.setUpdatesEnabled(True)
     
     def apply_dark_theme(self):
         """Apply dark theme to the application."""
-        dark_colors = {
-            'primary': '#1a1a2e',     # Very dark blue
-            'secondary': '#16213e',   # Dark blue
-            'accent': '#0f3460',      # Darker accent
-            'text': '#e1e1e1',        # Light gray for text
-            'background': '#121212',  # Very dark gray almost black
-            'border': '#333333',      # Dark gray for borders
-            'highlight': '#8BC34A',   # Bright green for highlight
-        }
-        
-        self.setStyleSheet(f"""
-            /* Main Window */
-            QMainWindow {{
-                background-color: {dark_colors['background']};
-                color: {dark_colors['text']};
-            }}
-            
-            /* Panels */
-            #visualizationPanel {{
-                background-color: {dark_colors['secondary']};
-                border: 1px solid {dark_colors['border']};
-                border-radius: 4px;
-            }}
-            
-            #rightPanel {{
-                background-color: {dark_colors['secondary']};
-                border: 1px solid {dark_colors['border']};
-                border-radius: 4px;
-            }}
-            
-            /* Labels */
-            #panelHeader {{
-                font-size: 14px;
-                font-weight: bold;
-                color: {dark_colors['text']};
-                padding: 5px;
-                border-bottom: 1px solid {dark_colors['border']};
-                margin-bottom: 10px;
-            }}
-            
-            #visualizationLabel {{
-                color: {dark_colors['text']};
-                font-size: 13px;
-            }}
-            
-            /* Tabs */
-            QTabWidget::pane {{
-                border: 1px solid {dark_colors['border']};
-                border-radius: 4px;
-                top: -1px;
-                background-color: {dark_colors['secondary']};
-            }}
-            
-            QTabBar::tab {{
-                background-color: {dark_colors['primary']};
-                color: {dark_colors['text']};
-                border: 1px solid {dark_colors['border']};
-                border-bottom: none;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-                padding: 8px 12px;
-                margin-right: 2px;
-            }}
-            
-            QTabBar::tab:selected {{
-                background-color: {dark_colors['secondary']};
-                border-bottom: 2px solid {dark_colors['highlight']};
-                font-weight: bold;
-            }}
-            
-            QTabBar::tab:hover {{
-                background-color: #2a2a4a;
-            }}
-            
-            /* Buttons */
-            QPushButton {{
-                background-color: {dark_colors['accent']};
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 6px 12px;
-                font-weight: bold;
-            }}
-            
-            QPushButton:hover {{
-                background-color: #1a4870;
-            }}
-            
-            QPushButton:pressed {{
-                background-color: #0c2635;
-            }}
-            
-            QPushButton:disabled {{
-                background-color: #404040;
-                color: #707070;
-            }}
-            
-            /* All widgets */
-            QWidget {{
-                background-color: {dark_colors['secondary']};
-                color: {dark_colors['text']};
-            }}
-            
-            /* ComboBox */
-            QComboBox {{
-                border: 1px solid {dark_colors['border']};
-                border-radius: 4px;
-                padding: 5px;
-                background-color: {dark_colors['primary']};
-                color: {dark_colors['text']};
-            }}
-            
-            QComboBox::drop-down {{
-                border: none;
-                width: 20px;
-            }}
-            
-            QComboBox QAbstractItemView {{
-                background-color: {dark_colors['primary']};
-                color: {dark_colors['text']};
-                selection-background-color: {dark_colors['accent']};
-            }}
-            
-            /* Line Edit */
-            QLineEdit {{
-                border: 1px solid {dark_colors['border']};
-                border-radius: 4px;
-                padding: 5px;
-                background-color: {dark_colors['primary']};
-                color: {dark_colors['text']};
-            }}
-            
-            QLineEdit:focus {{
-                border: 1px solid {dark_colors['highlight']};
-            }}
-            
-            /* List Widget */
-            QListWidget {{
-                border: 1px solid {dark_colors['border']};
-                border-radius: 4px;
-                padding: 5px;
-                background-color: {dark_colors['primary']};
-                color: {dark_colors['text']};
-            }}
-            
-            QListWidget::item {{
-                padding: 5px;
-                border-radius: 3px;
-            }}
-            
-            QListWidget::item:selected {{
-                background-color: {dark_colors['accent']};
-                color: white;
-            }}
-            
-            /* Status Bar */
-            #statusBar {{
-                background-color: {dark_colors['primary']};
-                color: {dark_colors['text']};
-                padding: 5px;
-            }}
-            
-            /* Menu Bar */
-            QMenuBar {{
-                background-color: {dark_colors['primary']};
-                color: {dark_colors['text']};
-            }}
-            
-            QMenuBar::item {{
-                background-color: transparent;
-                padding: 6px 10px;
-            }}
-            
-            QMenuBar::item:selected {{
-                background-color: {dark_colors['accent']};
-            }}
-            
-            QMenu {{
-                background-color: {dark_colors['primary']};
-                color: {dark_colors['text']};
-                border: 1px solid {dark_colors['border']};
-            }}
-            
-            QMenu::item {{
-                padding: 6px 20px 6px 20px;
-            }}
-            
-            QMenu::item:selected {{
-                background-color: {dark_colors['accent']};
-                color: white;
-            }}
-            
-            /* Text Edit */
-            QTextEdit {{
-                border: 1px solid {dark_colors['border']};
-                border-radius: 4px;
-                background-color: {dark_colors['primary']};
-                color: {dark_colors['text']};
-            }}
-            
-            /* Scroll Bar */
-            QScrollBar:vertical {{
-                border: none;
-                background-color: {dark_colors['primary']};
-                width: 12px;
-                margin: 0px;
-            }}
-            
-            QScrollBar::handle:vertical {{
-                background-color: {dark_colors['border']};
-                border-radius: 6px;
-                min-height: 20px;
-            }}
-            
-            QScrollBar::handle:vertical:hover {{
-                background-color: {dark_colors['accent']};
-            }}
-            
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical,
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
-                height: 0px;
-                background: none;
-            }}
-            
-            QScrollBar:horizontal {{
-                border: none;
-                background-color: {dark_colors['primary']};
-                height: 12px;
-                margin: 0px;
-            }}
-            
-            QScrollBar::handle:horizontal {{
-                background-color: {dark_colors['border']};
-                border-radius: 6px;
-                min-width: 20px;
-            }}
-            
-            QScrollBar::handle:horizontal:hover {{
-                background-color: {dark_colors['accent']};
-            }}
-            
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal,
-            QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {{
-                width: 0px;
-                background: none;
-            }}
-        """)
+        self.setStyleSheet(build_stylesheet(DARK_THEME, "dark_extra.qss"))
     
+    @pyqtSlot()
     def show_about(self):
         """Show about dialog with improved styling."""
-        about_text = """
-        <div style="text-align: center;">
-            <h2 style="color: #3498db;">Automata Visualizer & Simulator</h2>
-            <p>A powerful tool for visualizing and analyzing finite automata.</p>
-            <p>Create, edit, and simulate automata with a modern interface.</p>
-            <p><small>Version 1.0</small></p>
-            <p><small>© 2025 Academic Project</small></p>
-        </div>
-        """
-        
-        QMessageBox.about(self, "About Automata Visualizer", about_text)
+        # The rich text is laid out once; later calls reopen the same dialog
+        if self._about_box is None:
+            self._about_box = QMessageBox(self)
+            self._about_box.setWindowTitle("About Automata Visualizer")
+            self._about_box.setTextFormat(Qt.RichText)
+            self._about_box.setText(ABOUT_HTML)
+            icon = self.windowIcon()
+            self._about_box.setIconPixmap(icon.pixmap(icon.actualSize(QSize(64, 64))))
+        
+        self._about_box.exec_()
     
     def center_window(self):
         """Center the window on the screen."""
         geometry = self.frameGeometry()
-        screen = QApplication.desktop().screenNumber(QApplication.desktop().cursor().pos())
-        center_point = QApplication.desktop().screenGeometry(screen).center()
+        desktop = QApplication.desktop()
+        screen = desktop.screenNumber(desktop.cursor().pos())
+        center_point = desktop.screenGeometry(screen).center()
         geometry.moveCenter(center_point)
         self.move(geometry.topLeft())
     
     def closeEvent(self, event):
         """Handle the close event."""
-        # Save window state
-        self.settings.setValue("geometry", self.saveGeometry())
-        self.settings.setValue("splitter", self.main_splitter.saveState())
+        # Save window state, writing only the values that changed
+        geometry = self.saveGeometry()
+        splitter_state = self.main_splitter.saveState()
+        changed = False
+        if geometry != self._saved_geometry:
+            self.settings.setValue("geometry", geometry)
+            self._saved_geometry = geometry
+            changed = True
+        if splitter_state != self._saved_splitter:
+            self.settings.setValue("splitter", splitter_state)
+            self._saved_splitter = splitter_state
+            changed = True
+        if changed:
+            self.settings.sync()
         
         # Confirm exit if there are unsaved changes
-        if self.editor_tab.has_unsaved_changes():
+        # A name edit still waiting on its debounce timer counts as a change
+        editor_tab = self._built_tabs.get(EDITOR_TAB_INDEX)
+        if editor_tab is not None:
+            editor_tab.flush_name_edit()
+        if self._editor_dirty:
             reply = QMessageBox.question(
                 self, 'Confirm Exit',
                 "You have unsaved changes. Are you sure you want to exit?",
@@ -748,4 +589,7 @@ class MainWindow(QMainWindow):
                 event.ignore()
                 return
         
+        # Permanently remove automata deleted during this session
+        self.automaton_tab.empty_trash()
+        
         event.accept() 
\ No newline at end of file
@@ -0,0 +1,203 @@
+from typing import List, Tuple
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+from AutomataProject.automata.state import State
+from AutomataProject.automata.transition import Transition
+
+class StatesModel(QAbstractTableModel):
+    """Table model exposing the states of an automaton."""
+    
+    HEADERS = ["Name", "Initial", "Final"]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._states = []
+        # Display text of each row, computed once when the row is added
+        self._rows = []
+    
+    def set_states(self, states):
+        """
+        Replace all rows of the model.
+        
+        Args:
+            states: Iterable of states to display
+        """
+        self.beginResetModel()
+        self._states = list(states)
+        self._rows = [self._row(state) for state in self._states]
+        self.endResetModel()
+    
+    def append_state(self, state: State) -> None:
+        """
+        Add a row at the end of the model.
+        
+        Args:
+            state: State to display
+        """
+        row = len(self._states)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._states.append(state)
+        self._rows.append(self._row(state))
+        self.endInsertRows()
+    
+    def remove_row(self, row: int) -> None:
+        """
+        Remove a single row from the model.
+        
+        Args:
+            row: Row index
+        """
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._states[row]
+        del self._rows[row]
+        self.endRemoveRows()
+    
+    @staticmethod
+    def _row(state: State) -> Tuple[str, str, str]:
+        """Build the display text of a state row."""
+        return (state.name,
+                "Yes" if state.is_initial else "No",
+                "Yes" if state.is_final else "No")
+    
+    def state_at(self, row: int) -> State:
+        """
+        Get the state displayed in a row.
+        
+        Args:
+            row: Row index
+        
+        Returns:
+            The state in that row
+        """
+        return self._states[row]
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._states)
+    
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        # Views query many roles on every paint; only the display text and
+        # the State object itself (UserRole) are provided
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.UserRole:
+            return self._states[index.row()]
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+class TransitionsModel(QAbstractTableModel):
+    """Table model exposing the transitions of an automaton."""
+    
+    HEADERS = ["From", "Symbol", "To"]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._transitions = []
+        # Display text of each row, computed once when the row is added
+        self._rows = []
+    
+    def set_transitions(self, transitions):
+        """
+        Replace all rows of the model.
+        
+        Args:
+            transitions: Iterable of transitions to display
+        """
+        self.beginResetModel()
+        self._transitions = list(transitions)
+        self._rows = [(t.from_state.name, t.symbol, t.to_state.name) for t in self._transitions]
+        self.endResetModel()
+    
+    def append_transition(self, transition: Transition) -> None:
+        """
+        Add a row at the end of the model.
+        
+        Args:
+            transition: Transition to display
+        """
+        row = len(self._transitions)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._transitions.append(transition)
+        self._rows.append((transition.from_state.name, transition.symbol, transition.to_state.name))
+        self.endInsertRows()
+    
+    def remove_row(self, row: int) -> None:
+        """
+        Remove a single row from the model.
+        
+        Args:
+            row: Row index
+        """
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._transitions[row]
+        del self._rows[row]
+        self.endRemoveRows()
+    
+    def remove_transitions_of(self, state: State) -> List[Transition]:
+        """
+        Remove every row whose transition starts or ends at a state.
+        
+        Args:
+            state: State whose transitions are removed
+        
+        Returns:
+            The removed transitions
+        """
+        removed = []
+        for row in reversed(range(len(self._transitions))):
+            transition = self._transitions[row]
+            if transition.from_state == state or transition.to_state == state:
+                removed.append(transition)
+                self.remove_row(row)
+        return removed
+    
+    def transition_at(self, row: int) -> Transition:
+        """
+        Get the transition displayed in a row.
+        
+        Args:
+            row: Row index
+        
+        Returns:
+            The transition in that row
+        """
+        return self._transitions[row]
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._transitions)
+    
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        # Views query many roles on every paint; only the display text and
+        # the Transition object itself (UserRole) are provided
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.UserRole:
+            return self._transitions[index.row()]
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
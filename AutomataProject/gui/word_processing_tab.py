@@ -4,13 +4,51 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
 from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QFont
 
+import io
 import os
 import datetime
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+import logging
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
 
 from AutomataProject.automata.automaton import Automaton
-from AutomataProject.utils.visualization import animate_word_processing, node_positions, visualize_automaton
+from AutomataProject.automata.simulation import CompiledAutomaton
+from AutomataProject.utils.visualization import (COLOR_PALETTE, compute_animation_trace, save_animation_frames,
+                                                 save_animation_html, save_animation_video, set_frame_title,
+                                                 video_export_available, visualize_automaton)
+
+_log = logging.getLogger(__name__)
+
+# Rules shared by every group box and button of the tab, set once on the tab itself
+TAB_STYLE = """
+    QGroupBox { font-weight: bold; }
+    QPushButton { padding: 4px 8px; }
+"""
+
+# Word result label styles
+RESULT_STYLE_NEUTRAL = "QLabel { background-color: #f5f5f5; padding: 5px; border-radius: 3px; }"
+RESULT_STYLE_INFO = "QLabel { background-color: #e8f0fe; padding: 5px; border-radius: 3px; }"
+RESULT_STYLE_WARN = "QLabel { background-color: #fff8e1; padding: 5px; border-radius: 3px; color: #856404; }"
+RESULT_STYLE_ACCEPT = "QLabel { background-color: #e8f5e9; padding: 5px; border-radius: 3px; color: green; font-weight: bold; }"
+RESULT_STYLE_REJECT = "QLabel { background-color: #ffebee; padding: 5px; border-radius: 3px; color: red; font-weight: bold; }"
+
+FRAME_LABEL_STYLE = "QLabel { background-color: #f5f5f5; padding: 3px; border-radius: 3px; }"
+BORDERED_LIST_STYLE = "QListWidget { border: 1px solid #ddd; }"
+BORDERED_TEXT_STYLE = "QTextEdit { border: 1px solid #ddd; }"
+
+# Number of rendered animation frames kept for instant redisplay; each is a
+# full-canvas RGBA buffer of a few MB
+FRAME_CACHE_SIZE = 16
+
+# Most words generated for an infinite language, whose word count grows with every length
+GENERATED_WORDS_LIMIT = 1000
+
+@lru_cache(maxsize=1)
+def _bold_font():
+    """Get the bold font of the field labels, built once per process."""
+    font = QFont()
+    font.setBold(True)
+    return font
 
 class WordProcessingTab(QWidget):
     """Tab for word processing and language operations."""
@@ -19,8 +57,23 @@ class WordProcessingTab(QWidget):
         super().__init__(parent)
         self.parent = parent
         self.current_automaton = None
+        # Transition tables of the current automaton, built on the first word test
+        self._compiled = None
+        # str.translate table deleting every alphabet symbol, built on the first word check
+        self._alphabet_table = None
+        # Frames from compute_animation_trace, and the word they animate
         self.animation_frames = []
+        self.animation_word = ""
         self.current_frame = 0
+        # Canvas reused for every frame: the automaton is rendered once into a cached
+        # background and each frame only redraws the edges and the caption on top
+        self._canvas = None
+        self._canvas_automaton = None
+        self._edge_artists = {}
+        self._overlay_artists = []
+        self._background = None
+        # Frame index -> rendered canvas region, least recently shown first
+        self._frame_cache = OrderedDict()
         self.setup_ui()
     
     def setup_ui(self):
@@ -29,10 +82,10 @@ class WordProcessingTab(QWidget):
         self.layout = QVBoxLayout(self)
         self.layout.setSpacing(8)
         self.layout.setContentsMargins(10, 10, 10, 10)
+        self.setStyleSheet(TAB_STYLE)
         
         # Word testing section
         self.word_group = QGroupBox("Word Recognition")
-        self.word_group.setStyleSheet("QGroupBox { font-weight: bold; }")
         self.word_layout = QVBoxLayout(self.word_group)
         self.word_layout.setContentsMargins(10, 15, 10, 10)
         
@@ -48,15 +101,8 @@ class WordProcessingTab(QWidget):
         self.animate_word_button = QPushButton("Animate Processing")
         self.animate_word_button.clicked.connect(self.animate_word)
         
-        # Simple button styling
-        button_style = "QPushButton { padding: 4px 8px; }"
-        self.test_word_button.setStyleSheet(button_style)
-        self.animate_word_button.setStyleSheet(button_style)
-        
         word_label = QLabel("Word:")
-        bold_font = QFont()
-        bold_font.setBold(True)
-        word_label.setFont(bold_font)
+        word_label.setFont(_bold_font())
         
         self.word_input_layout.addWidget(word_label)
         self.word_input_layout.addWidget(self.word_input, 3)  # Give more space to the input
@@ -65,7 +111,7 @@ class WordProcessingTab(QWidget):
         
         self.word_result = QLabel("No word tested yet")
         self.word_result.setAlignment(Qt.AlignCenter)
-        self.word_result.setStyleSheet("QLabel { background-color: #f5f5f5; padding: 5px; border-radius: 3px; }")
+        self.word_result.setStyleSheet(RESULT_STYLE_NEUTRAL)
         
         self.word_layout.addLayout(self.word_input_layout)
         self.word_layout.addWidget(self.word_result)
@@ -74,7 +120,6 @@ class WordProcessingTab(QWidget):
         
         # Animation controls (initially hidden)
         self.animation_group = QGroupBox("Animation Controls")
-        self.animation_group.setStyleSheet("QGroupBox { font-weight: bold; }")
         self.animation_layout = QHBoxLayout(self.animation_group)
         self.animation_layout.setSpacing(8)
         
@@ -86,16 +131,11 @@ class WordProcessingTab(QWidget):
         
         self.animation_label = QLabel("Frame 0/0")
         self.animation_label.setAlignment(Qt.AlignCenter)
-        self.animation_label.setStyleSheet("QLabel { background-color: #f5f5f5; padding: 3px; border-radius: 3px; }")
+        self.animation_label.setStyleSheet(FRAME_LABEL_STYLE)
         
         self.save_animation_button = QPushButton("Save Animation")
         self.save_animation_button.clicked.connect(self.save_animation)
         
-        # Apply the same button styling
-        self.prev_frame_button.setStyleSheet(button_style)
-        self.next_frame_button.setStyleSheet(button_style)
-        self.save_animation_button.setStyleSheet(button_style)
-        
         self.animation_layout.addWidget(self.prev_frame_button)
         self.animation_layout.addWidget(self.animation_label)
         self.animation_layout.addWidget(self.next_frame_button)
@@ -106,7 +146,6 @@ class WordProcessingTab(QWidget):
         
         # Word generation section
         self.generation_group = QGroupBox("Word Generation")
-        self.generation_group.setStyleSheet("QGroupBox { font-weight: bold; }")
         self.generation_layout = QVBoxLayout(self.generation_group)
         self.generation_layout.setContentsMargins(10, 15, 10, 10)
         
@@ -114,7 +153,7 @@ class WordProcessingTab(QWidget):
         self.generation_input_layout.setSpacing(8)
         
         length_label = QLabel("Max Length:")
-        length_label.setFont(bold_font)
+        length_label.setFont(_bold_font())
         
         self.max_length_input = QSpinBox()
         self.max_length_input.setRange(1, 10)
@@ -122,7 +161,6 @@ class WordProcessingTab(QWidget):
         
         self.generate_button = QPushButton("Generate Words")
         self.generate_button.clicked.connect(self.generate_words)
-        self.generate_button.setStyleSheet(button_style)
         
         self.generation_input_layout.addWidget(length_label)
         self.generation_input_layout.addWidget(self.max_length_input)
@@ -133,20 +171,19 @@ class WordProcessingTab(QWidget):
         
         self.words_list = QListWidget()
         self.words_list.setAlternatingRowColors(True)
-        self.words_list.setStyleSheet("QListWidget { border: 1px solid #ddd; }")
+        self.words_list.setStyleSheet(BORDERED_LIST_STYLE)
         self.generation_layout.addWidget(self.words_list)
         
         self.layout.addWidget(self.generation_group)
         
         # Word statistics section
         self.stats_group = QGroupBox("Word Statistics")
-        self.stats_group.setStyleSheet("QGroupBox { font-weight: bold; }")
         self.stats_layout = QVBoxLayout(self.stats_group)
         self.stats_layout.setContentsMargins(10, 15, 10, 10)
         
         self.stats_text = QTextEdit()
         self.stats_text.setReadOnly(True)
-        self.stats_text.setStyleSheet("QTextEdit { border: 1px solid #ddd; }")
+        self.stats_text.setStyleSheet(BORDERED_TEXT_STYLE)
         self.stats_layout.addWidget(self.stats_text)
         
         self.layout.addWidget(self.stats_group)
@@ -154,12 +191,49 @@ class WordProcessingTab(QWidget):
     def set_current_automaton(self, automaton):
         """Set the current automaton for word processing."""
         self.current_automaton = automaton
+        # The automaton may have been edited in place, so compile and render it again next time
+        self._compiled = None
+        self._alphabet_table = None
+        self._canvas_automaton = None
         self.word_result.setText(f"Automaton: {automaton.name}")
-        self.word_result.setStyleSheet("QLabel { background-color: #e8f0fe; padding: 5px; border-radius: 3px; }")
+        self.word_result.setStyleSheet(RESULT_STYLE_INFO)
         self.words_list.clear()
         self.stats_text.clear()
         self.clear_animation()
     
+    def _compiled_automaton(self):
+        """Get the transition tables of the current automaton, compiling them on first use."""
+        if self._compiled is None:
+            self._compiled = CompiledAutomaton(self.current_automaton)
+        return self._compiled
+    
+    def _check_alphabet(self, word):
+        """
+        Check that a word only uses symbols of the current automaton's alphabet.
+        
+        Shows the offending symbols in the result label when it does not.
+        
+        Args:
+            word: Word to check
+        
+        Returns:
+            True if every symbol of the word is in the alphabet
+        """
+        # Deleting the alphabet symbols in one C-level pass leaves exactly the invalid
+        # characters; words are read one character per symbol, so only those can match
+        if self._alphabet_table is None:
+            symbols = [symbol for symbol in self.current_automaton.alphabet.symbols if len(symbol) == 1]
+            self._alphabet_table = str.maketrans("", "", "".join(symbols))
+        invalid_symbols = word.translate(self._alphabet_table)
+        if not invalid_symbols:
+            return True
+        
+        self.word_result.setText(
+            f"Word contains symbols not in the alphabet: {', '.join(invalid_symbols)}"
+        )
+        self.word_result.setStyleSheet(RESULT_STYLE_WARN)
+        return False
+    
     def test_word(self):
         """Test if the current automaton accepts a word."""
         if not self.current_automaton:
@@ -172,23 +246,18 @@ class WordProcessingTab(QWidget):
             return
         
         # Check if all symbols are in the alphabet
-        invalid_symbols = [symbol for symbol in word if symbol not in self.current_automaton.alphabet.symbols]
-        if invalid_symbols:
-            self.word_result.setText(
-                f"Word contains symbols not in the alphabet: {', '.join(invalid_symbols)}"
-            )
-            self.word_result.setStyleSheet("QLabel { background-color: #fff8e1; padding: 5px; border-radius: 3px; color: #856404; }")
+        if not self._check_alphabet(word):
             return
         
         # Test the word
-        accepted = self.current_automaton.accepts_word(word)
+        accepted = self._compiled_automaton().accepts(word)
         
         if accepted:
             self.word_result.setText(f"The word '{word}' is ACCEPTED by the automaton.")
-            self.word_result.setStyleSheet("QLabel { background-color: #e8f5e9; padding: 5px; border-radius: 3px; color: green; font-weight: bold; }")
+            self.word_result.setStyleSheet(RESULT_STYLE_ACCEPT)
         else:
             self.word_result.setText(f"The word '{word}' is REJECTED by the automaton.")
-            self.word_result.setStyleSheet("QLabel { background-color: #ffebee; padding: 5px; border-radius: 3px; color: red; font-weight: bold; }")
+            self.word_result.setStyleSheet(RESULT_STYLE_REJECT)
     
     def animate_word(self):
         """Animate the processing of a word by the automaton."""
@@ -202,29 +271,14 @@ class WordProcessingTab(QWidget):
             return
         
         # Check if all symbols are in the alphabet
-        invalid_symbols = [symbol for symbol in word if symbol not in self.current_automaton.alphabet.symbols]
-        if invalid_symbols:
-            self.word_result.setText(
-                f"Word contains symbols not in the alphabet: {', '.join(invalid_symbols)}"
-            )
-            self.word_result.setStyleSheet("QLabel { background-color: #fff8e1; padding: 5px; border-radius: 3px; color: #856404; }")
+        if not self._check_alphabet(word):
             return
         
         try:
-            # Reset any existing node positions to ensure we start with a clean state
-            if self.current_automaton.name in node_positions:
-                # We'll use the existing positions
-                pass
-            else:
-                # We'll create new positions that will be reused
-                # First visualize once to calculate and store positions
-                if len(node_positions) == 0:
-                    # Only do this pre-visualization if we don't have any positions yet
-                    fig = visualize_automaton(self.current_automaton, reuse_positions=True)
-                    plt.close(fig)  # Close this figure as it's just for setup
-            
-            # Generate animation frames (they will use the cached positions)
-            self.animation_frames = animate_word_processing(self.current_automaton, word)
+            # Describe the animation frames; each is only rendered when shown or saved
+            self.animation_frames = compute_animation_trace(self.current_automaton, word)
+            self._frame_cache.clear()
+            self.animation_word = word
             self.current_frame = 0
             
             # Show animation controls
@@ -238,29 +292,111 @@ class WordProcessingTab(QWidget):
             traceback.print_exc()
             self.show_message("Animation Error", f"Error creating animation: {str(e)}")
     
+    def _prepare_canvas(self):
+        """Render the current automaton into the animation canvas, unless it already shows it."""
+        if self._canvas is None:
+            # The Qt canvas is only needed once a word is animated
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+            self._canvas = FigureCanvas(Figure(figsize=(10, 8), facecolor=COLOR_PALETTE['background']))
+            self._canvas.mpl_connect('draw_event', self._on_canvas_drawn)
+        if self._canvas_automaton is self.current_automaton:
+            return
+        
+        figure = self._canvas.figure
+        figure.clear()
+        ax = figure.add_subplot(111)
+        ax.set_facecolor(COLOR_PALETTE['background'])
+        self._edge_artists = {}
+        visualize_automaton(self.current_automaton, ax=ax, edge_artists=self._edge_artists)
+        
+        # Edges change color between frames; everything drawn above them (nodes,
+        # labels, arrow heads) must be redrawn after them to keep the stacking order
+        for normal, highlighted in self._edge_artists.values():
+            for artist in normal:
+                artist.set_animated(True)
+        layers = list(ax.collections) + list(ax.patches) + list(ax.texts) + list(ax.artists)
+        overlay = [artist for artist in layers if artist.get_animated() or artist.get_zorder() > 1]
+        for artist in overlay:
+            artist.set_animated(True)
+        overlay.append(ax.title)
+        ax.title.set_animated(True)
+        self._overlay_artists = sorted(overlay, key=lambda artist: artist.get_zorder())
+        
+        self._canvas_automaton = self.current_automaton
+        self._background = None
+    
+    def _on_canvas_drawn(self, event):
+        """Cache the static part of the animation canvas after each full redraw."""
+        self._background = self._canvas.copy_from_bbox(self._canvas.figure.bbox)
+        # Rendered frames belong to the previous background (size, automaton)
+        self._frame_cache.clear()
+        self._draw_frame_overlay()
+    
+    def _draw_frame_overlay(self):
+        """Draw the current frame over the cached background."""
+        if self._background is None or not self.animation_frames:
+            return
+        
+        canvas = self._canvas
+        cached = self._frame_cache.get(self.current_frame)
+        if cached is not None:
+            # Shown before: put the rendered pixels back without drawing any artist
+            self._frame_cache.move_to_end(self.current_frame)
+            canvas.restore_region(cached)
+            canvas.blit(canvas.figure.bbox)
+            return
+        
+        frame = self.animation_frames[self.current_frame]
+        ax = canvas.figure.axes[0]
+        set_frame_title(ax, frame)
+        
+        # Each edge shows either its normal or its highlighted patches
+        taken = {(from_state, to_state) for from_state, to_state, _ in frame['path']}
+        hidden = set()
+        for edge, (normal, highlighted) in self._edge_artists.items():
+            hidden.update(map(id, normal if edge in taken else highlighted))
+        
+        canvas.restore_region(self._background)
+        for artist in self._overlay_artists:
+            if id(artist) not in hidden:
+                ax.draw_artist(artist)
+        
+        self._frame_cache[self.current_frame] = canvas.copy_from_bbox(canvas.figure.bbox)
+        if len(self._frame_cache) > FRAME_CACHE_SIZE:
+            self._frame_cache.popitem(last=False)
+        canvas.blit(canvas.figure.bbox)
+    
     def display_animation_frame(self, frame_index):
         """Display a specific animation frame."""
         if not self.animation_frames or frame_index < 0 or frame_index >= len(self.animation_frames):
             return
         
         try:
-            # Clear previous visualization
-            for i in reversed(range(self.parent.visualization_layout.count())):
-                widget = self.parent.visualization_layout.itemAt(i).widget()
-                if widget != self.parent.visualization_label:
-                    widget.setParent(None)
+            self._prepare_canvas()
+            layout = self.parent.visualization_layout
             
-            # Create canvas for the current frame
-            fig = self.animation_frames[frame_index]
-            canvas = FigureCanvas(fig)
+            # Clear previous visualization, keeping the animation canvas
+            for i in reversed(range(layout.count())):
+                widget = layout.itemAt(i).widget()
+                if widget not in (self.parent.visualization_label, self._canvas):
+                    widget.setParent(None)
             
             # Add to the visualization panel
-            self.parent.visualization_layout.addWidget(canvas)
+            if layout.indexOf(self._canvas) < 0:
+                layout.addWidget(self._canvas)
             
             # Update frame counter
             self.animation_label.setText(f"Frame {frame_index + 1}/{len(self.animation_frames)}")
             self.current_frame = frame_index
             
+            # A full redraw recaptures the background and draws the frame from
+            # _on_canvas_drawn; otherwise only the overlay is redrawn
+            if self._background is None:
+                self._canvas.draw_idle()
+            else:
+                self._draw_frame_overlay()
+            
             # Enable/disable navigation buttons
             self.prev_frame_button.setEnabled(frame_index > 0)
             self.next_frame_button.setEnabled(frame_index < len(self.animation_frames) - 1)
@@ -278,18 +414,28 @@ class WordProcessingTab(QWidget):
             self.display_animation_frame(self.current_frame + 1)
     
     def save_animation(self):
-        """Save all animation frames as images in an organized folder."""
+        """Save the animation as an animated file, or all its frames as images in an organized folder."""
         if not self.animation_frames:
             self.show_message("No Animation", "No animation to save.")
             return
         
+        animation_format = self._ask_animation_format()
+        if animation_format is None:
+            return
+        if animation_format == "html":
+            self.save_animation_html()
+            return
+        if animation_format != "png":
+            self.save_animation_video(animation_format)
+            return
+        
         parent_directory = QFileDialog.getExistingDirectory(
             self, "Select Directory for Animation", "Automates"
         )
         
         if parent_directory:
             try:
-                word = self.word_input.text().strip()
+                word = self.animation_word
                 # Create a specific folder for this animation
                 folder_name = f"{self.current_automaton.name}_{word}_animation"
                 animation_dir = os.path.join(parent_directory, folder_name)
@@ -298,11 +444,7 @@ class WordProcessingTab(QWidget):
                 os.makedirs(animation_dir, exist_ok=True)
                 
                 # Save frames with sequential numbers for easy ordering
-                for i, fig in enumerate(self.animation_frames):
-                    # Use padding zeros for proper ordering (01, 02, etc. instead of 1, 2)
-                    frame_number = str(i+1).zfill(2)
-                    filename = os.path.join(animation_dir, f"frame_{frame_number}.png")
-                    fig.savefig(filename, bbox_inches='tight')
+                save_animation_frames(self.current_automaton, self.animation_frames, animation_dir)
                 
                 # Create a README file with animation info
                 readme_path = os.path.join(animation_dir, "README.txt")
@@ -322,9 +464,69 @@ class WordProcessingTab(QWidget):
                 traceback.print_exc()
                 self.show_message("Save Error", f"Error saving animation: {str(e)}")
     
+    def _ask_animation_format(self):
+        """
+        Ask how to save the animation.
+        
+        Returns:
+            "png" for separate frames, "gif" or "mp4" for a single file, "html" for an
+            interactive web page, or None if cancelled
+        """
+        box = QMessageBox(self)
+        box.setWindowTitle("Save Animation")
+        box.setText("How do you want to save the animation?")
+        choices = {box.addButton("PNG Frames", QMessageBox.AcceptRole): "png",
+                   box.addButton("Animated GIF", QMessageBox.AcceptRole): "gif"}
+        # MP4 needs ffmpeg, which is not always installed
+        if video_export_available():
+            choices[box.addButton("MP4 Video", QMessageBox.AcceptRole)] = "mp4"
+        choices[box.addButton("Interactive HTML", QMessageBox.AcceptRole)] = "html"
+        box.addButton(QMessageBox.Cancel)
+        box.exec_()
+        return choices.get(box.clickedButton())
+    
+    def save_animation_video(self, animation_format="gif"):
+        """
+        Save the animation as a single animated file.
+        
+        Args:
+            animation_format: "gif" or "mp4"
+        """
+        file_filters = {"gif": "Animated GIF (*.gif)", "mp4": "MP4 video (*.mp4)"}
+        default_name = f"{self.current_automaton.name}_{self.animation_word}_animation.{animation_format}"
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Save Animation", os.path.join("Automates", default_name), file_filters[animation_format]
+        )
+        
+        if file_path:
+            try:
+                save_animation_video(self.current_automaton, self.animation_frames, file_path)
+                self.show_message("Animation Saved", f"Animation saved to:\n{file_path}")
+            except Exception as e:
+                import traceback
+                traceback.print_exc()
+                self.show_message("Save Error", f"Error saving animation: {str(e)}")
+    
+    def save_animation_html(self):
+        """Save the animation as a web page that replays it, a few KB whatever the word length."""
+        default_name = f"{self.current_automaton.name}_{self.animation_word}_animation.html"
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Save Animation", os.path.join("Automates", default_name), "Web page (*.html)"
+        )
+        
+        if file_path:
+            try:
+                save_animation_html(self.current_automaton, self.animation_word, file_path)
+                self.show_message("Animation Saved", f"Animation saved to:\n{file_path}")
+            except Exception as e:
+                import traceback
+                traceback.print_exc()
+                self.show_message("Save Error", f"Error saving animation: {str(e)}")
+    
     def clear_animation(self):
         """Clear the current animation."""
         self.animation_frames = []
+        self._frame_cache.clear()
         self.current_frame = 0
         self.animation_group.setVisible(False)
     
@@ -338,73 +540,104 @@ class WordProcessingTab(QWidget):
         
         try:
             # Generate words
-            print(f"Generating words with max length: {max_length}")
-            print(f"Current automaton: {self.current_automaton.name}")
-            print(f"Is deterministic: {self.current_automaton.is_deterministic()}")
-            print(f"States: {len(self.current_automaton.states)}")
-            print(f"Initial states: {len(self.current_automaton.get_initial_states())}")
-            print(f"Final states: {len(self.current_automaton.get_final_states())}")
-            accepted_words = self.current_automaton.generate_words(max_length)
-            print(f"Generated {len(accepted_words)} words")
+            if _log.isEnabledFor(logging.DEBUG):
+                automaton = self.current_automaton
+                _log.debug("Generating words with max length: %d", max_length)
+                _log.debug("Current automaton: %s", automaton.name)
+                _log.debug("Is deterministic: %s", automaton.is_deterministic())
+                _log.debug("States: %d, initial: %d, final: %d", len(automaton.states),
+                           len(automaton.get_initial_states()), len(automaton.get_final_states()))
+            # The exact answer is cheap, so an infinite language is known before
+            # enumerating and its word count can be capped
+            compiled = self._compiled_automaton()
+            is_infinite = compiled.is_infinite()
+            limit = GENERATED_WORDS_LIMIT if is_infinite else None
+            # One word past the limit tells whether any were left out, and from which length
+            accepted_words = compiled.generate_words(max_length, None if limit is None else limit + 1)
+            incomplete_length = None
+            if limit is not None and len(accepted_words) > limit:
+                incomplete_length = len(accepted_words[limit])
+                del accepted_words[limit:]
+            _log.debug("Generated %d words", len(accepted_words))
             
-            # Display words
-            self.words_list.clear()
-            for word in sorted(accepted_words, key=lambda w: (len(w), w)):
-                display_word = word if word else "ε (empty word)"
-                self.words_list.addItem(display_word)
+            # Display words, shortest first, then alphabetically: sorting (length, word)
+            # pairs compares them natively
+            display_words = [word if word else "ε (empty word)"
+                             for _, word in sorted((len(w), w) for w in accepted_words)]
+            # Fill the list in one insertion, without repaints or selection signals in between
+            self.words_list.setUpdatesEnabled(False)
+            self.words_list.blockSignals(True)
+            try:
+                self.words_list.clear()
+                self.words_list.addItems(display_words)
+            finally:
+                self.words_list.blockSignals(False)
+                self.words_list.setUpdatesEnabled(True)
             
             # Update statistics
-            self.update_word_statistics(accepted_words, max_length)
+            self.update_word_statistics(accepted_words, max_length, is_infinite, incomplete_length)
         except Exception as e:
-            print(f"Error generating words: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            _log.exception("Error generating words")
             self.show_message("Generation Error", f"Error generating words: {str(e)}")
     
-    def update_word_statistics(self, words, max_length):
-        """Update the word statistics display."""
-        stats = []
+    def update_word_statistics(self, words, max_length, is_infinite, incomplete_length=None):
+        """
+        Update the word statistics display.
+        
+        Args:
+            words: Generated words, shortest first
+            max_length: Maximum length the words were generated up to
+            is_infinite: Whether the automaton accepts infinitely many words
+            incomplete_length: Length whose words were only partly generated, when
+                generation stopped at GENERATED_WORDS_LIMIT words; None if all were
+        """
+        # Written piece by piece into one buffer; the word lists can be long
+        stats = io.StringIO()
         
         total_words = len(words)
-        stats.append(f"Total accepted words (up to length {max_length}): {total_words}")
+        if incomplete_length is not None:
+            stats.write(f"Accepted words (up to length {max_length}): first {total_words} shown\n")
+            # Lengths past the incomplete one were not explored
+            max_length = incomplete_length
+        else:
+            stats.write(f"Total accepted words (up to length {max_length}): {total_words}\n")
         
         # Count by length
-        by_length = {}
+        by_length = defaultdict(list)
         for word in words:
-            length = len(word)
-            if length not in by_length:
-                by_length[length] = []
-            by_length[length].append(word)
+            by_length[len(word)].append(word)
         
-        stats.append("\nWords by length:")
+        stats.write("\nWords by length:\n")
         for length in range(max_length + 1):
-            words_of_length = by_length.get(length, [])
+            words_of_length = by_length.get(length, ())
             count = len(words_of_length)
-            stats.append(f"  Length {length}: {count} word(s)")
+            if length == incomplete_length:
+                stats.write(f"  Length {length}: {count} word(s) shown, incomplete\n")
+            else:
+                stats.write(f"  Length {length}: {count} word(s)\n")
             
             # Add the actual words
             if count > 0:
                 # Sort words for better readability
                 words_of_length.sort()
-                # Format the display of each word
-                formatted_words = [f"'{w}'" if w else "'ε' (empty word)" for w in words_of_length]
-                # Join the words with commas
-                words_text = ", ".join(formatted_words)
-                stats.append(f"    Words: {words_text}")
-        
-        # Is the language finite or infinite?
-        is_finite = True
-        if self.current_automaton.is_deterministic():
-            # A DFA accepts an infinite language if there's a cycle that includes a final state
-            # Simple heuristic: if we keep seeing more words as length increases, it might be infinite
-            if max_length >= 3:
-                growth_rate = [len(by_length.get(i, [])) for i in range(max_length + 1)]
-                if growth_rate[-1] > growth_rate[-2] > growth_rate[-3]:
-                    is_finite = False
-        
-        stats.append(f"\nLanguage appears to be: {'infinite' if not is_finite else 'finite'}")
-        
-        self.stats_text.setText("\n".join(stats))
+                # Format the display of each word and join them with commas
+                stats.write("    Words: ")
+                if length == 0:
+                    stats.write("'ε' (empty word)")
+                else:
+                    stats.write("'")
+                    stats.write("', '".join(words_of_length))
+                    stats.write("'")
+                stats.write("\n")
+        
+        if incomplete_length is not None:
+            stats.write(f"  (list stopped at {GENERATED_WORDS_LIMIT} words, partway through length "
+                        f"{incomplete_length})\n")
+        
+        stats.write(f"\nLanguage is: {'infinite' if is_infinite else 'finite'}")
+        
+        # Plain text: skips the rich text detection of setText
+        self.stats_text.setPlainText(stats.getvalue())
     
     def show_message(self, title, message):
         """Show a message dialog."""
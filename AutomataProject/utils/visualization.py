@@ -1,11 +1,25 @@
 import os
+import json
+import multiprocessing
+import random
+import weakref
+from collections import defaultdict
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import networkx as nx
 import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.patches import FancyArrowPatch
+from matplotlib.collections import LineCollection
+from matplotlib.artist import Artist
+from matplotlib.font_manager import FontProperties
+from matplotlib.patches import BoxStyle
+from matplotlib.transforms import Bbox, IdentityTransform
+from matplotlib.animation import FFMpegWriter, PillowWriter, writers
 import matplotlib.colors as mcolors
-from typing import Dict, Set, Optional, Tuple, List, Any
+from typing import Dict, Set, Optional, Tuple, List, Any, Union, Iterator
 import colorsys
 
 # Use absolute imports instead of relative imports
@@ -13,10 +27,77 @@ from AutomataProject.automata.automaton import Automaton
 from AutomataProject.automata.state import State
 from AutomataProject.automata.transition import Transition
 
+try:
+    import igraph
+except ImportError:  # igraph is optional, networkx computes the layouts otherwise
+    igraph = None
+
+try:
+    import rustworkx
+except ImportError:  # rustworkx is optional, networkx places new states otherwise
+    rustworkx = None
+
 # Global dictionary to store node positions for each automaton
 # Key: automaton name, Value: dictionary of node positions
 node_positions = {}
 
+# Graph of each automaton, with the automaton version it was built from
+_graph_cache = weakref.WeakKeyDictionary()
+
+# Number of distinct automaton structures whose graphs are kept by _build_graph
+GRAPH_CACHE_SIZE = 32
+
+# Freshly computed layout of each cached graph; the layouts are deterministic,
+# so automata with the same structure share them
+_layout_cache = weakref.WeakKeyDictionary()
+
+# Automata with 3 up to this many states are first laid out on a circle instead of
+# running the force-directed layout; fewer states would sit on one line
+CIRCULAR_LAYOUT_MIN_STATES = 3
+CIRCULAR_LAYOUT_MAX_STATES = 8
+
+# Points sampled along each curved edge when edges are drawn as one collection
+EDGE_CURVE_SAMPLES = 20
+
+# Curve parameters of the sampled points, from the start (0) to the end (1) of an edge
+_CURVE_STEPS = np.linspace(0, 1, EDGE_CURVE_SAMPLES)[:, None]
+
+# Self-loop arrows sit at 270 degrees on the loop circle, pointing along it;
+# position on the unit circle and direction, computed once
+_LOOP_ARROW_ANGLE = np.radians(270)
+_LOOP_ARROW_UNIT = np.array([np.cos(_LOOP_ARROW_ANGLE), np.sin(_LOOP_ARROW_ANGLE)])
+_LOOP_ARROW_DIRECTION = np.array([-np.sin(_LOOP_ARROW_ANGLE), np.cos(_LOOP_ARROW_ANGLE)])
+
+# Gap left between a curved edge and the centers of its nodes, in data units,
+# when edges are drawn as one collection
+EDGE_NODE_GAP = 0.05
+
+# Margin around the axes of an automaton drawing, and the room above them for
+# its title, in inches; fixed sizes keep the title visible on small figures
+FIGURE_MARGIN = 0.15
+TITLE_SPACE = 0.43
+
+# Resolution of saved automaton images; 150 DPI looks the same as higher
+# resolutions on screen, at a fraction of the encoding time and file size
+IMAGE_DPI = 150
+
+# Vector images of automata with more edges than this get their edges as one
+# raster tile, which keeps large SVG and PDF files small and fast to open
+RASTERIZE_EDGES_THRESHOLD = 200
+
+# Resolution of the frames saved by animate_word_processing
+ANIMATION_FRAME_DPI = 100
+
+# Pillow options of each format animate_word_processing can save frames in
+FRAME_SAVE_OPTIONS = {
+    'png': {'optimize': True},
+    'webp': {'quality': 80, 'method': 6},
+}
+
+# Fewest animation frames worth handing to one worker process: starting a worker
+# costs about as much as saving 15 frames in-process, which each worker must repay
+FRAMES_PER_WORKER = 32
+
 # Enhanced color palette - modern, visually appealing colors
 COLOR_PALETTE = {
     'regular': '#E0E0E0',       # Light gray for regular states
@@ -29,121 +110,433 @@ COLOR_PALETTE = {
     'background': '#FFFFFF',    # White background
 }
 
+def _graph_signature(automaton: Automaton) -> Tuple[Tuple[Tuple[str, bool, bool], ...],
+                                                     Tuple[Tuple[str, str, str], ...]]:
+    """
+    Describe the structure of an automaton as an immutable, hashable value.
+    
+    Args:
+        automaton: The automaton
+        
+    Returns:
+        Sorted (name, is_initial, is_final) of the states and sorted
+        (from_state, to_state, symbol) of the transitions
+    """
+    states = tuple(sorted((state.name, state.is_initial, state.is_final) for state in automaton.states))
+    transitions = tuple(sorted((transition.from_state.name, transition.to_state.name, transition.symbol)
+                               for transition in automaton.transitions))
+    return states, transitions
+
+@lru_cache(maxsize=GRAPH_CACHE_SIZE)
+def _build_graph(signature: Tuple[Tuple[Tuple[str, bool, bool], ...],
+                                  Tuple[Tuple[str, str, str], ...]]) -> nx.DiGraph:
+    """
+    Build the networkx graph of an automaton structure.
+    
+    Args:
+        signature: Structure of the automaton, from _graph_signature
+        
+    Returns:
+        A networkx DiGraph representing the automaton, with the names of the
+        initial and final states in G.graph['initials'] and G.graph['finals']
+    """
+    states, transitions = signature
+    G = nx.DiGraph(initials=[name for name, is_initial, _ in states if is_initial],
+                   finals=[name for name, _, is_final in states if is_final])
+    
+    # Add states as nodes
+    for name, is_initial, is_final in states:
+        G.add_node(name, 
+                  is_initial=is_initial, 
+                  is_final=is_final,
+                  label=name)
+    
+    # Add transitions as edges, with all the symbols between two states in one label
+    edge_symbols = defaultdict(list)
+    for from_name, to_name, symbol in transitions:
+        edge_symbols[(from_name, to_name)].append(symbol)
+    for (from_name, to_name), symbols in edge_symbols.items():
+        G.add_edge(from_name, to_name, label=", ".join(symbols))
+    
+    return G
+
 def create_automaton_graph(automaton: Automaton) -> nx.DiGraph:
     """
     Create a networkx graph from an automaton.
     
+    The graph is shared between calls, and between automata with the same
+    states and transitions, so callers must not modify it.
+    
     Args:
         automaton: The automaton to visualize
         
     Returns:
         A networkx DiGraph representing the automaton
     """
-    G = nx.DiGraph()
-    
-    # Add states as nodes
-    for state in automaton.states:
-        G.add_node(state.name, 
-                  is_initial=state.is_initial, 
-                  is_final=state.is_final,
-                  label=state.name)
-    
-    # Add transitions as edges
-    for transition in automaton.transitions:
-        # Check if an edge already exists
-        if G.has_edge(transition.from_state.name, transition.to_state.name):
-            # Append to the existing label
-            existing_label = G.edges[transition.from_state.name, transition.to_state.name]['label']
-            G.edges[transition.from_state.name, transition.to_state.name]['label'] = f"{existing_label}, {transition.symbol}"
-        else:
-            # Create a new edge
-            G.add_edge(transition.from_state.name, transition.to_state.name, 
-                      label=transition.symbol)
+    cached = _graph_cache.get(automaton)
+    if cached is not None and cached[0] == automaton.version:
+        return cached[1]
     
+    G = _build_graph(_graph_signature(automaton))
+    _graph_cache[automaton] = (automaton.version, G)
     return G
 
-def visualize_automaton(automaton: Automaton, highlight_path: Optional[List[Tuple[str, str, str]]] = None,
-                       ax: Optional[plt.Axes] = None, figsize: Tuple[int, int] = (10, 8),
-                       reuse_positions: bool = True) -> Figure:
+def _spring_positions(G: nx.DiGraph) -> Dict[str, np.ndarray]:
     """
-    Visualize an automaton using networkx and matplotlib with enhanced visuals.
+    Compute a force-directed layout of a graph, with igraph when it is available.
+    
+    Both give the same layout on every run, scaled like networkx layouts so
+    that the largest coordinate is 1.
     
     Args:
-        automaton: The automaton to visualize
-        highlight_path: Optional list of transitions to highlight (from_state, to_state, symbol)
-        ax: Optional matplotlib axis to draw on
-        figsize: Size of the figure
-        reuse_positions: Whether to reuse previously calculated node positions
+        G: The networkx graph of an automaton
         
     Returns:
-        Matplotlib figure object
+        Dictionary mapping node names to positions
     """
-    G = create_automaton_graph(automaton)
+    if igraph is None or len(G) < 2:
+        # Using a larger k value and more iterations for better separation
+        return nx.spring_layout(G, k=1.5, iterations=200, seed=42)
     
-    # Create a new figure if ax is not provided
-    if ax is None:
-        fig, ax = plt.subplots(figsize=figsize, facecolor=COLOR_PALETTE['background'])
-    else:
-        fig = ax.figure
-        fig.set_facecolor(COLOR_PALETTE['background'])
+    # Fruchterman-Reingold in C, started from fixed random positions
+    nodes = list(G.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    graph = igraph.Graph(n=len(nodes), edges=[(index[u], index[v]) for u, v in G.edges()], directed=True)
+    start = np.random.RandomState(42).rand(len(nodes), 2).tolist()
+    # igraph draws its random numbers from the random module; seed it for this layout only
+    random_state = random.getstate()
+    random.seed(42)
+    try:
+        layout = graph.layout_fruchterman_reingold(seed=start, niter=200)
+    finally:
+        random.setstate(random_state)
+    return dict(zip(nodes, nx.rescale_layout(np.array(layout.coords, dtype=float))))
+
+def _place_new_nodes(G: nx.DiGraph, stored_positions: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Position the nodes of a graph that have no stored position, keeping the others fixed.
     
-    # Set axis background color
-    ax.set_facecolor(COLOR_PALETTE['background'])
+    Uses the rustworkx spring layout when it is available, networkx otherwise.
     
-    # Generate or reuse node positions
-    global node_positions
+    Args:
+        G: The networkx graph of an automaton
+        stored_positions: Known positions, possibly of nodes no longer in the graph
+        
+    Returns:
+        Dictionary mapping the node names of the graph to positions
+    """
+    if rustworkx is None:
+        return nx.spring_layout(G, pos=stored_positions, fixed=list(stored_positions.keys()),
+                                k=0.5, iterations=100)
+    
+    nodes = list(G.nodes())
+    graph = rustworkx.PyDiGraph()
+    indices = graph.add_nodes_from(nodes)
+    index = dict(zip(nodes, indices))
+    graph.add_edges_from_no_data([(index[u], index[v]) for u, v in G.edges()])
+    known = {index[node]: list(stored_positions[node]) for node in nodes if node in stored_positions}
+    layout = rustworkx.spring_layout(graph, pos=known, fixed=set(known), k=0.5, num_iter=100, seed=42)
+    return {node: np.asarray(layout[index[node]]) for node in nodes}
+
+def compute_layout(automaton: Automaton, G: nx.DiGraph,
+                   reuse_positions: bool = True) -> Dict[str, Tuple[float, float]]:
+    """
+    Compute node positions for an automaton graph, reusing stored positions when possible.
+    
+    Args:
+        automaton: The automaton being laid out
+        G: The networkx graph of the automaton
+        reuse_positions: Whether to reuse previously calculated node positions
+        
+    Returns:
+        Dictionary mapping node names to (x, y) positions
+    """
     if reuse_positions and automaton.name in node_positions:
         # Check if all current nodes are in the saved positions
         stored_positions = node_positions[automaton.name]
         missing_nodes = [node for node in G.nodes() if node not in stored_positions]
         
         if missing_nodes:
-            # If there are new nodes, start with existing positions and let networkx position the new ones
-            pos = nx.spring_layout(G, pos=stored_positions, fixed=list(stored_positions.keys()),
-                                 k=0.5, iterations=100)
+            # If there are new nodes, start with existing positions and only position the new ones
+            pos = _place_new_nodes(G, stored_positions)
             # Update stored positions
             node_positions[automaton.name] = pos
         else:
             # Use stored positions directly
             pos = stored_positions
+    elif CIRCULAR_LAYOUT_MIN_STATES <= len(G) <= CIRCULAR_LAYOUT_MAX_STATES:
+        # Small automata: evenly spaced on a circle, in name order so the layout is
+        # the same on every run; the nodes are always far enough apart
+        pos = nx.circular_layout(sorted(G.nodes()))
+        node_positions[automaton.name] = pos
+    elif G in _layout_cache:
+        # Same structure as an automaton laid out before
+        pos = dict(_layout_cache[G])
+        node_positions[automaton.name] = pos
     else:
         # Calculate new positions with better spacing and prevent overlaps
-        # Using a larger k value and more iterations for better separation
-        pos = nx.spring_layout(G, k=1.5, iterations=200, seed=42)
+        pos = _spring_positions(G)
         
         # Post-process positions to ensure minimum distance between nodes
         min_distance = 0.3  # Minimum distance between nodes
         
-        # Iteratively adjust positions to ensure minimum distance
+        # Iteratively adjust positions to ensure minimum distance, handling all
+        # pairs of nodes at once
+        nodes = list(G.nodes())
+        points = np.array([pos[node] for node in nodes], dtype=float).reshape(-1, 2)
         for _ in range(10):  # Try to adjust up to 10 times
-            overlaps = False
-            for n1 in G.nodes():
-                for n2 in G.nodes():
-                    if n1 != n2:
-                        # Calculate distance between nodes
-                        dx = pos[n1][0] - pos[n2][0]
-                        dy = pos[n1][1] - pos[n2][1]
-                        dist = (dx**2 + dy**2)**0.5
-                        
-                        # If nodes are too close, push them apart
-                        if dist < min_distance:
-                            overlaps = True
-                            # Push direction
-                            push_x = dx / dist if dist > 0 else 0
-                            push_y = dy / dist if dist > 0 else 0
-                            
-                            # Adjust positions (move both nodes slightly)
-                            adjustment = 0.05 * (min_distance - dist)
-                            pos[n1] = (pos[n1][0] + push_x * adjustment, 
-                                      pos[n1][1] + push_y * adjustment)
-                            pos[n2] = (pos[n2][0] - push_x * adjustment, 
-                                      pos[n2][1] - push_y * adjustment)
-            
-            if not overlaps:
+            # deltas[i, j] points from node j to node i
+            deltas = points[:, None, :] - points[None, :, :]
+            dist = np.linalg.norm(deltas, axis=2)
+            too_close = dist < min_distance
+            np.fill_diagonal(too_close, False)
+            if not too_close.any():
                 break
+            
+            # Push both nodes of each close pair apart; coinciding nodes have no push direction
+            apart = too_close & (dist > 0)
+            safe_dist = np.where(apart, dist, 1.0)
+            push = deltas / safe_dist[..., None] * (0.05 * (min_distance - dist))[..., None]
+            # Each pair is seen from both ends, moving each node twice
+            points += 2 * np.einsum('ij,ijk->ik', apart.astype(float), push)
         
-        # Store for future use
+        # Store for future use, as arrays like the positions networkx returns
+        pos = dict(zip(nodes, points))
         node_positions[automaton.name] = pos
+        _layout_cache[G] = dict(pos)
+    
+    return pos
+
+def _edge_style(highlighted: bool) -> Tuple[str, float, float]:
+    """
+    Get the look of an edge.
+    
+    Args:
+        highlighted: Whether the edge is on the highlighted path
+        
+    Returns:
+        (color, line width, alpha) of the edge
+    """
+    if highlighted:
+        return COLOR_PALETTE['highlight'], 2.0, 1.0
+    return COLOR_PALETTE['edge'], 1.0, 0.8
+
+@lru_cache(maxsize=1)
+def _edge_rgba_table() -> np.ndarray:
+    """
+    Get the RGBA colors of normal and highlighted edges.
+    
+    Returns:
+        Array whose rows 0 and 1 are the colors of normal and highlighted edges
+    """
+    return np.array([mcolors.to_rgba(color, alpha) for color, _, alpha in map(_edge_style, (False, True))])
+
+def _highlight_mask(edges: List[Tuple[str, str]],
+                    highlight_path: Optional[List[Tuple[str, str, str]]]) -> np.ndarray:
+    """
+    Find the edges on a highlighted path.
+    
+    Args:
+        edges: (from_state, to_state) edges
+        highlight_path: Optional list of transitions to highlight (from_state, to_state, symbol)
+        
+    Returns:
+        Boolean array, True for each edge on the path
+    """
+    # Edges are highlighted by state pair, so one set lookup per edge
+    highlight_edges = {(from_state, to_state) for from_state, to_state, _ in highlight_path or ()}
+    return np.fromiter((edge in highlight_edges for edge in edges), dtype=bool, count=len(edges))
+
+def _edge_rads(G: nx.DiGraph, edges: List[Tuple[str, str]], deltas: np.ndarray) -> np.ndarray:
+    """
+    Get the curvature of each edge, as the rad of an arc3 connection.
+    
+    Args:
+        G: Graph of the automaton
+        edges: (from_state, to_state) edges
+        deltas: Array of the vectors from the start to the end of each edge
+        
+    Returns:
+        Array of curvatures, one per edge
+    """
+    # Draw separate curves for bidirectional edges instead of increasing the curve;
+    # the reverse edge curves the other way around
+    bidirectional = np.fromiter((G.has_edge(v, u) for u, v in edges), dtype=bool, count=len(edges))
+    # Otherwise edges going generally rightward curve upward, and those going leftward curve downward
+    rightward = np.abs(np.arctan2(deltas[:, 1], deltas[:, 0])) <= np.pi/2
+    return np.where(bidirectional, 0.25, np.where(rightward, 0.15, -0.15))
+
+class _EdgeLabels(Artist):
+    """
+    All the edge labels of an automaton drawing, as a single artist.
+    
+    Each label is centered on its position, in a rounded white box. The boxes
+    and text go straight to the renderer, instead of through one Text artist
+    and one box patch per label, and the size of each distinct label is
+    measured only once per draw.
+    """
+    
+    def __init__(self, points: np.ndarray, labels: List[str], fontsize: float = 9):
+        """
+        Create the labels.
+        
+        Args:
+            points: (N, 2) array of label centers, in data coordinates
+            labels: Text of each label
+            fontsize: Font size in points
+        """
+        super().__init__()
+        self._points = np.asarray(points, dtype=float).reshape(-1, 2)
+        self._labels = labels
+        self._fontsize = fontsize
+        self._font = FontProperties(size=fontsize, weight='bold')
+        self._box_style = BoxStyle("round", pad=0.3)
+        self.set_zorder(5)
+    
+    def _layout(self, renderer) -> List[Tuple[str, float, float, float, float, float]]:
+        """
+        Place the labels in display coordinates.
+        
+        Args:
+            renderer: The renderer to measure the text with
+            
+        Returns:
+            (label, left, bottom, width, height, descent) of each label's text
+        """
+        # Like Text, make every line at least as tall as "lp"
+        _, min_height, min_descent = renderer.get_text_width_height_descent("lp", self._font, ismath=False)
+        sizes = {}
+        layout = []
+        for label, (x, y) in zip(self._labels, self.get_transform().transform(self._points)):
+            if label not in sizes:
+                width, height, descent = renderer.get_text_width_height_descent(label, self._font, ismath=False)
+                sizes[label] = (width, max(height, min_height), max(descent, min_descent))
+            width, height, descent = sizes[label]
+            layout.append((label, x - width / 2, y - height / 2, width, height, descent))
+        return layout
+    
+    def get_window_extent(self, renderer=None) -> Bbox:
+        """Get the display area covered by the label boxes."""
+        if renderer is None:
+            renderer = self.figure.canvas.get_renderer()
+        pad = self._box_style.pad * renderer.points_to_pixels(self._fontsize)
+        boxes = [Bbox.from_bounds(left - pad, bottom - pad, width + 2 * pad, height + 2 * pad)
+                 for _, left, bottom, width, height, _ in self._layout(renderer)]
+        return Bbox.union(boxes) if boxes else Bbox.null()
+    
+    def draw(self, renderer) -> None:
+        """Draw the boxes, then the text of all labels."""
+        if not self.get_visible() or not self._labels:
+            return
+        
+        layout = self._layout(renderer)
+        mutation_size = renderer.points_to_pixels(self._fontsize)
+        renderer.open_group('edge_labels', gid=self.get_gid())
+        
+        # Create background for better visibility
+        gc = renderer.new_gc()
+        self._set_gc_clip(gc)
+        gc.set_foreground('gray')
+        gc.set_alpha(0.8)
+        gc.set_linewidth(1.0)
+        gc.set_antialiased(True)
+        face = mcolors.to_rgba('white')
+        for _, left, bottom, width, height, _ in layout:
+            box = self._box_style(left, bottom, width, height, mutation_size)
+            renderer.draw_path(gc, box, IdentityTransform(), face)
+        gc.restore()
+        
+        gc = renderer.new_gc()
+        self._set_gc_clip(gc)
+        gc.set_foreground('black')
+        # Text is placed by its baseline, measured from the top for renderers that flip y
+        _, canvas_height = renderer.get_canvas_width_height()
+        for label, left, bottom, _, _, descent in layout:
+            baseline = bottom + descent
+            if renderer.flipy():
+                baseline = canvas_height - baseline
+            renderer.draw_text(gc, left, baseline, label, self._font, 0)
+        gc.restore()
+        
+        renderer.close_group('edge_labels')
+        self.stale = False
+
+def _curved_edge_points(start: Tuple[float, float], end: Tuple[float, float],
+                        rad: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sample the curve of an edge, as drawn by connectionstyle 'arc3,rad=...'.
+    
+    The curve is a quadratic Bezier curve whose control point lies beside the
+    midpoint, at rad times the distance between the ends. Both ends are cut
+    short by EDGE_NODE_GAP so the curve stops at the node borders.
+    
+    Args:
+        start: Position of the source node
+        end: Position of the target node
+        rad: Curvature of the edge
+        
+    Returns:
+        Array of EDGE_CURVE_SAMPLES points along the curve, and the unit
+        direction of the curve at its last point
+    """
+    p0 = np.asarray(start, dtype=float)
+    p2 = np.asarray(end, dtype=float)
+    dx, dy = p2 - p0
+    p1 = (p0 + p2) / 2 + rad * np.array([dy, -dx])
+    
+    # Cut off about the same length at both ends, keeping at least the middle of the curve
+    length = np.hypot(dx, dy)
+    cut = min(0.3, EDGE_NODE_GAP / length) if length > 0 else 0.0
+    t = cut + (1 - 2 * cut) * _CURVE_STEPS
+    points = (1 - t)**2 * p0 + 2 * (1 - t) * t * p1 + t**2 * p2
+    
+    tangent = 2 * (1 - t[-1]) * (p1 - p0) + 2 * t[-1] * (p2 - p1)
+    norm = np.hypot(*tangent)
+    return points, tangent / norm if norm > 0 else tangent
+
+def visualize_automaton(automaton: Automaton, highlight_path: Optional[List[Tuple[str, str, str]]] = None,
+                       ax: Optional[plt.Axes] = None, figsize: Tuple[int, int] = (10, 8),
+                       reuse_positions: bool = True,
+                       edge_artists: Optional[Dict[Tuple[str, str], Tuple[List[Any], List[Any]]]] = None,
+                       edge_handles: Optional[Dict[str, Any]] = None) -> Figure:
+    """
+    Visualize an automaton using networkx and matplotlib with enhanced visuals.
+    
+    Args:
+        automaton: The automaton to visualize
+        highlight_path: Optional list of transitions to highlight (from_state, to_state, symbol)
+        ax: Optional matplotlib axis to draw on
+        figsize: Size of the figure
+        reuse_positions: Whether to reuse previously calculated node positions
+        edge_artists: Optional dictionary filled with (normal patches, highlighted patches)
+            for each (from_state, to_state) edge. The highlighted patches are animated,
+            so only code drawing them explicitly (such as blitting) shows them
+        edge_handles: Optional dictionary filled with the edge artists, so that
+            update_highlight can highlight another path without drawing again.
+            Not filled when edge_artists is given
+        
+    Returns:
+        Matplotlib figure object
+    """
+    G = create_automaton_graph(automaton)
+    
+    # Create a new figure if ax is not provided
+    if ax is None:
+        fig, ax = plt.subplots(figsize=figsize, facecolor=COLOR_PALETTE['background'])
+    else:
+        fig = ax.figure
+        fig.set_facecolor(COLOR_PALETTE['background'])
+    
+    # Set axis background color
+    ax.set_facecolor(COLOR_PALETTE['background'])
+    
+    # Generate or reuse node positions
+    pos = compute_layout(automaton, G, reuse_positions)
+    
+    # The same positions as one array, in node order, for computing over all nodes or edges at once
+    nodes = list(G.nodes())
+    node_index = {node: i for i, node in enumerate(nodes)}
+    points = np.array([pos[node] for node in nodes], dtype=float).reshape(-1, 2)
     
     # Draw nodes with enhanced visuals
     node_colors = []
@@ -174,11 +567,8 @@ def visualize_automaton(automaton: Automaton, highlight_path: Optional[List[Tupl
             border_widths.append(1.0)
             node_sizes.append(650)
     
-    # Draw all nodes with a subtle shadow effect
-    for i, (node, color) in enumerate(zip(G.nodes(), node_colors)):
-        # Draw a slightly larger shadow node
-        ax.scatter(pos[node][0], pos[node][1], s=node_sizes[i]+20, 
-                  color=(0,0,0,0.2), zorder=1)
+    # Draw all nodes with a subtle shadow effect: slightly larger shadow nodes, in one scatter
+    ax.scatter(points[:, 0], points[:, 1], s=np.array(node_sizes) + 20, color=(0,0,0,0.2), zorder=1)
     
     # Draw nodes with gradients and shadows
     nodes = nx.draw_networkx_nodes(G, pos, ax=ax, 
@@ -189,7 +579,7 @@ def visualize_automaton(automaton: Automaton, highlight_path: Optional[List[Tupl
                                    alpha=1.0)
     
     # Draw double circles for final states
-    final_states = [node for node in G.nodes() if G.nodes[node]['is_final']]
+    final_states = G.graph['finals']
     if final_states:
         nx.draw_networkx_nodes(G, pos, ax=ax, nodelist=final_states, 
                                node_color='none', node_size=[650 + 100 for _ in final_states], 
@@ -202,30 +592,21 @@ def visualize_automaton(automaton: Automaton, highlight_path: Optional[List[Tupl
     
     # Draw edges with curved style for better visibility
     # Prepare edge colors and styles
-    edge_colors = []
-    edge_widths = []
-    edge_styles = []
-    edge_alphas = []
-    
-    highlight_edges = []
-    if highlight_path:
-        highlight_edges = [(from_state, to_state) for from_state, to_state, _ in highlight_path]
-    
-    for u, v in G.edges():
-        if (u, v) in highlight_edges:
-            edge_colors.append(COLOR_PALETTE['highlight'])
-            edge_widths.append(2.0)
-            edge_styles.append('solid')
-            edge_alphas.append(1.0)
-        else:
-            edge_colors.append(COLOR_PALETTE['edge'])
-            edge_widths.append(1.0)
-            edge_styles.append('solid')
-            edge_alphas.append(0.8)
+    edges = list(G.edges())
+    highlighted = _highlight_mask(edges, highlight_path)
+    edge_rgba = _edge_rgba_table()[highlighted.astype(int)]
+    edge_colors = np.where(highlighted, COLOR_PALETTE['highlight'], COLOR_PALETTE['edge'])
+    edge_widths = np.where(highlighted, 2.0, 1.0)
+    edge_alphas = np.where(highlighted, 1.0, 0.8)
     
-    # Draw curved edges between nodes
-    curved_edges = []
-    for i, (u, v) in enumerate(G.edges()):
+    # Curvature of each edge
+    starts = points[[node_index[u] for u, _ in edges]].reshape(-1, 2)
+    ends = points[[node_index[v] for _, v in edges]].reshape(-1, 2)
+    deltas = ends - starts
+    edge_rads = _edge_rads(G, edges, deltas)
+    
+    def edge_patches(u, v, rad, color, width, style, alpha):
+        """Build the patches drawing one edge; self-loops include their own arrow head."""
         # Self-loops need special handling
         if u == v:
             # Draw a more elegant self-loop as an arc above the node
@@ -233,7 +614,7 @@ def visualize_automaton(automaton: Automaton, highlight_path: Optional[List[Tupl
             
             # Create a larger, more visible loop
             loop_radius = 0.15  # Larger radius for visibility
-            loop_center = (center[0], center[1] - 0.05)  # Slightly offset center
+            loop_center = np.array([center[0], center[1] - 0.05])  # Slightly offset center
             
             # Draw arc from 0 to 270 degrees (three-quarters of a circle)
             theta1, theta2 = 180, 540  # Draw from left to right in a loop
@@ -243,143 +624,127 @@ def visualize_automaton(automaton: Automaton, highlight_path: Optional[List[Tupl
                 height=loop_radius*2,
                 theta1=theta1, 
                 theta2=theta2,
-                color=edge_colors[i],
-                linewidth=edge_widths[i],
-                linestyle=edge_styles[i],
-                alpha=edge_alphas[i],
+                color=color,
+                linewidth=width,
+                linestyle=style,
+                alpha=alpha,
                 zorder=1
             )
-            ax.add_patch(arc)
             
-            # Add arrow at the right position
-            arrow_angle = 270  # Angle in degrees where to place arrow
-            angle_rad = np.radians(arrow_angle)
-            arrow_x = loop_center[0] + np.cos(angle_rad) * loop_radius
-            arrow_y = loop_center[1] + np.sin(angle_rad) * loop_radius
-            
-            # Calculate tangent direction for arrow
-            dx = -np.sin(angle_rad)
-            dy = np.cos(angle_rad)
+            # Add arrow at the right position, along the tangent of the loop
+            arrow_x, arrow_y = loop_center + _LOOP_ARROW_UNIT * loop_radius
+            dx, dy = _LOOP_ARROW_DIRECTION
             
             # Create a more prominent arrow
             arrow = FancyArrowPatch(
                 (arrow_x - dx*0.05, arrow_y - dy*0.05),
                 (arrow_x, arrow_y),
                 arrowstyle='->',
-                color=edge_colors[i],
-                linewidth=edge_widths[i]*1.5,
-                alpha=edge_alphas[i],
+                color=color,
+                linewidth=width*1.5,
+                alpha=alpha,
                 mutation_scale=15,
                 zorder=3
             )
-            ax.add_patch(arrow)
-        else:
-            # Create the curved edge with more prominent arrow and better routing
-            # Calculate appropriate curve based on node positions to avoid overlapping with other nodes
-            rad = 0.15  # Default curve
-            
-            # Draw separate curves for bidirectional edges instead of increasing the curve
-            has_reverse = G.has_edge(v, u)
-            if has_reverse:
-                # For bidirectional edges, draw two separate curves
-                # First edge curves upward
-                rad1 = 0.25  # Curve one way
-                arrow1 = FancyArrowPatch(pos[u], pos[v], 
-                                       connectionstyle=f'arc3,rad={rad1}',
-                                       arrowstyle='->', color=edge_colors[i],
-                                       linewidth=edge_widths[i], alpha=edge_alphas[i],
-                                       mutation_scale=25, shrinkA=15, shrinkB=15,
-                                       lw=2.0, zorder=1)
-                curved_edges.append(arrow1)
-                
-                # Don't add the second arrow here - it will be added when we iterate to the reverse edge
+            return [arc, arrow]
+        
+        # Create curved edge with adjusted parameters
+        arrow = FancyArrowPatch(pos[u], pos[v], 
+                              connectionstyle=f'arc3,rad={rad}',
+                              arrowstyle='->', color=color,
+                              linewidth=width, alpha=alpha,
+                              mutation_scale=25, shrinkA=15, shrinkB=15,  # Increase shrink to avoid nodes
+                              lw=2.0, zorder=1)
+        return [arrow]
+    
+    # Draw curved edges between nodes
+    curved_edges = []
+    if edge_artists is None:
+        # Nothing needs the edges one by one: draw all curves as one collection
+        # and all their arrow heads with one quiver
+        segments = []
+        tips = []
+        directions = []
+        curved = []
+        loops = {}
+        for i, (u, v) in enumerate(edges):
+            if u == v:
+                loops[(u, v)] = edge_patches(u, v, edge_rads[i], edge_colors[i], edge_widths[i], 'solid',
+                                             edge_alphas[i])
+                for patch in loops[(u, v)]:
+                    ax.add_patch(patch)
                 continue
+            curve, direction = _curved_edge_points(starts[i], ends[i], edge_rads[i])
+            curved.append((u, v))
+            segments.append(curve)
+            tips.append(curve[-1])
+            directions.append(direction)
+        colors = edge_rgba[[u != v for u, v in edges]]
+        
+        lines = heads = None
+        if segments:
+            # Same line width as the edge patches draw
+            lines = LineCollection(segments, colors=colors, linewidths=2.0, zorder=1)
+            ax.add_collection(lines)
+            tips = np.array(tips)
+            directions = np.array(directions) * EDGE_NODE_GAP
+            heads = ax.quiver(tips[:, 0] - directions[:, 0], tips[:, 1] - directions[:, 1],
+                              directions[:, 0], directions[:, 1], color=colors,
+                              angles='xy', scale_units='xy', scale=1, zorder=1,
+                              units='dots', width=2.0, headwidth=6, headlength=7, headaxislength=6)
+        
+        if edge_handles is not None:
+            edge_handles.update(curved=curved, lines=lines, heads=heads, loops=loops)
+    
+    else:
+        # Each edge gets its own patches, with a highlighted copy left out of normal draws
+        for i, (u, v) in enumerate(edges):
+            drawn = []
+            for color, width, alpha in [(edge_colors[i], edge_widths[i], edge_alphas[i]),
+                                        _edge_style(True)]:
+                patches = edge_patches(u, v, edge_rads[i], color, width, 'solid', alpha)
+                if u == v:
+                    for patch in patches:
+                        ax.add_patch(patch)
+                else:
+                    curved_edges.extend(patches)
+                drawn.append(patches)
             
-            # Compute angle between nodes to determine best curve direction
-            angle = np.arctan2(pos[v][1] - pos[u][1], pos[v][0] - pos[u][0])
-            if -np.pi/2 <= angle <= np.pi/2:
-                # For edges going generally rightward, curve upward
-                rad = abs(rad)
-            else:
-                # For edges going generally leftward, curve downward
-                rad = -abs(rad)
-            
-            # Create curved edge with adjusted parameters
-            arrow = FancyArrowPatch(pos[u], pos[v], 
-                                  connectionstyle=f'arc3,rad={rad}',
-                                  arrowstyle='->', color=edge_colors[i],
-                                  linewidth=edge_widths[i], alpha=edge_alphas[i],
-                                  mutation_scale=25, shrinkA=15, shrinkB=15,  # Increase shrink to avoid nodes
-                                  lw=2.0, zorder=1)
-            curved_edges.append(arrow)
+            for patch in drawn[1]:
+                patch.set_animated(True)
+            edge_artists[(u, v)] = (drawn[0], drawn[1])
     
     # Add all curved edges to the plot
     for arrow in curved_edges:
         ax.add_patch(arrow)
     
-    # Draw edge labels with better positioning
-    edge_labels = {(u, v): data['label'] for u, v, data in G.edges(data=True)}
-    for (u, v), label in edge_labels.items():
-        # Calculate position for the label
-        if u == v:
-            # Self-loop - place label just above the peak of the arc
-            x, y = pos[u]
-            # Position the label right at the top of the self-loop
-            label_pos = (x, y - 0.22)  # Positioned at the top of the loop arc
-        else:
-            # Standard edge
-            x1, y1 = pos[u]
-            x2, y2 = pos[v]
-            
-            # Check if bidirectional
-            has_reverse = G.has_edge(v, u)
-            if has_reverse:
-                # For bidirectional edges with separate arrows, position label above the upward curve
-                rad = 0.25  # Match the curve value used above
-                # Position the label above the curved line
-                label_pos = ((x1 + x2) / 2 + rad * (y2 - y1), 
-                            (y1 + y2) / 2 + rad * (x1 - x2))
-            else:
-                # Standard curve
-                rad = 0.15
-                # Compute angle to determine curve direction
-                angle = np.arctan2(y2 - y1, x2 - x1)
-                if -np.pi/2 <= angle <= np.pi/2:
-                    rad = abs(rad)
-                else:
-                    rad = -abs(rad)
-                
-                # Middle position with offset based on curve
-                label_pos = ((x1 + x2) / 2 + rad * (y2 - y1), 
-                            (y1 + y2) / 2 + rad * (x1 - x2))
-        
-        # Create background for better visibility
-        bbox_props = dict(boxstyle="round,pad=0.3", fc="white", ec="gray", alpha=0.8)
-        
-        # Draw the label
-        ax.text(label_pos[0], label_pos[1], label, size=9, ha='center', va='center',
-               bbox=bbox_props, color='black', zorder=5, fontweight='bold')
+    # Draw edge labels with better positioning: next to the middle of each curve,
+    # at its control point, and just above the peak of self-loop arcs
+    label_points = (starts + ends) / 2 + edge_rads[:, None] * np.column_stack([deltas[:, 1], -deltas[:, 0]])
+    loops_mask = np.fromiter((u == v for u, v in edges), dtype=bool, count=len(edges))
+    label_points[loops_mask] = starts[loops_mask] + (0, -0.22)
+    
+    ax.add_artist(_EdgeLabels(label_points, [data['label'] for _, _, data in G.edges(data=True)]))
     
     # Draw initial state markers
-    for node in G.nodes():
-        if G.nodes[node]['is_initial']:
-            # Draw a nicer arrow pointing to the initial state
-            node_pos = pos[node]
-            offset = 0.15  # Arrow starting point offset
-            dx, dy = -offset, 0  # Direction for the arrow (from left to right)
-            
-            # Create a fancy arrow
-            start_point = (node_pos[0] + dx - 0.1, node_pos[1] + dy)
-            end_point = (node_pos[0] - 0.02, node_pos[1])
-            
-            # Add a fancy arrow with gradient
-            arrow = FancyArrowPatch(start_point, end_point,
-                                 arrowstyle='->',
-                                 mutation_scale=20,
-                                 linewidth=2,
-                                 color='black',
-                                 zorder=3)
-            ax.add_patch(arrow)
+    for node in G.graph['initials']:
+        # Draw a nicer arrow pointing to the initial state
+        node_pos = pos[node]
+        offset = 0.15  # Arrow starting point offset
+        dx, dy = -offset, 0  # Direction for the arrow (from left to right)
+        
+        # Create a fancy arrow
+        start_point = (node_pos[0] + dx - 0.1, node_pos[1] + dy)
+        end_point = (node_pos[0] - 0.02, node_pos[1])
+        
+        # Add a fancy arrow with gradient
+        arrow = FancyArrowPatch(start_point, end_point,
+                             arrowstyle='->',
+                             mutation_scale=20,
+                             linewidth=2,
+                             color='black',
+                             zorder=3)
+        ax.add_patch(arrow)
     
     # Set title with nice styling
     ax.set_title(f"Automaton: {automaton.name}", fontsize=14, fontweight='bold', 
@@ -397,13 +762,39 @@ def visualize_automaton(automaton: Automaton, highlight_path: Optional[List[Tupl
         spine.set_color('#DDDDDD')
         spine.set_linewidth(1)
     
-    # Ensure proper spacing
-    plt.tight_layout()
+    # Ensure proper spacing: the margins tight_layout would find, without laying out any text
+    width, height = fig.get_size_inches()
+    fig.subplots_adjust(left=FIGURE_MARGIN / width, right=1 - FIGURE_MARGIN / width,
+                        bottom=FIGURE_MARGIN / height, top=1 - (FIGURE_MARGIN + TITLE_SPACE) / height)
     
     return fig
 
+def update_highlight(edge_handles: Dict[str, Any],
+                     highlight_path: Optional[List[Tuple[str, str, str]]] = None) -> None:
+    """
+    Highlight another path on an automaton drawn by visualize_automaton.
+    
+    Only the colors of the existing edge artists change, so the figure can be
+    saved or drawn again without building any artist.
+    
+    Args:
+        edge_handles: Dictionary filled by visualize_automaton
+        highlight_path: Optional list of transitions to highlight (from_state, to_state, symbol)
+    """
+    if edge_handles['lines'] is not None:
+        colors = _edge_rgba_table()[_highlight_mask(edge_handles['curved'], highlight_path).astype(int)]
+        edge_handles['lines'].set_color(colors)
+        edge_handles['heads'].set_facecolor(colors)
+    
+    loops = list(edge_handles['loops'])
+    for edge, highlighted in zip(loops, _highlight_mask(loops, highlight_path)):
+        arc, arrow = edge_handles['loops'][edge]
+        color, width, alpha = _edge_style(highlighted)
+        arc.set(color=color, linewidth=width, alpha=alpha)
+        arrow.set(color=color, linewidth=width * 1.5, alpha=alpha)
+
 def save_automaton_image(automaton: Automaton, filename: str, directory: str = "Automates", 
-                         format: str = "png", **kwargs) -> str:
+                         format: str = "png", dpi: int = IMAGE_DPI, **kwargs) -> str:
     """
     Save an automaton visualization to a file with enhanced quality.
     
@@ -412,6 +803,7 @@ def save_automaton_image(automaton: Automaton, filename: str, directory: str = "
         filename: Name of the file to save
         directory: Directory to save the file
         format: File format (png, svg, etc.)
+        dpi: Resolution of the saved image
         **kwargs: Additional arguments for visualize_automaton
         
     Returns:
@@ -425,171 +817,617 @@ def save_automaton_image(automaton: Automaton, filename: str, directory: str = "
         filename = f"{filename}.{format}"
     file_path = os.path.join(directory, filename)
     
-    # Create visualization
-    fig = visualize_automaton(automaton, **kwargs)
+    # Create visualization on a figure of its own, without going through pyplot
+    fig = Figure(figsize=kwargs.pop('figsize', (10, 8)), facecolor=COLOR_PALETTE['background'])
+    FigureCanvasAgg(fig)
+    edge_handles = {}
+    visualize_automaton(automaton, ax=fig.add_subplot(111), edge_handles=edge_handles, **kwargs)
+    
+    lines = edge_handles.get('lines')
+    vector_format = format in ('svg', 'pdf', 'eps', 'ps')
+    if vector_format and lines is not None and len(lines.get_segments()) > RASTERIZE_EDGES_THRESHOLD:
+        lines.set_rasterized(True)
+        edge_handles['heads'].set_rasterized(True)
     
-    # Save figure with high DPI for better quality
-    dpi = 300 if format == 'png' else 100
     fig.savefig(file_path, format=format, bbox_inches='tight', dpi=dpi, facecolor=fig.get_facecolor())
-    plt.close(fig)
     
     return file_path
 
-def animate_word_processing(automaton: Automaton, word: str, 
-                          save_path: Optional[str] = None) -> List[Figure]:
+def compute_animation_trace(automaton: Automaton, word: str) -> List[Dict[str, Any]]:
     """
-    Create a series of visualizations showing the processing of a word by an automaton.
+    Simulate an automaton on a word, describing each frame of the processing animation.
     
     Args:
         automaton: The automaton
         word: The word to process
-        save_path: Optional path to save the animation frames
         
     Returns:
-        List of figures representing the animation frames
+        List of frames, each a dictionary with:
+            consumed: Number of symbols read so far
+            states: Names of the current states
+            path: Frozenset of (from_state, to_state, symbol) transitions taken so far
+            title: Caption of the frame
+            title_color: Color of the caption
+            final: Whether this is the closing accepted/rejected frame
     """
-    frames = []
-    
-    # Create a copy of the automaton to track state
-    current_state = next(iter(automaton.get_initial_states())) if automaton.is_deterministic() else None
-    current_states = automaton._epsilon_closure(automaton.get_initial_states()) if not automaton.is_deterministic() else None
-    
-    # Initial state
-    fig = plt.figure(figsize=(10, 8), facecolor=COLOR_PALETTE['background'])
-    ax = fig.add_subplot(111)
-    ax.set_facecolor(COLOR_PALETTE['background'])
-    visualize_automaton(automaton, ax=ax)
+    def frame(consumed, states, title, title_color='#2F4F4F', final=False):
+        return {'consumed': consumed, 'states': states, 'path': path,
+                'title': title, 'title_color': title_color, 'final': final}
     
-    # Improved title with better styling
-    title = f"Initial state: Processing word '{word}'"
-    ax.set_title(title, fontsize=14, fontweight='bold', color='#2F4F4F')
-    
-    frames.append(fig)
+    deterministic = automaton.is_deterministic()
+    if deterministic:
+        current_state = next(iter(automaton.get_initial_states()))
+        current_states = None
+        initial_names = (current_state.name,)
+    else:
+        current_state = None
+        current_states = frozenset(automaton._epsilon_closure(automaton.get_initial_states()))
+        initial_names = tuple(s.name for s in current_states)
+        
+        # Epsilon closures and epsilon moves of a state never change while the
+        # word is read, so each is computed once, when the state is first met
+        closures = {}
+        epsilon_moves = {}
+        
+        def closure(state):
+            if state not in closures:
+                closures[state] = automaton._epsilon_closure({state})
+            return closures[state]
+        
+        def moves(state):
+            if state not in epsilon_moves:
+                epsilon_moves[state] = [(t.from_state.name, t.to_state.name, Transition.EPSILON)
+                                        for t in automaton.get_transitions_from(state, Transition.EPSILON)]
+            return epsilon_moves[state]
+        
+        # Reading a symbol from the same set of states always leads to the same
+        # states through the same transitions, so each step is computed once
+        steps = {}
+        
+        def step(states, symbol):
+            if (states, symbol) not in steps:
+                next_states_set = set()
+                transitions_to_highlight = []
+                
+                for state in states:
+                    for next_state in automaton.get_next_states(state, symbol):
+                        next_states_set.add(next_state)
+                        transitions_to_highlight.append((state.name, next_state.name, symbol))
+                
+                # Apply epsilon closure
+                next_states_set = frozenset().union(*map(closure, next_states_set))
+                
+                # Add epsilon transitions to highlight
+                for state in next_states_set:
+                    transitions_to_highlight.extend(moves(state))
+                
+                steps[(states, symbol)] = (next_states_set, frozenset(transitions_to_highlight))
+            return steps[(states, symbol)]
     
-    # Process each symbol
-    path_so_far = []
-    processed_word = ""
+    # Transitions taken so far; only replaced when a new one is taken, so frames share it
+    path = frozenset()
+    trace = [frame(0, initial_names, f"Initial state: Processing word '{word}'")]
     
     for i, symbol in enumerate(word):
-        processed_word += symbol
+        processed_word = word[:i + 1]
         
-        if automaton.is_deterministic():
+        if deterministic:
             # For DFA
             next_states = automaton.get_next_states(current_state, symbol)
             if not next_states:
                 # No transition
-                fig = plt.figure(figsize=(10, 8), facecolor=COLOR_PALETTE['background'])
-                ax = fig.add_subplot(111)
-                ax.set_facecolor(COLOR_PALETTE['background'])
-                visualize_automaton(automaton, highlight_path=path_so_far, ax=ax)
-                
-                title = f"No transition for symbol '{symbol}' from state {current_state.name}. Word rejected."
-                ax.set_title(title, fontsize=14, fontweight='bold', color='#FF0000')
-                
-                frames.append(fig)
+                trace.append(frame(
+                    i + 1, (current_state.name,),
+                    f"No transition for symbol '{symbol}' from state {current_state.name}. Word rejected.",
+                    '#FF0000'))
                 break
             
             next_state = next(iter(next_states))
             
             # Record this transition for highlighting
-            path_so_far.append((current_state.name, next_state.name, symbol))
-            
-            # Visualize current step
-            fig = plt.figure(figsize=(10, 8), facecolor=COLOR_PALETTE['background'])
-            ax = fig.add_subplot(111)
-            ax.set_facecolor(COLOR_PALETTE['background'])
-            visualize_automaton(automaton, highlight_path=path_so_far, ax=ax)
+            taken = (current_state.name, next_state.name, symbol)
+            if taken not in path:
+                path = path | {taken}
             
-            title = f"Processed: '{processed_word}', Current state: {next_state.name}"
-            ax.set_title(title, fontsize=14, fontweight='bold', color='#2F4F4F')
-            
-            frames.append(fig)
+            trace.append(frame(i + 1, (next_state.name,),
+                               f"Processed: '{processed_word}', Current state: {next_state.name}"))
             
             current_state = next_state
         else:
             # For NFA
-            next_states_set = set()
-            transitions_to_highlight = []
-            
-            for state in current_states:
-                for next_state in automaton.get_next_states(state, symbol):
-                    next_states_set.add(next_state)
-                    transitions_to_highlight.append((state.name, next_state.name, symbol))
-            
-            # Apply epsilon closure
-            next_states_set = automaton._epsilon_closure(next_states_set)
-            
-            # Add epsilon transitions to highlight
-            for state in next_states_set:
-                for t in automaton.get_transitions_from(state, Transition.EPSILON):
-                    transitions_to_highlight.append((t.from_state.name, t.to_state.name, Transition.EPSILON))
+            next_states_set, transitions_to_highlight = step(current_states, symbol)
             
             # Update path for highlighting
-            path_so_far.extend(transitions_to_highlight)
+            if not path.issuperset(transitions_to_highlight):
+                path = path | transitions_to_highlight
             
             if not next_states_set:
                 # No valid transitions
-                fig = plt.figure(figsize=(10, 8), facecolor=COLOR_PALETTE['background'])
-                ax = fig.add_subplot(111)
-                ax.set_facecolor(COLOR_PALETTE['background'])
-                visualize_automaton(automaton, highlight_path=path_so_far, ax=ax)
-                
-                title = f"No transitions for symbol '{symbol}'. Word rejected."
-                ax.set_title(title, fontsize=14, fontweight='bold', color='#FF0000')
-                
-                frames.append(fig)
+                trace.append(frame(i + 1, tuple(s.name for s in current_states),
+                                   f"No transitions for symbol '{symbol}'. Word rejected.", '#FF0000'))
                 break
             
-            # Visualize current step
-            fig = plt.figure(figsize=(10, 8), facecolor=COLOR_PALETTE['background'])
-            ax = fig.add_subplot(111)
-            ax.set_facecolor(COLOR_PALETTE['background'])
-            visualize_automaton(automaton, highlight_path=path_so_far, ax=ax)
-            
-            current_states_names = ", ".join(s.name for s in next_states_set)
-            title = f"Processed: '{processed_word}', Current states: {current_states_names}"
-            ax.set_title(title, fontsize=14, fontweight='bold', color='#2F4F4F')
-            
-            frames.append(fig)
+            names = tuple(s.name for s in next_states_set)
+            trace.append(frame(i + 1, names,
+                               f"Processed: '{processed_word}', Current states: {', '.join(names)}"))
             
             current_states = next_states_set
     
-    # Final state with enhanced styling
-    if automaton.is_deterministic():
+    # Final state
+    if deterministic:
+        final_names = (current_state.name,)
         if current_state.is_final:
-            accepted = True
             message = f"Word '{word}' is ACCEPTED. Ended in final state {current_state.name}."
             title_color = '#008000'  # Green for accepted
         else:
-            accepted = False
             message = f"Word '{word}' is REJECTED. Ended in non-final state {current_state.name}."
             title_color = '#FF0000'  # Red for rejected
     else:
+        final_names = tuple(s.name for s in current_states)
         if any(state.is_final for state in current_states):
-            accepted = True
             final_states = [s.name for s in current_states if s.is_final]
             message = f"Word '{word}' is ACCEPTED. Ended in final states: {', '.join(final_states)}."
             title_color = '#008000'  # Green for accepted
         else:
-            accepted = False
             message = f"Word '{word}' is REJECTED. No final states reached."
             title_color = '#FF0000'  # Red for rejected
     
-    fig = plt.figure(figsize=(10, 8), facecolor=COLOR_PALETTE['background'])
-    ax = fig.add_subplot(111)
+    trace.append(frame(trace[-1]['consumed'], final_names, message, title_color, final=True))
+    
+    return trace
+
+def set_frame_title(ax: plt.Axes, frame: Dict[str, Any]) -> None:
+    """
+    Set the caption of an animation frame on an axis.
+    
+    Args:
+        ax: Axis showing the frame
+        frame: Frame from compute_animation_trace
+    """
+    bbox = None
+    if frame['final']:
+        # Add a background box to the title for emphasis
+        bbox = dict(boxstyle="round,pad=0.5", facecolor='white', alpha=0.8, edgecolor=frame['title_color'])
+    ax.set_title(frame['title'], fontsize=14, fontweight='bold', color=frame['title_color'], bbox=bbox)
+
+def render_animation_frame(automaton: Automaton, frame: Dict[str, Any], ax: plt.Axes) -> None:
+    """
+    Draw one frame of a word processing animation.
+    
+    Args:
+        automaton: The automaton
+        frame: Frame from compute_animation_trace
+        ax: Empty axis to draw on
+    """
     ax.set_facecolor(COLOR_PALETTE['background'])
-    visualize_automaton(automaton, highlight_path=path_so_far, ax=ax)
+    visualize_automaton(automaton, highlight_path=list(frame['path']), ax=ax)
+    set_frame_title(ax, frame)
+
+def animate_word_processing(automaton: Automaton, word: str, 
+                          save_path: Optional[str] = None,
+                          frame_format: str = "png") -> Union[Iterator[Figure], Iterator[str]]:
+    """
+    Create a series of visualizations showing the processing of a word by an automaton.
     
-    # Add a background box to the title for emphasis
-    title_bbox = dict(boxstyle="round,pad=0.5", facecolor='white', alpha=0.8, edgecolor=title_color)
-    ax.set_title(message, fontsize=14, fontweight='bold', color=title_color, bbox=title_bbox)
+    Frames are produced one at a time, so a frame the caller is done with can be
+    garbage collected before the next one is drawn. Use
+    animate_word_processing_list to get all of them at once.
     
-    frames.append(fig)
+    Args:
+        automaton: The automaton
+        word: The word to process
+        save_path: Optional path prefix to save the animation frames to, as
+                   {save_path}_0.png, {save_path}_1.png, ... Each frame is then
+                   saved right away from one drawing of the automaton, of
+                   which only the highlighted edges and the caption change.
+        frame_format: Format of the saved frames, "png" or the smaller "webp"
+        
+    Returns:
+        Iterator over figures representing the animation frames, or over the
+        paths of the saved frames if save_path is given
+    """
+    trace = compute_animation_trace(automaton, word)
     
-    # Save frames with improved quality if requested
     if save_path:
         os.makedirs(os.path.dirname(save_path), exist_ok=True)
-        for i, fig in enumerate(frames):
-            fig.savefig(f"{save_path}_{i}.png", bbox_inches='tight', dpi=200, facecolor=fig.get_facecolor())
+        filenames = [f"{save_path}_{i}.{frame_format}" for i in range(len(trace))]
+        yield from _save_frames_on_one_figure(automaton, trace, filenames, dpi=ANIMATION_FRAME_DPI,
+                                              facecolor=COLOR_PALETTE['background'],
+                                              pil_kwargs=FRAME_SAVE_OPTIONS[frame_format])
+        return
+    
+    for entry in trace:
+        # Not registered with pyplot, which would keep every frame alive
+        fig = Figure(figsize=(10, 8), facecolor=COLOR_PALETTE['background'])
+        render_animation_frame(automaton, entry, fig.add_subplot(111))
+        yield fig
+
+def animate_word_processing_list(automaton: Automaton, word: str, 
+                                 save_path: Optional[str] = None,
+                                 frame_format: str = "png") -> Union[List[Figure], List[str]]:
+    """
+    Create all the frames of animate_word_processing at once.
+    
+    Args:
+        automaton: The automaton
+        word: The word to process
+        save_path: Optional path prefix to save the animation frames to
+        frame_format: Format of the saved frames, "png" or "webp"
+        
+    Returns:
+        List of figures representing the animation frames, or the paths of the
+        saved frames if save_path is given
+    """
+    return list(animate_word_processing(automaton, word, save_path, frame_format))
+
+def _save_frames_on_one_figure(automaton: Automaton, frames: List[Dict[str, Any]],
+                               filenames: List[str], **kwargs) -> Iterator[str]:
+    """
+    Save animation frames to files, drawing the automaton only once.
+    
+    Each frame then only recolors the edges and changes the caption.
+    
+    Args:
+        automaton: The automaton
+        frames: Frames from compute_animation_trace
+        filenames: File path of each frame
+        **kwargs: Additional arguments for savefig
+        
+    Returns:
+        Iterator over the paths of the saved files, each yielded once saved
+    """
+    fig = Figure(figsize=(10, 8), facecolor=COLOR_PALETTE['background'])
+    ax = fig.add_subplot(111)
+    ax.set_facecolor(COLOR_PALETTE['background'])
+    edge_handles = {}
+    visualize_automaton(automaton, ax=ax, edge_handles=edge_handles)
+    
+    for frame, filename in zip(frames, filenames):
+        update_highlight(edge_handles, list(frame['path']))
+        set_frame_title(ax, frame)
+        fig.savefig(filename, bbox_inches='tight', **kwargs)
+        yield filename
+
+def _save_frame_run(job: Tuple[Automaton, Dict[str, Any], List[Dict[str, Any]], List[str]]) -> List[str]:
+    """
+    Save a run of consecutive animation frames to PNG files in a worker process.
+    
+    Args:
+        job: (automaton, node positions, frames from compute_animation_trace, file paths)
+        
+    Returns:
+        Paths to the saved files
+    """
+    automaton, positions, frames, filenames = job
+    # Workers start without stored layouts, so reuse the one computed by the caller
+    node_positions[automaton.name] = positions
+    
+    return list(_save_frames_on_one_figure(automaton, frames, filenames))
+
+def save_animation_frames(automaton: Automaton, frames: List[Dict[str, Any]], directory: str,
+                          max_workers: Optional[int] = None) -> List[str]:
+    """
+    Save animation frames as numbered PNG files (frame_01.png, frame_02.png, ...).
+    
+    Long animations are split into runs of consecutive frames, saved by
+    parallel worker processes that each draw the automaton once. Shorter ones,
+    or a single available worker, are saved in-process.
+    
+    Args:
+        automaton: The automaton
+        frames: Frames from compute_animation_trace
+        directory: Existing directory to save the files in
+        max_workers: Maximum number of worker processes. Defaults to the CPU count.
+        
+    Returns:
+        Paths to the saved files, in frame order
+    """
+    filenames = [os.path.join(directory, f"frame_{str(i + 1).zfill(2)}.png") for i in range(len(frames))]
+    
+    workers = min(len(frames) // FRAMES_PER_WORKER, max_workers or os.cpu_count() or 1)
+    # A single worker would only add its start-up to the same serial rendering
+    if workers <= 1:
+        return list(_save_frames_on_one_figure(automaton, frames, filenames))
+    
+    positions = compute_layout(automaton, create_automaton_graph(automaton))
+    # Runs of nearly equal length, one per worker
+    bounds = [len(frames) * i // workers for i in range(workers + 1)]
+    jobs = [(automaton, positions, frames[start:end], filenames[start:end])
+            for start, end in zip(bounds, bounds[1:])]
+    
+    # Spawn rather than fork: forking a process that runs Qt is unsafe
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+        return [filename for run in executor.map(_save_frame_run, jobs) for filename in run]
+
+def video_export_available() -> bool:
+    """
+    Check whether animations can be saved as video; animated GIFs are always available.
+    
+    Returns:
+        True if Matplotlib can find ffmpeg
+    """
+    return writers.is_available('ffmpeg')
+
+def save_animation_video(automaton: Automaton, frames: List[Dict[str, Any]], file_path: str,
+                         fps: float = 1) -> str:
+    """
+    Save animation frames as a single animated file.
+    
+    The format follows the file extension: a .gif is written with Pillow, which
+    Matplotlib always has; other formats, such as .mp4, require ffmpeg.
+    
+    Args:
+        automaton: The automaton
+        frames: Frames from compute_animation_trace
+        file_path: Path of the animation file
+        fps: Frames per second
+        
+    Returns:
+        Path to the saved file
+    """
+    fig = Figure(figsize=(10, 8), facecolor=COLOR_PALETTE['background'])
+    writer = PillowWriter(fps=fps) if file_path.lower().endswith('.gif') else FFMpegWriter(fps=fps)
+    with writer.saving(fig, file_path, dpi=100):
+        for frame in frames:
+            fig.clear()
+            render_animation_frame(automaton, frame, fig.add_subplot(111))
+            writer.grab_frame(facecolor=fig.get_facecolor())
+    return file_path
+
+def export_animation_json(automaton: Automaton, word: str) -> Dict[str, Any]:
+    """
+    Describe the processing of a word as a scene that a browser can draw and replay.
+    
+    The automaton is laid out once; each frame only lists the edges to highlight,
+    which keeps the scene a few KB however long the word is.
     
-    return frames 
\ No newline at end of file
+    Args:
+        automaton: The automaton
+        word: The word to process
+        
+    Returns:
+        JSON-serializable dictionary with:
+            title: Caption of the automaton
+            nodes: List of {name, x, y, kind}, kind being a key of COLOR_PALETTE
+            edges: List of {u, v, label, rad}, u and v being indices into nodes
+                   and rad the curvature of the edge
+            frames: List of {highlight, title, color, final}, highlight being
+                    the indices of the highlighted edges
+            palette: COLOR_PALETTE
+    """
+    G = create_automaton_graph(automaton)
+    pos = compute_layout(automaton, G)
+    
+    nodes = list(G.nodes())
+    node_index = {node: i for i, node in enumerate(nodes)}
+    points = np.array([pos[node] for node in nodes], dtype=float).reshape(-1, 2)
+    
+    edges = list(G.edges())
+    starts = points[[node_index[u] for u, _ in edges]].reshape(-1, 2)
+    ends = points[[node_index[v] for _, v in edges]].reshape(-1, 2)
+    edge_rads = _edge_rads(G, edges, ends - starts)
+    
+    node_entries = []
+    for node, (x, y) in zip(nodes, points.tolist()):
+        data = G.nodes[node]
+        if data['is_initial'] and data['is_final']:
+            kind = 'initial_final'
+        elif data['is_initial']:
+            kind = 'initial'
+        elif data['is_final']:
+            kind = 'final'
+        else:
+            kind = 'regular'
+        node_entries.append({'name': node, 'x': x, 'y': y, 'kind': kind})
+    
+    frames = []
+    for frame in compute_animation_trace(automaton, word):
+        highlighted = np.flatnonzero(_highlight_mask(edges, frame['path']))
+        frames.append({'highlight': highlighted.tolist(), 'title': frame['title'],
+                       'color': frame['title_color'], 'final': frame['final']})
+    
+    return {
+        'title': f"Automaton: {automaton.name}",
+        'nodes': node_entries,
+        'edges': [{'u': node_index[u], 'v': node_index[v], 'label': data['label'], 'rad': float(rad)}
+                  for (u, v, data), rad in zip(G.edges(data=True), edge_rads)],
+        'frames': frames,
+        'palette': COLOR_PALETTE,
+    }
+
+# Page replaying an exported animation scene on a canvas; __SCENE__ is replaced by the scene JSON.
+# Shapes follow visualize_automaton, in the same data units
+_ANIMATION_HTML = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>__TITLE__</title>
+<style>
+  body { font-family: sans-serif; margin: 16px; }
+  canvas { border: 1px solid #ddd; display: block; }
+  #controls { margin-top: 8px; display: flex; gap: 8px; align-items: center; }
+  #frame { flex: 1; }
+</style>
+</head>
+<body>
+<canvas id="view" width="900" height="700"></canvas>
+<div id="controls">
+  <button id="prev">Previous</button>
+  <button id="play">Play</button>
+  <button id="next">Next</button>
+  <input id="frame" type="range" min="0" value="0">
+  <span id="counter"></span>
+</div>
+<script>
+const scene = __SCENE__;
+const canvas = document.getElementById("view");
+const ctx = canvas.getContext("2d");
+const slider = document.getElementById("frame");
+const palette = scene.palette;
+const NODE_RADIUS = 0.075, LOOP_RADIUS = 0.15, MARGIN = 0.35, TOP = 70;
+slider.max = scene.frames.length - 1;
+
+// Fit the layout into the canvas below the caption, keeping circles round
+const xs = scene.nodes.map(n => n.x), ys = scene.nodes.map(n => n.y);
+const minX = Math.min(...xs) - MARGIN, maxX = Math.max(...xs) + MARGIN;
+const minY = Math.min(...ys) - MARGIN, maxY = Math.max(...ys) + MARGIN;
+const scale = Math.min(canvas.width / (maxX - minX), (canvas.height - TOP) / (maxY - minY));
+const offsetX = (canvas.width - scale * (maxX - minX)) / 2;
+const toCanvas = (x, y) => [offsetX + (x - minX) * scale, TOP + (maxY - y) * scale];
+
+function arrowHead(x, y, dx, dy) {
+  const length = Math.hypot(dx, dy) || 1, ux = dx / length, uy = dy / length, size = 10;
+  ctx.beginPath();
+  ctx.moveTo(x, y);
+  ctx.lineTo(x - size * ux - size / 2 * uy, y - size * uy + size / 2 * ux);
+  ctx.moveTo(x, y);
+  ctx.lineTo(x - size * ux + size / 2 * uy, y - size * uy - size / 2 * ux);
+  ctx.stroke();
+}
+
+function drawEdge(edge, highlighted) {
+  const a = scene.nodes[edge.u], b = scene.nodes[edge.v];
+  ctx.strokeStyle = highlighted ? palette.highlight : palette.edge;
+  ctx.globalAlpha = highlighted ? 1.0 : 0.8;
+  ctx.lineWidth = 2;
+  let labelX, labelY;
+  if (edge.u === edge.v) {
+    const [cx, cy] = toCanvas(a.x, a.y - 0.05), r = LOOP_RADIUS * scale;
+    ctx.beginPath();
+    ctx.arc(cx, cy, r, 0, 2 * Math.PI);
+    ctx.stroke();
+    arrowHead(cx, cy + r, 1, 0);
+    [labelX, labelY] = [a.x, a.y - 0.22];
+  } else {
+    const dx = b.x - a.x, dy = b.y - a.y;
+    [labelX, labelY] = [(a.x + b.x) / 2 + edge.rad * dy, (a.y + b.y) / 2 - edge.rad * dx];
+    const [x1, y1] = toCanvas(a.x, a.y), [x2, y2] = toCanvas(b.x, b.y), [qx, qy] = toCanvas(labelX, labelY);
+    // Leave the nodes uncovered, along the tangents at both ends
+    const gap = NODE_RADIUS * scale;
+    const l1 = Math.hypot(qx - x1, qy - y1) || 1, l2 = Math.hypot(x2 - qx, y2 - qy) || 1;
+    const sx = x1 + (qx - x1) / l1 * gap, sy = y1 + (qy - y1) / l1 * gap;
+    const ex = x2 - (x2 - qx) / l2 * gap, ey = y2 - (y2 - qy) / l2 * gap;
+    ctx.beginPath();
+    ctx.moveTo(sx, sy);
+    ctx.quadraticCurveTo(qx, qy, ex, ey);
+    ctx.stroke();
+    arrowHead(ex, ey, x2 - qx, y2 - qy);
+  }
+  ctx.globalAlpha = 1.0;
+  return toCanvas(labelX, labelY);
+}
+
+function drawLabel(text, x, y) {
+  ctx.font = "bold 12px sans-serif";
+  const w = ctx.measureText(text).width + 8, h = 18;
+  ctx.fillStyle = "white";
+  ctx.strokeStyle = "gray";
+  ctx.globalAlpha = 0.8;
+  ctx.lineWidth = 1;
+  ctx.beginPath();
+  ctx.roundRect(x - w / 2, y - h / 2, w, h, 4);
+  ctx.fill();
+  ctx.stroke();
+  ctx.globalAlpha = 1.0;
+  ctx.fillStyle = palette.text;
+  ctx.textAlign = "center";
+  ctx.textBaseline = "middle";
+  ctx.fillText(text, x, y);
+}
+
+function drawNode(node) {
+  const [x, y] = toCanvas(node.x, node.y), r = NODE_RADIUS * scale;
+  ctx.fillStyle = palette[node.kind];
+  ctx.strokeStyle = node.kind === "regular" ? "gray" : "black";
+  ctx.lineWidth = node.kind === "regular" ? 1 : 2;
+  ctx.beginPath();
+  ctx.arc(x, y, r, 0, 2 * Math.PI);
+  ctx.fill();
+  ctx.stroke();
+  if (node.kind === "final" || node.kind === "initial_final") {
+    ctx.beginPath();
+    ctx.arc(x, y, r * 1.15, 0, 2 * Math.PI);
+    ctx.stroke();
+  }
+  if (node.kind === "initial" || node.kind === "initial_final") {
+    ctx.strokeStyle = "black";
+    ctx.beginPath();
+    ctx.moveTo(x - r - 25, y);
+    ctx.lineTo(x - r, y);
+    ctx.stroke();
+    arrowHead(x - r, y, 1, 0);
+  }
+  ctx.font = "bold 13px sans-serif";
+  ctx.fillStyle = palette.text;
+  ctx.textAlign = "center";
+  ctx.textBaseline = "middle";
+  ctx.fillText(node.name, x, y);
+}
+
+function show(index) {
+  const frame = scene.frames[index], highlight = new Set(frame.highlight);
+  ctx.fillStyle = palette.background;
+  ctx.fillRect(0, 0, canvas.width, canvas.height);
+  const labels = scene.edges.map((edge, i) => [edge.label, ...drawEdge(edge, highlight.has(i))]);
+  scene.nodes.forEach(drawNode);
+  labels.forEach(([text, x, y]) => drawLabel(text, x, y));
+  ctx.font = "bold 18px sans-serif";
+  ctx.fillStyle = frame.color;
+  ctx.textAlign = "center";
+  ctx.textBaseline = "middle";
+  ctx.fillText(frame.title, canvas.width / 2, TOP / 2);
+  slider.value = index;
+  document.getElementById("counter").textContent = `Frame ${index + 1}/${scene.frames.length}`;
+}
+
+let timer = null;
+function stop() {
+  clearInterval(timer);
+  timer = null;
+  document.getElementById("play").textContent = "Play";
+}
+const step = delta => show(Math.min(Math.max(Number(slider.value) + delta, 0), scene.frames.length - 1));
+document.getElementById("prev").onclick = () => { stop(); step(-1); };
+document.getElementById("next").onclick = () => { stop(); step(1); };
+slider.oninput = () => { stop(); show(Number(slider.value)); };
+document.getElementById("play").onclick = () => {
+  if (timer) { stop(); return; }
+  if (Number(slider.value) === scene.frames.length - 1) show(0);
+  document.getElementById("play").textContent = "Pause";
+  timer = setInterval(() => {
+    if (Number(slider.value) === scene.frames.length - 1) stop(); else step(1);
+  }, 1000);
+};
+document.onkeydown = event => {
+  if (event.key === "ArrowLeft") { stop(); step(-1); }
+  if (event.key === "ArrowRight") { stop(); step(1); }
+};
+show(0);
+</script>
+</body>
+</html>
+"""
+
+def save_animation_html(automaton: Automaton, word: str, file_path: str) -> str:
+    """
+    Save the processing of a word as a single interactive web page.
+    
+    The page embeds the scene from export_animation_json and draws it on a
+    canvas, with controls to play the animation or step through its frames.
+    
+    Args:
+        automaton: The automaton
+        word: The word to process
+        file_path: Path of the HTML file
+        
+    Returns:
+        Path to the saved file
+    """
+    scene = export_animation_json(automaton, word)
+    # Escape "</" so that no label can close the script element
+    scene_json = json.dumps(scene).replace('</', '<\\/')
+    title = f"{automaton.name}: '{word}'".replace('&', '&amp;').replace('<', '&lt;')
+    page = _ANIMATION_HTML.replace('__TITLE__', title).replace('__SCENE__', scene_json)
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(page)
+    return file_path
@@ -0,0 +1,243 @@
+import math
+from typing import Dict, List, Optional, Tuple
+
+from PyQt5.QtWidgets import (QGraphicsScene, QGraphicsView, QGraphicsEllipseItem,
+                             QGraphicsPathItem, QGraphicsPolygonItem, QGraphicsRectItem,
+                             QGraphicsSimpleTextItem)
+from PyQt5.QtGui import QBrush, QColor, QFont, QPainter, QPainterPath, QPen, QPolygonF
+from PyQt5.QtCore import QPointF
+
+from AutomataProject.automata.automaton import Automaton
+from AutomataProject.utils.visualization import COLOR_PALETTE, create_automaton_graph, compute_layout
+
+# Automata with fewer states than this are drawn with a QGraphicsScene instead of Matplotlib
+SCENE_STATE_THRESHOLD = 30
+
+# Scene geometry
+LAYOUT_SCALE = 150.0    # Pixels per layout unit
+NODE_RADIUS = 22.0
+ARROW_SIZE = 10.0
+
+def _node_color(is_initial: bool, is_final: bool) -> QColor:
+    """
+    Get the fill color for a state.
+    
+    Args:
+        is_initial: Whether the state is initial
+        is_final: Whether the state is final
+    
+    Returns:
+        Fill color matching the Matplotlib visualization
+    """
+    if is_initial and is_final:
+        return QColor(COLOR_PALETTE['initial_final'])
+    if is_initial:
+        return QColor(COLOR_PALETTE['initial'])
+    if is_final:
+        return QColor(COLOR_PALETTE['final'])
+    return QColor(COLOR_PALETTE['regular'])
+
+def _unit(dx: float, dy: float) -> Tuple[float, float]:
+    """Normalize a vector, returning (0, 0) for a zero-length vector."""
+    length = math.hypot(dx, dy)
+    if length == 0:
+        return 0.0, 0.0
+    return dx / length, dy / length
+
+def _arrow_head(tip: QPointF, towards: QPointF) -> QPolygonF:
+    """
+    Build a triangular arrow head.
+    
+    Args:
+        tip: Point of the arrow
+        towards: A point along the incoming direction of the arrow
+    
+    Returns:
+        Polygon of the arrow head
+    """
+    ux, uy = _unit(tip.x() - towards.x(), tip.y() - towards.y())
+    base_x = tip.x() - ux * ARROW_SIZE
+    base_y = tip.y() - uy * ARROW_SIZE
+    half = ARROW_SIZE / 2
+    return QPolygonF([
+        tip,
+        QPointF(base_x - uy * half, base_y + ux * half),
+        QPointF(base_x + uy * half, base_y - ux * half),
+    ])
+
+def _add_label(scene: QGraphicsScene, text: str, center: QPointF, font: QFont) -> None:
+    """
+    Add an edge label with a white background box centered on a point.
+    
+    Args:
+        scene: Scene to add the label to
+        text: Label text
+        center: Center of the label
+        font: Font for the label
+    """
+    label = QGraphicsSimpleTextItem(text)
+    label.setFont(font)
+    rect = label.boundingRect()
+    label.setPos(center.x() - rect.width() / 2, center.y() - rect.height() / 2)
+    label.setZValue(4)
+    
+    background = QGraphicsRectItem(label.x() - 3, label.y() - 1, rect.width() + 6, rect.height() + 2)
+    background.setBrush(QBrush(QColor("white")))
+    background.setPen(QPen(QColor("gray")))
+    background.setZValue(3)
+    
+    scene.addItem(background)
+    scene.addItem(label)
+
+def build_scene(automaton: Automaton,
+                highlight_path: Optional[List[Tuple[str, str, str]]] = None) -> QGraphicsScene:
+    """
+    Build a QGraphicsScene drawing an automaton.
+    
+    Uses the same layout as the Matplotlib visualization so both renderers
+    place states identically.
+    
+    Args:
+        automaton: The automaton to draw
+        highlight_path: Optional list of transitions to highlight (from_state, to_state, symbol)
+    
+    Returns:
+        Scene containing the automaton drawing
+    """
+    G = create_automaton_graph(automaton)
+    pos = compute_layout(automaton, G)
+    
+    # Qt's y axis points down, so flip the layout vertically
+    points: Dict[str, QPointF] = {
+        node: QPointF(x * LAYOUT_SCALE, -y * LAYOUT_SCALE) for node, (x, y) in pos.items()
+    }
+    
+    highlight_edges = set()
+    if highlight_path:
+        highlight_edges = {(from_state, to_state) for from_state, to_state, _ in highlight_path}
+    
+    scene = QGraphicsScene()
+    label_font = QFont("sans-serif", 9, QFont.Bold)
+    node_font = QFont("sans-serif", 10, QFont.Bold)
+    
+    # Draw transitions
+    for u, v, data in G.edges(data=True):
+        if (u, v) in highlight_edges:
+            color = QColor(COLOR_PALETTE['highlight'])
+            width = 2.5
+        else:
+            color = QColor(COLOR_PALETTE['edge'])
+            width = 1.5
+        pen = QPen(color, width)
+        
+        path = QPainterPath()
+        if u == v:
+            # Self-loop drawn as a cubic curve above the state
+            p = points[u]
+            r = NODE_RADIUS
+            start = QPointF(p.x() - 0.5 * r, p.y() - 0.87 * r)
+            end = QPointF(p.x() + 0.5 * r, p.y() - 0.87 * r)
+            control1 = QPointF(p.x() - 1.5 * r, p.y() - 3.2 * r)
+            control2 = QPointF(p.x() + 1.5 * r, p.y() - 3.2 * r)
+            path.moveTo(start)
+            path.cubicTo(control1, control2, end)
+            arrow_from = control2
+            label_pos = QPointF(p.x(), p.y() - 2.8 * r - 8)
+        else:
+            # Curved edge; bidirectional edges curve more so both stay visible
+            p1, p2 = points[u], points[v]
+            rad = 0.25 if G.has_edge(v, u) else 0.15
+            dx, dy = p2.x() - p1.x(), p2.y() - p1.y()
+            control = QPointF((p1.x() + p2.x()) / 2 + rad * dy, (p1.y() + p2.y()) / 2 - rad * dx)
+            
+            # Shrink the curve so it starts and ends on the state borders
+            sx, sy = _unit(control.x() - p1.x(), control.y() - p1.y())
+            ex, ey = _unit(control.x() - p2.x(), control.y() - p2.y())
+            start = QPointF(p1.x() + sx * NODE_RADIUS, p1.y() + sy * NODE_RADIUS)
+            end = QPointF(p2.x() + ex * NODE_RADIUS, p2.y() + ey * NODE_RADIUS)
+            
+            path.moveTo(start)
+            path.quadTo(control, end)
+            arrow_from = control
+            label_pos = QPointF(0.25 * start.x() + 0.5 * control.x() + 0.25 * end.x(),
+                                0.25 * start.y() + 0.5 * control.y() + 0.25 * end.y())
+        
+        edge_item = QGraphicsPathItem(path)
+        edge_item.setPen(pen)
+        edge_item.setZValue(0)
+        scene.addItem(edge_item)
+        
+        head = QGraphicsPolygonItem(_arrow_head(end, arrow_from))
+        head.setPen(pen)
+        head.setBrush(QBrush(color))
+        head.setZValue(0)
+        scene.addItem(head)
+        
+        _add_label(scene, data['label'], label_pos, label_font)
+    
+    # Draw states
+    for node in G.nodes():
+        p = points[node]
+        is_initial = G.nodes[node]['is_initial']
+        is_final = G.nodes[node]['is_final']
+        r = NODE_RADIUS
+        
+        circle = QGraphicsEllipseItem(p.x() - r, p.y() - r, 2 * r, 2 * r)
+        circle.setBrush(QBrush(_node_color(is_initial, is_final)))
+        circle.setPen(QPen(QColor("black" if is_initial or is_final else "gray"), 1.5))
+        circle.setZValue(1)
+        scene.addItem(circle)
+        
+        # Double circle for final states
+        if is_final:
+            inner = QGraphicsEllipseItem(p.x() - r + 4, p.y() - r + 4, 2 * r - 8, 2 * r - 8)
+            inner.setPen(QPen(QColor("black"), 1.2))
+            inner.setZValue(2)
+            scene.addItem(inner)
+        
+        # Incoming arrow for initial states
+        if is_initial:
+            start = QPointF(p.x() - 2.2 * r, p.y())
+            end = QPointF(p.x() - r, p.y())
+            pen = QPen(QColor("black"), 2)
+            
+            line = QPainterPath()
+            line.moveTo(start)
+            line.lineTo(end)
+            line_item = QGraphicsPathItem(line)
+            line_item.setPen(pen)
+            line_item.setZValue(1)
+            scene.addItem(line_item)
+            
+            head = QGraphicsPolygonItem(_arrow_head(end, start))
+            head.setPen(pen)
+            head.setBrush(QBrush(QColor("black")))
+            head.setZValue(1)
+            scene.addItem(head)
+        
+        text = QGraphicsSimpleTextItem(node)
+        text.setFont(node_font)
+        rect = text.boundingRect()
+        text.setPos(p.x() - rect.width() / 2, p.y() - rect.height() / 2)
+        text.setZValue(2)
+        scene.addItem(text)
+    
+    scene.setBackgroundBrush(QBrush(QColor(COLOR_PALETTE['background'])))
+    return scene
+
+def create_scene_view(automaton: Automaton,
+                      highlight_path: Optional[List[Tuple[str, str, str]]] = None) -> QGraphicsView:
+    """
+    Create a pannable view displaying an automaton.
+    
+    Args:
+        automaton: The automaton to display
+        highlight_path: Optional list of transitions to highlight (from_state, to_state, symbol)
+    
+    Returns:
+        Graphics view showing the automaton
+    """
+    view = QGraphicsView(build_scene(automaton, highlight_path))
+    view.setRenderHint(QPainter.Antialiasing)
+    view.setDragMode(QGraphicsView.ScrollHandDrag)
+    return view
@@ -1,5 +1,6 @@
 import sys
 import os
+import logging
 
 # Add the AutomataProject directory to Python path
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -13,6 +14,9 @@ def main():
     # Create the Automates directory if it doesn't exist
     os.makedirs("Automates", exist_ok=True)
     
+    # Debug messages are only shown when the level is lowered here
+    logging.basicConfig(level=logging.INFO)
+    
     # Create application
     app = QApplication(sys.argv)
     app.setApplicationName("Automata Visualizer & Simulator")
@@ -21,17 +25,6 @@ def main():
     window = MainWindow()
     window.show()
     
-    # Connect signals between tabs
-    window.automaton_tab.automaton_selected.connect(window.editor_tab.set_current_automaton)
-    window.automaton_tab.automaton_selected.connect(window.analysis_tab.set_current_automaton)
-    window.automaton_tab.automaton_selected.connect(window.word_processing_tab.set_current_automaton)
-    
-    window.editor_tab.automaton_changed.connect(window.analysis_tab.set_current_automaton)
-    window.editor_tab.automaton_changed.connect(window.word_processing_tab.set_current_automaton)
-    
-    # Connect the analysis tab's automaton_created signal to refresh automaton list
-    window.analysis_tab.automaton_created.connect(window.automaton_tab.refresh_automaton_list)
-    
     # Run application event loop
     sys.exit(app.exec())
 